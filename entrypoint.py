@@ -10,11 +10,11 @@ Architecture
 ┌─────────────────────────────────────────────────────────┐
 │  Python process (PID 1 in container)                    │
 │                                                         │
-│  Main thread ──── scheduler.main() (BlockingScheduler)  │
+│  Main thread ──── scheduler.main() (BackgroundScheduler)│
 │       │            Fires every Monday 06:00 London      │
 │       │            Registers SIGTERM → graceful exit    │
 │       │                                                 │
-│  Daemon thread ── HTTPServer on 0.0.0.0:$PORT           │
+│  Daemon thread ── asyncio server on 0.0.0.0:$PORT       │
 │                   GET /health → 200 {"status":"healthy"} │
 │                   Dies automatically when main exits    │
 └─────────────────────────────────────────────────────────┘
@@ -25,16 +25,17 @@ Design decisions
 - scheduler.main() runs on the *main* thread because Python only allows
   signal.signal() calls from the main thread — the SIGTERM handler that
   gracefully shuts down APScheduler must live there.
-- No third-party HTTP framework is needed; http.server from the standard
-  library is sufficient for a single-route health check.
+- No third-party HTTP framework is needed; a socket-level asyncio server
+  from the standard library answers the single health route with prebuilt
+  response bytes, bypassing http.server's per-request handler and parser.
 - $PORT is honoured so App Service can dynamically assign ports.
 """
 
+import asyncio
 import logging
 import os
 import sys
 import threading
-from http.server import BaseHTTPRequestHandler, HTTPServer
 
 # ---------------------------------------------------------------------------
 # Logging — minimal bootstrap before scheduler.main() sets up the full logger
@@ -48,41 +49,128 @@ logging.basicConfig(
 logger = logging.getLogger("entrypoint")
 
 # ---------------------------------------------------------------------------
-# Health-check HTTP handler
+# Health-check server
 # ---------------------------------------------------------------------------
-_HEALTH_PATHS = frozenset(("/", "/health", "/healthz", "/ping"))
+_HEALTH_PATHS = frozenset((b"/", b"/health", b"/healthz", b"/ping"))
 _HEALTH_BODY = b'{"status":"healthy","service":"board-report-generator"}'
 
+# Upper bound on the buffered request head from a probe.
+_MAX_REQUEST_HEAD = 8192
+# Idle keep-alive connections are dropped after this many seconds.
+_KEEPALIVE_TIMEOUT = 30
 
-class _HealthHandler(BaseHTTPRequestHandler):
-    """Minimal HTTP handler — returns 200 OK on health-check paths."""
 
-    def do_GET(self) -> None:  # noqa: N802
-        if self.path in _HEALTH_PATHS:
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(_HEALTH_BODY)))
-            self.end_headers()
-            self.wfile.write(_HEALTH_BODY)
-        else:
-            self.send_response(404)
-            self.send_header("Content-Length", "0")
-            self.end_headers()
+def _build_response(status: bytes, body: bytes, keep_alive: bool) -> bytes:
+    """Assemble a complete HTTP/1.1 response (status line + headers + body)."""
+    lines = [b"HTTP/1.1 " + status, b"Content-Length: %d" % len(body)]
+    if body:
+        lines.append(b"Content-Type: application/json")
+    lines.append(b"Connection: keep-alive" if keep_alive else b"Connection: close")
+    return b"\r\n".join(lines) + b"\r\n\r\n" + body
 
-    def log_message(self, fmt: str, *args: object) -> None:  # noqa: D102
-        # Suppress noisy HTTP access logs; APScheduler has its own structured logging.
-        pass
+
+# Full responses are built once at import so every probe is answered with a
+# single write and no per-request formatting.
+_HEALTH_RESPONSE = _build_response(b"200 OK", _HEALTH_BODY, keep_alive=False)
+_NOT_FOUND_RESPONSE = _build_response(b"404 Not Found", b"", keep_alive=False)
+_HEALTH_RESPONSE_KEEPALIVE = _build_response(b"200 OK", _HEALTH_BODY, keep_alive=True)
+_NOT_FOUND_RESPONSE_KEEPALIVE = _build_response(b"404 Not Found", b"", keep_alive=True)
+
+
+def _route(request_line: bytes, keep_alive: bool = False) -> bytes:
+    """Return the prebuilt response for a raw HTTP request line.
+
+    Args:
+        request_line: First line of the request, e.g. b"GET /health HTTP/1.1".
+        keep_alive: Whether the connection stays open after this response.
+
+    Returns:
+        The health response for GET on a health path, otherwise a 404.
+    """
+    parts = request_line.rstrip().split(b" ", 2)
+    if len(parts) >= 2 and parts[0] == b"GET" and parts[1] in _HEALTH_PATHS:
+        return _HEALTH_RESPONSE_KEEPALIVE if keep_alive else _HEALTH_RESPONSE
+    return _NOT_FOUND_RESPONSE_KEEPALIVE if keep_alive else _NOT_FOUND_RESPONSE
+
+
+class _HealthProtocol(asyncio.Protocol):
+    """Bare asyncio protocol answering health probes straight off the transport.
+
+    Works on the raw data callbacks, so a connection costs one small object —
+    no StreamReader/StreamWriter pair and no Task per connection.
+
+    HTTP/1.1 clients get a persistent connection, so a load balancer probing
+    repeatedly reuses one TCP connection; idle connections are closed after
+    _KEEPALIVE_TIMEOUT. Routing happens on the request line alone, as soon as
+    it arrives; the header block is only skipped afterwards, up to the blank
+    line that ends the request. Peers are never reverse-resolved, and asyncio
+    sets TCP_NODELAY on accepted sockets.
+    """
+
+    __slots__ = ("_transport", "_buffer", "_answered", "_keep_alive", "_idle")
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:  # noqa: D102
+        self._transport = transport
+        self._buffer = b""
+        self._answered = False
+        self._keep_alive = False
+        self._idle = asyncio.get_running_loop().call_later(_KEEPALIVE_TIMEOUT, transport.close)
+
+    def data_received(self, data: bytes) -> None:  # noqa: D102
+        self._buffer += data
+        while True:
+            buf = self._buffer
+            line_end = buf.find(b"\r\n")
+            if line_end < 0:
+                break
+            if not self._answered:
+                request_line = buf[:line_end]
+                self._keep_alive = request_line.endswith(b"HTTP/1.1")
+                self._transport.write(_route(request_line, self._keep_alive))
+                self._answered = True
+            head_end = buf.find(b"\r\n\r\n", line_end)
+            if head_end < 0:
+                break
+            self._buffer = buf[head_end + 4:]
+            self._answered = False
+            if not self._keep_alive:
+                self._transport.close()
+                return
+            self._idle.cancel()
+            self._idle = asyncio.get_running_loop().call_later(
+                _KEEPALIVE_TIMEOUT, self._transport.close
+            )
+        if len(self._buffer) > _MAX_REQUEST_HEAD:
+            self._transport.close()  # oversized request head — not a probe
+
+    def connection_lost(self, exc: Exception | None) -> None:  # noqa: D102
+        self._idle.cancel()
+
+
+async def _serve_health(port: int) -> None:
+    """Accept health-probe connections on 0.0.0.0:port until the loop stops."""
+    server = await asyncio.get_running_loop().create_server(_HealthProtocol, "0.0.0.0", port)
+    logger.info("Health server listening on 0.0.0.0:%d  [GET /health → 200 OK]", port)
+    async with server:
+        await server.serve_forever()
 
 
 def _start_health_server(port: int) -> None:
     """Start the HTTP health-check server (runs forever in a daemon thread).
 
+    The thread owns its own asyncio event loop, so a single accept loop
+    handles probe bursts without a thread or handler object per request.
+    Connections are served by _HealthProtocol directly on the transport.
+    A bind failure (e.g. port already in use) is logged as critical rather
+    than dying silently with the thread.
+
     Args:
         port: TCP port to listen on (usually $PORT from App Service).
     """
-    server = HTTPServer(("0.0.0.0", port), _HealthHandler)
-    logger.info("Health server listening on 0.0.0.0:%d  [GET /health → 200 OK]", port)
-    server.serve_forever()
+    try:
+        asyncio.run(_serve_health(port))
+    except OSError as exc:
+        logger.critical("Health server could not listen on 0.0.0.0:%d: %s", port, exc)
 
 
 # ---------------------------------------------------------------------------
@@ -94,10 +182,11 @@ def main() -> None:
 
     Execution order:
     1. Resolve $PORT (App Service sets this; default 8000).
-    2. Start _HealthHandler in a daemon thread (returns immediately).
+    2. Start the asyncio health server in a daemon thread (returns immediately).
     3. Import scheduler and call scheduler.main() on the main thread.
        - scheduler.main() registers SIGTERM → graceful APScheduler shutdown.
-       - scheduler.main() blocks inside BlockingScheduler.start().
+       - scheduler.main() blocks on a shutdown Event while the
+         BackgroundScheduler worker thread fires jobs.
     4. On SIGTERM (container stop / App Service restart):
        - Scheduler shuts down cleanly (wait=False).
        - sys.exit(0) terminates the main thread.
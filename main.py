@@ -19,17 +19,51 @@ Outputs (data/output/):
 import argparse
 import logging
 import logging.handlers
+import multiprocessing
 import os
 import sys
+import threading
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
-import yaml
+from src.config import load_config
+
+
+_LOG_FORMATTER = logging.Formatter(
+    "%(asctime)s | %(levelname)-8s | %(name)-35s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
+_BANNER = "=" * 65
+
+
+@dataclass(frozen=True)
+class PipelineArgs:
+    """Stage selection for run_pipeline — the programmatic twin of the CLI flags."""
+    config: str = "config.yaml"
+    log_level: str = "INFO"
+    full_run: bool = False
+    generate_data: bool = False
+    report: bool = False
+    excel: bool = False
+    dashboard: bool = False
+    distribute: bool = False
+
+
+def _log_stage(logger: logging.Logger, title: str) -> None:
+    """Log a stage banner (rule / title / rule) as a single record."""
+    logger.info("%s\n%s\n%s", _BANNER, title, _BANNER)
 
 
 def _configure_logging(log_dir: str = "logs", level: str = "INFO") -> None:
     """Configure rotating file handler + stream handler.
 
+    Safe to call more than once per process: if a rotating file handler is
+    already attached to the root logger only the level is updated, and an
+    existing console handler is reused rather than duplicated.
+
     Args:
         log_dir: Directory for log files.
         level: Log level string.
@@ -37,29 +71,31 @@ def _configure_logging(log_dir: str = "logs", level: str = "INFO") -> None:
     effective_level = os.environ.get("LOG_LEVEL", level).upper()
     numeric = getattr(logging, effective_level, logging.INFO)
 
+    root = logging.getLogger()
+    root.setLevel(numeric)
+    if any(isinstance(h, logging.handlers.RotatingFileHandler) for h in root.handlers):
+        return
+
     Path(log_dir).mkdir(parents=True, exist_ok=True)
     log_file = Path(log_dir) / f"pipeline_{datetime.today().strftime('%Y%m%d')}.log"
 
-    fmt = logging.Formatter(
-        "%(asctime)s | %(levelname)-8s | %(name)-35s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
     fh = logging.handlers.RotatingFileHandler(
         log_file, maxBytes=10 * 1024 * 1024, backupCount=7, encoding="utf-8"
     )
-    fh.setFormatter(fmt)
-    sh = logging.StreamHandler(sys.stdout)
-    sh.setFormatter(fmt)
-
-    root = logging.getLogger()
-    root.setLevel(numeric)
+    fh.setFormatter(_LOG_FORMATTER)
     root.addHandler(fh)
-    root.addHandler(sh)
+
+    sh = next((h for h in root.handlers if type(h) is logging.StreamHandler), None)
+    if sh is None:
+        sh = logging.StreamHandler(sys.stdout)
+        root.addHandler(sh)
+    sh.setFormatter(_LOG_FORMATTER)
+
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("matplotlib").setLevel(logging.WARNING)
 
 
-def _parse_args() -> argparse.Namespace:
+def _parse_args() -> tuple[argparse.Namespace, argparse.ArgumentParser]:
     parser = argparse.ArgumentParser(
         prog="board-report-generator",
         description="Automated Board Report Generator — PDF + Excel + Dashboard pipeline.",
@@ -91,27 +127,79 @@ Examples:
                         help="Distribute via email and Slack")
     stages.add_argument("--full-run", action="store_true",
                         help="Run all stages: generate -> report -> excel -> dashboard -> distribute")
-    return parser.parse_args()
+    return parser.parse_args(), parser
+
+
+def _run_output_stages(jobs: list[tuple], logger: logging.Logger) -> dict[str, Path] | None:
+    """Run the independent output stages (PDF, Excel, dashboard).
+
+    The stages only read the shared metrics/narrative packages and each leans
+    on a different CPU-bound library (ReportLab + matplotlib, openpyxl,
+    Plotly), so when more than one is requested they run in forked worker
+    processes instead of taking turns on the GIL.
+
+    Forking is only safe while this is the sole thread: a lock held by any
+    other thread at fork time is inherited locked by the child. Under the
+    scheduler, run_pipeline executes on an APScheduler worker thread next to
+    entrypoint.py's health-server thread, so the stages run one after another
+    there, as they do on platforms without ``fork``. Either way every stage
+    runs and all failures are reported.
+
+    Args:
+        jobs: ``(key, banner, label, function, args)`` tuples.
+        logger: Configured root logger.
+
+    Returns:
+        Dict of key → output path, or None if any stage failed.
+    """
+    for _, banner, _, _, _ in jobs:
+        _log_stage(logger, banner)
+
+    outputs: dict[str, Path] = {}
+    failed = False
+
+    if (
+        len(jobs) > 1
+        and threading.active_count() == 1
+        and "fork" in multiprocessing.get_all_start_methods()
+    ):
+        with multiprocessing.get_context("fork").Pool(len(jobs)) as pool:
+            pending = [
+                (key, label, pool.apply_async(fn, fn_args))
+                for key, _, label, fn, fn_args in jobs
+            ]
+            for key, label, result in pending:
+                try:
+                    outputs[key] = result.get()
+                    logger.info("%s generated: %s", label, outputs[key])
+                except Exception as exc:
+                    logger.error("%s generation failed: %s", label, exc, exc_info=True)
+                    failed = True
+    else:
+        for key, _, label, fn, fn_args in jobs:
+            try:
+                outputs[key] = fn(*fn_args)
+                logger.info("%s generated: %s", label, outputs[key])
+            except Exception as exc:
+                logger.error("%s generation failed: %s", label, exc, exc_info=True)
+                failed = True
+
+    return None if failed else outputs
 
 
-def run_pipeline(args: argparse.Namespace, logger: logging.Logger) -> int:
+def run_pipeline(args: argparse.Namespace | PipelineArgs, logger: logging.Logger) -> int:
     """Execute the requested pipeline stages.
 
     Args:
-        args: Parsed CLI arguments.
+        args: Parsed CLI arguments, or a PipelineArgs for programmatic callers.
         logger: Configured root logger.
 
     Returns:
         0 on success, 1 on error.
     """
-    from src.data_simulator import generate_all_datasets
-    from src.metrics import compute_metrics
-    from src.narrative import generate_narrative
-    from src.pdf_builder import generate_pdf
-    from src.excel_pack import generate_excel_pack
-    from src.dashboard import generate_dashboard
-    from src.distributor import send_email, send_slack_summary
-
+    # Stage modules are imported inside their own branch so partial runs only
+    # pay for the libraries they use (e.g. --dashboard never loads matplotlib
+    # or ReportLab).
     config_path = args.config
     do_all = args.full_run
 
@@ -124,9 +212,8 @@ def run_pipeline(args: argparse.Namespace, logger: logging.Logger) -> int:
     # Stage 1: Data generation
     # -------------------------------------------------------------------------
     if do_all or args.generate_data:
-        logger.info("=" * 65)
-        logger.info("STAGE 1: Data Generation")
-        logger.info("=" * 65)
+        _log_stage(logger, "STAGE 1: Data Generation")
+        from src.data_simulator import generate_all_datasets
         try:
             datasets = generate_all_datasets(config_path)
             total_rows = sum(len(df) for df in datasets.values())
@@ -139,9 +226,8 @@ def run_pipeline(args: argparse.Namespace, logger: logging.Logger) -> int:
     # Stage 2: Metrics computation (always needed for outputs)
     # -------------------------------------------------------------------------
     if do_all or args.report or args.excel or args.dashboard or args.distribute:
-        logger.info("=" * 65)
-        logger.info("STAGE 2: KPI Computation")
-        logger.info("=" * 65)
+        _log_stage(logger, "STAGE 2: KPI Computation")
+        from src.metrics import compute_metrics
         try:
             pkg = compute_metrics(config_path)
             logger.info(
@@ -161,9 +247,8 @@ def run_pipeline(args: argparse.Namespace, logger: logging.Logger) -> int:
     # Stage 3: Narrative generation (needed for PDF)
     # -------------------------------------------------------------------------
     if pkg and (do_all or args.report):
-        logger.info("=" * 65)
-        logger.info("STAGE 3: Narrative Generation")
-        logger.info("=" * 65)
+        _log_stage(logger, "STAGE 3: Narrative Generation")
+        from src.narrative import generate_narrative
         try:
             narrative = generate_narrative(pkg, config_path)
             logger.info("Narrative generated -- %d chars in executive summary",
@@ -173,58 +258,40 @@ def run_pipeline(args: argparse.Namespace, logger: logging.Logger) -> int:
             return 1
 
     # -------------------------------------------------------------------------
-    # Stage 4: PDF report
+    # Stages 4-6: PDF report, Excel data pack, interactive dashboard
     # -------------------------------------------------------------------------
+    # Each job: (key, stage banner, label, function, positional args)
+    output_jobs = []
     if do_all or args.report:
         if pkg and narrative:
-            logger.info("=" * 65)
-            logger.info("STAGE 4: PDF Report")
-            logger.info("=" * 65)
-            try:
-                pdf_path = generate_pdf(pkg, narrative, config_path)
-                logger.info("PDF report generated: %s", pdf_path)
-            except Exception as exc:
-                logger.error("PDF generation failed: %s", exc, exc_info=True)
-                return 1
-
-    # -------------------------------------------------------------------------
-    # Stage 5: Excel data pack
-    # -------------------------------------------------------------------------
+            from src.pdf_builder import generate_pdf
+            output_jobs.append(("pdf", "STAGE 4: PDF Report", "PDF report",
+                                generate_pdf, (pkg, narrative, config_path)))
     if do_all or args.excel:
         if pkg:
-            logger.info("=" * 65)
-            logger.info("STAGE 5: Excel Data Pack")
-            logger.info("=" * 65)
-            try:
-                excel_path = generate_excel_pack(pkg, config_path)
-                logger.info("Excel data pack generated: %s", excel_path)
-            except Exception as exc:
-                logger.error("Excel generation failed: %s", exc, exc_info=True)
-                return 1
-
-    # -------------------------------------------------------------------------
-    # Stage 6: Interactive dashboard
-    # -------------------------------------------------------------------------
+            from src.excel_pack import generate_excel_pack
+            output_jobs.append(("excel", "STAGE 5: Excel Data Pack", "Excel data pack",
+                                generate_excel_pack, (pkg, config_path)))
     if do_all or args.dashboard:
         if pkg:
-            logger.info("=" * 65)
-            logger.info("STAGE 6: Interactive Dashboard")
-            logger.info("=" * 65)
-            try:
-                dash_path = generate_dashboard(pkg, config_path)
-                logger.info("Dashboard generated: %s", dash_path)
-            except Exception as exc:
-                logger.error("Dashboard generation failed: %s", exc, exc_info=True)
-                return 1
+            from src.dashboard import generate_dashboard
+            output_jobs.append(("dashboard", "STAGE 6: Interactive Dashboard", "Dashboard",
+                                generate_dashboard, (pkg, config_path)))
+
+    if output_jobs:
+        outputs = _run_output_stages(output_jobs, logger)
+        if outputs is None:
+            return 1
+        pdf_path = outputs.get("pdf")
+        excel_path = outputs.get("excel")
 
     # -------------------------------------------------------------------------
     # Stage 7: Distribution
     # -------------------------------------------------------------------------
     if do_all or args.distribute:
         if pkg:
-            logger.info("=" * 65)
-            logger.info("STAGE 7: Distribution")
-            logger.info("=" * 65)
+            _log_stage(logger, "STAGE 7: Distribution")
+            from src.distributor import send_email, send_slack_summary
             try:
                 send_email(pkg, pdf_path, excel_path, config_path)
                 send_slack_summary(pkg, config_path)
@@ -234,8 +301,7 @@ def run_pipeline(args: argparse.Namespace, logger: logging.Logger) -> int:
                 # Non-fatal
 
     # Final summary
-    logger.info("=" * 65)
-    logger.info("PIPELINE COMPLETE")
+    logger.info("%s\nPIPELINE COMPLETE", _BANNER)
     if pkg:
         rag = pkg.rag
         logger.info(
@@ -252,17 +318,16 @@ def run_pipeline(args: argparse.Namespace, logger: logging.Logger) -> int:
             pkg.customers.churn_rate_actual * 100,
             rag.churn_rate.status,
         )
-    logger.info("=" * 65)
+    logger.info(_BANNER)
     return 0
 
 
 def main() -> None:
     """Parse args, configure logging, and run pipeline."""
-    args = _parse_args()
+    args, parser = _parse_args()
 
     try:
-        with open(args.config, "r") as fh:
-            cfg = yaml.safe_load(fh)
+        cfg = load_config(args.config)
         log_dir = cfg.get("paths", {}).get("log_dir", "logs")
     except Exception:
         log_dir = "logs"
@@ -275,8 +340,7 @@ def main() -> None:
         args.excel, args.dashboard, args.distribute,
     ])
     if no_stage:
-        import subprocess
-        subprocess.run([sys.executable, __file__, "--help"])
+        parser.print_help()
         sys.exit(0)
 
     logger.info(
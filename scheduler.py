@@ -5,7 +5,7 @@ Runs the full pipeline every Monday at 06:00 London time so the board
 pack arrives in inboxes before the working day begins.
 
 Usage:
-    python scheduler.py              # Start daemon (blocking)
+    python scheduler.py              # Start daemon (blocks until SIGINT/SIGTERM)
     python scheduler.py --run-now   # One immediate run, then exit
     python scheduler.py --config custom.yaml
 """
@@ -15,77 +15,113 @@ import logging
 import logging.handlers
 import signal
 import sys
+import threading
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
 
-import yaml
-from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
+from src.config import load_config
+
 
 logger = logging.getLogger(__name__)
 
 
+_LOG_FORMATTER = logging.Formatter(
+    "%(asctime)s | %(levelname)-8s | %(name)-35s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
 def _configure_logging(log_dir: str) -> None:
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    # Already configured in this process — adding handlers again would
+    # duplicate every log line.
+    if any(isinstance(h, logging.handlers.RotatingFileHandler) for h in root.handlers):
+        return
+
     Path(log_dir).mkdir(parents=True, exist_ok=True)
-    fmt = logging.Formatter(
-        "%(asctime)s | %(levelname)-8s | %(name)-35s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
     fh = logging.handlers.RotatingFileHandler(
         Path(log_dir) / "scheduler.log",
         maxBytes=5 * 1024 * 1024, backupCount=14, encoding="utf-8",
     )
-    fh.setFormatter(fmt)
-    sh = logging.StreamHandler(sys.stdout)
-    sh.setFormatter(fmt)
-    root = logging.getLogger()
-    root.setLevel(logging.INFO)
+    fh.setFormatter(_LOG_FORMATTER)
     root.addHandler(fh)
-    root.addHandler(sh)
+
+    # Reuse the console handler entrypoint.py installs via basicConfig.
+    sh = next((h for h in root.handlers if type(h) is logging.StreamHandler), None)
+    if sh is None:
+        sh = logging.StreamHandler(sys.stdout)
+        root.addHandler(sh)
+    sh.setFormatter(_LOG_FORMATTER)
+
     logging.getLogger("apscheduler").setLevel(logging.WARNING)
     logging.getLogger("matplotlib").setLevel(logging.WARNING)
 
 
-def _run_full_pipeline(config_path: str, max_retries: int, retry_delay: int) -> None:
-    """Execute the board report pipeline with retry logic.
+def _run_full_pipeline(
+    config_path: str,
+    max_retries: int,
+    retry_delay: int,
+    attempt: int = 1,
+    scheduler: BackgroundScheduler | None = None,
+) -> None:
+    """Execute one attempt of the board report pipeline.
+
+    On failure the next attempt is handed back to the scheduler as a one-off
+    job with exponential backoff, so the worker thread is released instead
+    of sleeping through the delay. Without a scheduler (``--run-now``) the
+    retry waits in-process.
 
     Args:
         config_path: Path to configuration YAML.
         max_retries: Maximum retry attempts.
-        retry_delay: Seconds between retries.
+        retry_delay: Seconds before the first retry (doubles per attempt).
+        attempt: 1-based number of this attempt.
+        scheduler: Running scheduler used to enqueue retries, if any.
     """
-    import time
-    import argparse as _ap
-    from main import run_pipeline, _configure_logging as _cfg_log
-
-    logger.info("Starting scheduled board report pipeline run")
-
-    args = _ap.Namespace(
-        config=config_path,
-        log_level="INFO",
-        full_run=True,
-        generate_data=False,
-        report=False,
-        excel=False,
-        dashboard=False,
-        distribute=False,
-    )
+    from main import PipelineArgs, run_pipeline
 
-    for attempt in range(1, max_retries + 1):
-        try:
-            exit_code = run_pipeline(args, logger)
-            if exit_code == 0:
-                logger.info("Scheduled run succeeded (attempt %d)", attempt)
-                return
-            logger.error("Pipeline returned non-zero exit code (attempt %d)", attempt)
-        except Exception as exc:
-            logger.error("Pipeline exception (attempt %d): %s", attempt, exc, exc_info=True)
+    logger.info("Starting scheduled board report pipeline run (attempt %d)", attempt)
 
-        if attempt < max_retries:
-            logger.info("Retrying in %ds...", retry_delay)
-            time.sleep(retry_delay)
+    args = PipelineArgs(config=config_path, full_run=True)
 
-    logger.error("Pipeline failed after %d attempts", max_retries)
+    try:
+        exit_code = run_pipeline(args, logger)
+        if exit_code == 0:
+            logger.info("Scheduled run succeeded (attempt %d)", attempt)
+            return
+        logger.error("Pipeline returned non-zero exit code (attempt %d)", attempt)
+    except Exception as exc:
+        logger.error("Pipeline exception (attempt %d): %s", attempt, exc, exc_info=True)
+
+    if attempt >= max_retries:
+        logger.error("Pipeline failed after %d attempts", max_retries)
+        return
+
+    delay = retry_delay * 2 ** (attempt - 1)
+    logger.info("Retrying in %ds...", delay)
+    if scheduler is None:
+        time.sleep(delay)
+        _run_full_pipeline(config_path, max_retries, retry_delay, attempt + 1)
+        return
+
+    scheduler.add_job(
+        _run_full_pipeline,
+        trigger="date",
+        run_date=datetime.now().astimezone() + timedelta(seconds=delay),
+        kwargs={"config_path": config_path, "max_retries": max_retries,
+                "retry_delay": retry_delay, "attempt": attempt + 1,
+                "scheduler": scheduler},
+        id="weekly_board_report_retry",
+        name="Weekly Board Report Generation (retry)",
+        replace_existing=True,
+        misfire_grace_time=600,
+    )
 
 
 def _parse_args() -> argparse.Namespace:
@@ -102,8 +138,7 @@ def _parse_args() -> argparse.Namespace:
 def main() -> None:
     args = _parse_args()
     try:
-        with open(args.config, "r") as fh:
-            cfg = yaml.safe_load(fh)
+        cfg = load_config(args.config)
     except FileNotFoundError:
         print(f"ERROR: Config not found: {args.config}", file=sys.stderr)
         sys.exit(1)
@@ -126,7 +161,13 @@ def main() -> None:
         logger.info("Immediate run complete")
         return
 
-    scheduler = BlockingScheduler(timezone=timezone)
+    # One persistent worker is enough for a single weekly job; the main
+    # thread just parks on an Event until a shutdown signal arrives.
+    scheduler = BackgroundScheduler(
+        timezone=timezone,
+        executors={"default": ThreadPoolExecutor(max_workers=1)},
+        job_defaults={"coalesce": True, "max_instances": 1},
+    )
     scheduler.add_job(
         _run_full_pipeline,
         trigger=CronTrigger(
@@ -134,28 +175,33 @@ def main() -> None:
             hour=run_hour,
             minute=run_minute,
             timezone=timezone,
+            jitter=60,
         ),
         kwargs={"config_path": args.config, "max_retries": max_retries,
-                "retry_delay": retry_delay},
+                "retry_delay": retry_delay, "scheduler": scheduler},
         id="weekly_board_report",
         name="Weekly Board Report Generation",
         replace_existing=True,
         misfire_grace_time=600,
     )
 
+    stop = threading.Event()
+
     def _shutdown(sig, frame):
         logger.info("Shutdown signal — stopping scheduler")
-        scheduler.shutdown(wait=False)
-        sys.exit(0)
+        stop.set()
 
     signal.signal(signal.SIGINT, _shutdown)
     signal.signal(signal.SIGTERM, _shutdown)
 
+    scheduler.start()
     logger.info(
         "Scheduler started -- weekly run: %s at %s (%s)",
         run_day.upper(), run_time, timezone,
     )
-    scheduler.start()
+    stop.wait()
+    scheduler.shutdown(wait=False)
+    sys.exit(0)
 
 
 if __name__ == "__main__":
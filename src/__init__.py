@@ -2,6 +2,7 @@
 board-report-generator — Source package.
 
 Modules:
+    config          — Cached config.yaml loader (libyaml C loader when available)
     data_simulator  — 24-month synthetic financial dataset (P&L, pipeline, headcount, customers)
     metrics         — KPI calculation engine with RAG status
     narrative       — Template-based board commentary generator
@@ -0,0 +1,61 @@
+"""
+config.py — Cached YAML configuration loader.
+
+Every entry point and pipeline stage reads config.yaml, and the narrative
+engine reads templates/narrative.yaml. Parsing goes through libyaml's C
+loader (CSafeLoader) when PyYAML was built with it, falling back to the
+pure-Python SafeLoader otherwise. The parsed result is memoised on
+(path, mtime) so repeated loads within one process are free while edits to
+the file on disk are still picked up.
+
+Returned objects are shared between callers — treat them as read-only.
+"""
+
+import functools
+import os
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_yaml(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML file (cache key includes mtime so edits invalidate)."""
+    with open(path, "r") as fh:
+        return yaml.load(fh, Loader=_Loader)
+
+
+def load_yaml(path: str) -> Any:
+    """Load and cache any YAML file.
+
+    Args:
+        path: Path to the YAML file.
+
+    Returns:
+        Parsed document (shared — do not mutate).
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    path = os.path.abspath(path)
+    return _parse_yaml(path, os.stat(path).st_mtime_ns)
+
+
+def load_config(config_path: str = "config.yaml") -> dict[str, Any]:
+    """Load and cache the pipeline configuration.
+
+    Args:
+        config_path: Path to configuration YAML.
+
+    Returns:
+        Parsed configuration dict (shared — do not mutate).
+
+    Raises:
+        FileNotFoundError: If the config file does not exist.
+    """
+    return load_yaml(config_path)
@@ -11,23 +11,88 @@ Sections:
     Row 2:             — Pipeline by Stage (waterfall) | ARR Trend (area)
     Row 3:             — Headcount by Department (grouped bar) | Churn + NPS (dual)
 
-All charts use the brand colour palette from config.yaml.
+All charts use the brand colour palette from config.yaml. Time-series and
+marker traces use WebGL (Scattergl) so they stay responsive as
+months_history grows.
 """
 
+import functools
+import hashlib
+import importlib.util
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.io.json import to_json_plotly
+from plotly.offline import get_plotlyjs_version
 from plotly.subplots import make_subplots
-import yaml
 
+from src.config import load_config
 from src.metrics import MetricsPackage
 
+# Chart JSON is encoded with orjson (native NumPy arrays, 3-10x faster than
+# the stdlib encoder) when it is installed; plotly falls back to json otherwise.
+if importlib.util.find_spec("orjson") is not None:
+    pio.json.config.default_engine = "orjson"
+
 logger = logging.getLogger(__name__)
 
-TEMPLATE = "plotly_white"
+# plotly_white with the brand palette, title font and page font baked in;
+# registered in pio.templates by _brand_plot_script() before charts are built.
+TEMPLATE = "board_brand"
+
+# Time series longer than this are LTTB-downsampled before being embedded.
+_MAX_TRACE_POINTS = 1000
+
+_PLOT_CONFIG = '{"responsive": true}'
+# plotly.js matching the installed plotly — ndarray traces are emitted as
+# base64 typed arrays, which the frozen "plotly-latest" (1.x) build can't read.
+_PLOTLY_CDN = f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+
+# ---------------------------------------------------------------------------
+# Static page shell — built once at import. Only the title period and the
+# footer's company/timestamp vary per build; the CSS is emitted verbatim.
+# ---------------------------------------------------------------------------
+_PAGE_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width,initial-scale=1.0">
+    <title>Board Report — {period}</title>
+    <script src="%s"></script>
+""" % _PLOTLY_CDN
+_PAGE_STYLE = """    <style>
+        *{box-sizing:border-box;margin:0;padding:0;}
+        body{font-family:'Segoe UI',Arial,sans-serif;background:#F4F7FA;}
+        .grid{display:grid;grid-template-columns:1fr 1fr;gap:14px;padding:18px;}
+        .card{background:#fff;border-radius:8px;padding:6px;
+               box-shadow:0 2px 8px rgba(0,0,0,.07);}
+        .full{grid-column:1/-1;}
+        .footer{text-align:center;padding:14px;color:#888;font-size:11px;}
+        @media(max-width:880px){.grid{grid-template-columns:1fr;}.full{grid-column:1;}}
+    </style>
+</head>
+<body>
+    """
+_GRID_OPEN = '\n    <div class="grid">'
+_CARD_OPEN = '\n        <div class="card">'
+_CARD_CLOSE = "</div>"
+_PAGE_FOOTER = """
+    </div>
+    <div class="footer">
+        Automated Board Report Generator v1.0 &nbsp;|&nbsp; {company} &nbsp;|&nbsp;
+        {generated} &nbsp;|&nbsp; STRICTLY CONFIDENTIAL
+    </div>
+</body>
+</html>"""
+# Set to "1" to memoise rendered chart HTML on disk (paths.html_cache_dir).
+_HTML_CACHE_ENV = "BRG_HTML_CACHE"
 
 
 def _mpl(h: str) -> str:
@@ -35,39 +100,93 @@ def _mpl(h: str) -> str:
     return f"#{h.lstrip('#')}"
 
 
-def _chart_revenue_budget(pkg: MetricsPackage, brand: dict) -> go.Figure:
+def _resolve_palette(brand: dict) -> dict[str, str]:
+    """Resolve brand hex codes once into the colour strings the charts use.
+
+    Returns "#RRGGBB" for every brand key, plus rgba() fill variants of the
+    secondary colour at the alphas the area charts use.
+    """
+    palette = {key: _mpl(value) for key, value in brand.items()}
+    sec = brand["secondary"].lstrip("#")
+    r, g, b = (int(sec[i:i + 2], 16) for i in (0, 2, 4))
+    palette["secondary_rgba_08"] = f"rgba({r},{g},{b},0.08)"
+    palette["secondary_rgba_15"] = f"rgba({r},{g},{b},0.15)"
+    return palette
+
+
+def _lttb_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Pick `n_out` indices of `y` with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, per bucket, the point forming the
+    largest triangle with the previously kept point and the next bucket's
+    mean — preserving peaks and troughs that plain striding would drop.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.arange(n, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            nxt = slice(edges[i + 1], edges[i + 2])
+            avg_x, avg_y = x[nxt].mean(), y[nxt].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(area.argmax())
+        out[i + 1] = a
+    return out
+
+
+def _downsample(x: Any, y: Any) -> tuple[Any, Any]:
+    """Return (x, y) unchanged, or LTTB-downsampled beyond _MAX_TRACE_POINTS."""
+    if len(y) <= _MAX_TRACE_POINTS:
+        return x, y
+    idx = _lttb_indices(np.asarray(y, dtype=np.float64), _MAX_TRACE_POINTS)
+    return np.asarray(x)[idx], np.asarray(y)[idx]
+
+
+def _chart_revenue_budget(pkg: MetricsPackage, palette: dict[str, str]) -> go.Figure:
     """Grouped bar: monthly revenue actuals vs budget with EBITDA line."""
     fin = pkg.financial
     periods = [p[-5:] for p in fin.monthly_periods]
 
-    rev_budget = [
-        fin.revenue_budget * (a / fin.revenue_actual) if fin.revenue_actual else 0
-        for a in fin.monthly_revenue
-    ]
+    # Series stay as float64 ndarrays end to end — one vectorised divide each,
+    # and plotly/orjson serialise them without a per-element Python pass.
+    rev_actual = np.asarray(fin.monthly_revenue, dtype=np.float64)
+    scale = fin.revenue_budget / fin.revenue_actual if fin.revenue_actual else 0.0
+    rev_budget = rev_actual * scale
+    ebitda = np.asarray(fin.monthly_ebitda, dtype=np.float64)
 
     fig = go.Figure()
     fig.add_trace(go.Bar(
-        x=periods, y=[v / 1e6 for v in fin.monthly_revenue],
-        name="Revenue (Actual)", marker_color=_mpl(brand["primary"]),
+        x=periods, y=rev_actual / 1e6,
+        name="Revenue (Actual)", marker_color=palette["primary"],
         opacity=0.9,
         hovertemplate="Period: %{x}<br>Revenue: £%{y:.2f}M<extra></extra>",
     ))
     fig.add_trace(go.Bar(
-        x=periods, y=[v / 1e6 for v in rev_budget],
-        name="Revenue (Budget)", marker_color=_mpl(brand["secondary"]),
+        x=periods, y=rev_budget / 1e6,
+        name="Revenue (Budget)", marker_color=palette["secondary"],
         opacity=0.5,
         hovertemplate="Period: %{x}<br>Budget: £%{y:.2f}M<extra></extra>",
     ))
     fig.add_trace(go.Scatter(
-        x=periods, y=[v / 1e6 for v in fin.monthly_ebitda],
+        x=periods, y=ebitda / 1e6,
         name="EBITDA", mode="lines+markers",
-        line=dict(color=_mpl(brand["accent"]), width=2),
+        line=dict(color=palette["accent"], width=2),
         marker=dict(size=5),
         hovertemplate="Period: %{x}<br>EBITDA: £%{y:.2f}M<extra></extra>",
         yaxis="y2",
     ))
     fig.update_layout(
-        title=dict(text="Revenue vs Budget — Monthly (£M)", font=dict(size=14, color=_mpl(brand["primary"]))),
+        title_text="Revenue vs Budget — Monthly (£M)",
         barmode="group",
         template=TEMPLATE,
         yaxis=dict(title="£M", tickformat="£.1f"),
@@ -80,37 +199,42 @@ def _chart_revenue_budget(pkg: MetricsPackage, brand: dict) -> go.Figure:
     return fig
 
 
-def _chart_ebitda_margin(pkg: MetricsPackage, brand: dict) -> go.Figure:
+def _chart_ebitda_margin(pkg: MetricsPackage, palette: dict[str, str]) -> go.Figure:
     """Line chart: EBITDA margin % and gross margin % trends."""
     fin = pkg.financial
     periods = [p[-5:] for p in fin.monthly_periods]
 
-    ebitda_margins = []
-    for rev, ebitda in zip(fin.monthly_revenue, fin.monthly_ebitda):
-        ebitda_margins.append(round(ebitda / rev * 100 if rev else 0, 2))
+    rev = np.asarray(fin.monthly_revenue, dtype=np.float64)
+    ebitda = np.asarray(fin.monthly_ebitda, dtype=np.float64)
+    ebitda_margins = np.round(
+        np.divide(ebitda, rev, out=np.zeros_like(rev), where=rev != 0) * 100, 2
+    )
+
+    gm_x, gm_y = _downsample(periods, fin.monthly_gross_margin)
+    em_x, em_y = _downsample(periods, ebitda_margins)
 
     fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=periods, y=fin.monthly_gross_margin,
+    fig.add_trace(go.Scattergl(
+        x=gm_x, y=gm_y,
         name="Gross Margin %", mode="lines+markers",
-        line=dict(color=_mpl(brand["secondary"]), width=2),
-        fill="tozeroy", fillcolor=f"rgba({int(brand['secondary'][0:2], 16)},{int(brand['secondary'][2:4], 16)},{int(brand['secondary'][4:6], 16)},0.08)",
+        line=dict(color=palette["secondary"], width=2),
+        fill="tozeroy", fillcolor=palette["secondary_rgba_08"],
         hovertemplate="Period: %{x}<br>Gross Margin: %{y:.1f}%<extra></extra>",
     ))
-    fig.add_trace(go.Scatter(
-        x=periods, y=ebitda_margins,
+    fig.add_trace(go.Scattergl(
+        x=em_x, y=em_y,
         name="EBITDA Margin %", mode="lines+markers",
-        line=dict(color=_mpl(brand["accent"]), width=2, dash="dot"),
+        line=dict(color=palette["accent"], width=2, dash="dot"),
         hovertemplate="Period: %{x}<br>EBITDA Margin: %{y:.1f}%<extra></extra>",
     ))
-    fig.add_hline(y=62, line_dash="dash", line_color=_mpl(brand["green"]),
+    fig.add_hline(y=62, line_dash="dash", line_color=palette["green"],
                   annotation_text="Gross Margin Green (62%)", annotation_position="top right",
                   line_width=1)
-    fig.add_hline(y=14, line_dash="dash", line_color=_mpl(brand["amber"]),
+    fig.add_hline(y=14, line_dash="dash", line_color=palette["amber"],
                   annotation_text="EBITDA Green (14%)", annotation_position="bottom right",
                   line_width=1)
     fig.update_layout(
-        title=dict(text="Margin Trends (%)", font=dict(size=14, color=_mpl(brand["primary"]))),
+        title_text="Margin Trends (%)",
         yaxis=dict(title="%", ticksuffix="%"),
         template=TEMPLATE,
         legend=dict(orientation="h", yanchor="bottom", y=1.02, x=0),
@@ -120,7 +244,7 @@ def _chart_ebitda_margin(pkg: MetricsPackage, brand: dict) -> go.Figure:
     return fig
 
 
-def _chart_pipeline_waterfall(pkg: MetricsPackage, brand: dict) -> go.Figure:
+def _chart_pipeline_waterfall(pkg: MetricsPackage, palette: dict[str, str]) -> go.Figure:
     """Waterfall chart: pipeline by stage."""
     comm = pkg.commercial
     stages = list(comm.pipeline_by_stage.keys())
@@ -128,10 +252,10 @@ def _chart_pipeline_waterfall(pkg: MetricsPackage, brand: dict) -> go.Figure:
     total = sum(values)
 
     stage_colours = [
-        _mpl(brand["primary"]),
-        _mpl(brand["secondary"]),
-        _mpl(brand["amber"]),
-        _mpl(brand["accent"]),
+        palette["primary"],
+        palette["secondary"],
+        palette["amber"],
+        palette["accent"],
     ]
 
     fig = go.Figure(go.Waterfall(
@@ -143,16 +267,16 @@ def _chart_pipeline_waterfall(pkg: MetricsPackage, brand: dict) -> go.Figure:
         text=[f"£{v:.1f}M" for v in values] + [f"£{total:.1f}M"],
         textposition="outside",
         connector=dict(line=dict(color="rgb(63,63,63)")),
-        increasing=dict(marker=dict(color=_mpl(brand["primary"]))),
-        totals=dict(marker=dict(color=_mpl(brand["secondary"]))),
+        increasing=dict(marker=dict(color=palette["primary"])),
+        totals=dict(marker=dict(color=palette["secondary"])),
         hovertemplate="Stage: %{x}<br>Value: £%{y:.2f}M<extra></extra>",
     ))
     fig.add_hline(
-        y=total, line_dash="dot", line_color=_mpl(brand["green"]),
+        y=total, line_dash="dot", line_color=palette["green"],
         annotation_text=f"Total: £{total:.1f}M | Coverage: {pkg.commercial.pipeline_coverage_ratio:.1f}x",
     )
     fig.update_layout(
-        title=dict(text="Sales Pipeline by Stage (£M)", font=dict(size=14, color=_mpl(brand["primary"]))),
+        title_text="Sales Pipeline by Stage (£M)",
         yaxis=dict(title="£M"),
         template=TEMPLATE,
         showlegend=False,
@@ -162,26 +286,28 @@ def _chart_pipeline_waterfall(pkg: MetricsPackage, brand: dict) -> go.Figure:
     return fig
 
 
-def _chart_arr_trend(pkg: MetricsPackage, brand: dict) -> go.Figure:
+def _chart_arr_trend(pkg: MetricsPackage, palette: dict[str, str]) -> go.Figure:
     """Area chart: ARR trend vs budget with new/churned ARR bars."""
     cust = pkg.customers
     periods = [p[-5:] for p in cust.arr_trend_periods]
 
+    arr_x, arr_y = _downsample(periods, np.asarray(cust.arr_trend, dtype=np.float64) / 1e6)
+
     fig = make_subplots(specs=[[{"secondary_y": True}]])
-    fig.add_trace(go.Scatter(
-        x=periods, y=[v / 1e6 for v in cust.arr_trend],
+    fig.add_trace(go.Scattergl(
+        x=arr_x, y=arr_y,
         name="ARR (Actual)", mode="lines", fill="tozeroy",
-        line=dict(color=_mpl(brand["secondary"]), width=2.5),
-        fillcolor=f"rgba({int(brand['secondary'][0:2],16)},{int(brand['secondary'][2:4],16)},{int(brand['secondary'][4:6],16)},0.15)",
+        line=dict(color=palette["secondary"], width=2.5),
+        fillcolor=palette["secondary_rgba_15"],
         hovertemplate="Period: %{x}<br>ARR: £%{y:.2f}M<extra></extra>",
     ), secondary_y=False)
     fig.add_hline(
         y=cust.arr_budget / 1e6, line_dash="dash",
-        line_color=_mpl(brand["accent"]),
+        line_color=palette["accent"],
         annotation_text=f"Budget: £{cust.arr_budget/1e6:.1f}M",
     )
     fig.update_layout(
-        title=dict(text="ARR Trend vs Budget (£M)", font=dict(size=14, color=_mpl(brand["primary"]))),
+        title_text="ARR Trend vs Budget (£M)",
         template=TEMPLATE,
         height=360,
         margin=dict(l=50, r=50, t=80, b=40),
@@ -191,7 +317,7 @@ def _chart_arr_trend(pkg: MetricsPackage, brand: dict) -> go.Figure:
     return fig
 
 
-def _chart_headcount(pkg: MetricsPackage, brand: dict) -> go.Figure:
+def _chart_headcount(pkg: MetricsPackage, palette: dict[str, str]) -> go.Figure:
     """Grouped bar: headcount actual vs budget by department."""
     hc = pkg.headcount
     depts = list(hc.by_department.keys())
@@ -201,17 +327,17 @@ def _chart_headcount(pkg: MetricsPackage, brand: dict) -> go.Figure:
 
     fig = go.Figure()
     fig.add_trace(go.Bar(
-        x=depts, y=actuals, name="Actual", marker_color=_mpl(brand["primary"]),
+        x=depts, y=actuals, name="Actual", marker_color=palette["primary"],
         text=actuals, textposition="outside",
         hovertemplate="Dept: %{x}<br>Actual HC: %{y}<extra></extra>",
     ))
     fig.add_trace(go.Bar(
-        x=depts, y=budgets, name="Budget", marker_color=_mpl(brand["secondary"]),
+        x=depts, y=budgets, name="Budget", marker_color=palette["secondary"],
         opacity=0.6,
         hovertemplate="Dept: %{x}<br>Budget HC: %{y}<extra></extra>",
     ))
     fig.update_layout(
-        title=dict(text="Headcount by Department — Actual vs Budget", font=dict(size=14, color=_mpl(brand["primary"]))),
+        title_text="Headcount by Department — Actual vs Budget",
         barmode="group",
         yaxis=dict(title="FTEs"),
         template=TEMPLATE,
@@ -222,38 +348,38 @@ def _chart_headcount(pkg: MetricsPackage, brand: dict) -> go.Figure:
     return fig
 
 
-def _chart_churn_nps(pkg: MetricsPackage, brand: dict) -> go.Figure:
+def _chart_churn_nps(pkg: MetricsPackage, palette: dict[str, str]) -> go.Figure:
     """Dual-axis: churn rate trend + NPS scatter."""
     cust = pkg.customers
 
     fig = make_subplots(specs=[[{"secondary_y": True}]])
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=[cust.period], y=[cust.churn_rate_actual * 100],
         name="Churn Rate %", mode="markers+lines",
-        line=dict(color=_mpl(brand["accent"]), width=2),
+        line=dict(color=palette["accent"], width=2),
         marker=dict(size=10),
         hovertemplate="Churn: %{y:.2f}%<extra></extra>",
     ), secondary_y=False)
     fig.add_hline(
         y=cust.churn_rate_budget * 100,
-        line_dash="dash", line_color=_mpl(brand["amber"]),
+        line_dash="dash", line_color=palette["amber"],
         annotation_text=f"Budget churn: {cust.churn_rate_budget*100:.2f}%",
         secondary_y=False,
     )
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=[cust.period], y=[cust.nps_actual],
         name="NPS", mode="markers",
-        marker=dict(size=18, color=_mpl(brand["primary"]), symbol="star"),
+        marker=dict(size=18, color=palette["primary"], symbol="star"),
         hovertemplate="NPS: %{y}<extra></extra>",
     ), secondary_y=True)
     fig.add_hline(
         y=cust.nps_budget, line_dash="dot",
-        line_color=_mpl(brand["green"]),
+        line_color=palette["green"],
         annotation_text=f"NPS Target: {cust.nps_budget}",
         secondary_y=True,
     )
     fig.update_layout(
-        title=dict(text="Churn Rate & NPS — Current Period", font=dict(size=14, color=_mpl(brand["primary"]))),
+        title_text="Churn Rate & NPS — Current Period",
         template=TEMPLATE,
         height=360,
         margin=dict(l=50, r=60, t=80, b=40),
@@ -264,14 +390,86 @@ def _chart_churn_nps(pkg: MetricsPackage, brand: dict) -> go.Figure:
     return fig
 
 
-def _build_kpi_header(pkg: MetricsPackage, brand: dict) -> str:
+def _render_div(name: str, fig: go.Figure, cache_dir: Path | None) -> str:
+    """Render a figure to an HTML <div> + Plotly.newPlot call.
+
+    The layout template is stripped from the figure: every chart uses
+    TEMPLATE, which _brand_plot_script() emits once per page as BRG_TPL
+    together with the shared BRG_CONFIG, instead of repeating it in each
+    chart's JSON. Results are memoised on disk when cache_dir is set, keyed
+    by a BLAKE2b hash of the chart name and its JSON spec.
+
+    Args:
+        name: Chart key, used for the element id.
+        fig: Figure to render.
+        cache_dir: Cache directory, or None to always render.
+
+    Returns:
+        The HTML fragment for the figure.
+    """
+    spec = fig.to_plotly_json()
+    layout = spec["layout"]
+    layout.pop("template", None)
+    data_json = to_json_plotly(spec["data"])
+    layout_json = to_json_plotly(layout)
+
+    cached = None
+    if cache_dir is not None:
+        key = hashlib.blake2b(
+            f"{name}\0{data_json}\0{layout_json}".encode(), digest_size=16
+        ).hexdigest()
+        cached = cache_dir / f"{key}.html"
+        if cached.exists():
+            logger.debug("Chart %s served from HTML cache (%s)", name, key)
+            return cached.read_text(encoding="utf-8")
+
+    div_id = f"chart-{name}"
+    height = f"{layout['height']}px" if "height" in layout else "100%"
+    html = (
+        f'<div id="{div_id}" class="plotly-graph-div" style="height:{height}; width:100%;"></div>'
+        f'<script>Plotly.newPlot("{div_id}", {data_json}, '
+        f"Object.assign({{template: BRG_TPL}}, {layout_json}), BRG_CONFIG);</script>"
+    )
+    if cached is not None:
+        cached.write_text(html, encoding="utf-8")
+    return html
+
+
+@functools.lru_cache(maxsize=1)
+def _brand_plot_script(palette_items: tuple[tuple[str, str], ...]) -> str:
+    """Register the brand template and return the page-level shared <script>.
+
+    The template is built once per palette (plotly_white + brand colorway,
+    fonts and title styling) so the chart builders only set their own
+    layout fields. The returned <script> defines it as BRG_TPL alongside the
+    shared BRG_CONFIG.
+
+    Args:
+        palette_items: Resolved palette as a hashable tuple of items.
+
+    Returns:
+        The <script> element to emit once per page.
+    """
+    palette = dict(palette_items)
+    template = go.layout.Template(pio.templates["plotly_white"])
+    template.layout.update(
+        colorway=[palette[k] for k in ("primary", "secondary", "accent", "amber", "green")],
+        font=dict(family="'Segoe UI', Arial, sans-serif"),
+        title=dict(font=dict(size=14, color=palette["primary"])),
+    )
+    pio.templates[TEMPLATE] = template
+    template_json = to_json_plotly(template.to_plotly_json())
+    return f"<script>var BRG_TPL = {template_json}; var BRG_CONFIG = {_PLOT_CONFIG};</script>"
+
+
+def _build_kpi_header(pkg: MetricsPackage, palette: dict[str, str]) -> str:
     """Generate the HTML KPI banner."""
     fin = pkg.financial
     comm = pkg.commercial
     cust = pkg.customers
     rag = pkg.rag
 
-    rag_bg = {"Green": brand["green"], "Amber": brand["amber"], "Red": brand["red"]}
+    rag_bg = {"Green": palette["green"], "Amber": palette["amber"], "Red": palette["red"]}
 
     tiles = [
         ("Revenue",        f"£{fin.revenue_actual/1e6:.1f}M", rag.revenue.status),
@@ -286,7 +484,7 @@ def _build_kpi_header(pkg: MetricsPackage, brand: dict) -> str:
 
     tile_html = ""
     for label, value, status in tiles:
-        bg = f"#{rag_bg.get(status, brand['primary'])}"
+        bg = rag_bg.get(status, palette["primary"])
         tile_html += f"""
         <div style="background:{bg};color:#fff;border-radius:8px;padding:10px 16px;
                     min-width:110px;text-align:center;box-shadow:2px 2px 6px rgba(0,0,0,.2);">
@@ -296,7 +494,7 @@ def _build_kpi_header(pkg: MetricsPackage, brand: dict) -> str:
         </div>"""
 
     return f"""
-    <div style="font-family:'Segoe UI',Arial,sans-serif;background:#{brand['primary']};padding:20px 28px;">
+    <div style="font-family:'Segoe UI',Arial,sans-serif;background:{palette['primary']};padding:20px 28px;">
         <h1 style="color:#fff;margin:0 0 3px;font-size:20px;">{pkg.company_name}</h1>
         <p style="color:rgba(255,255,255,.7);margin:0 0 14px;font-size:12px;">
             Board Performance Report — {pkg.report_period} &nbsp;|&nbsp;
@@ -319,10 +517,10 @@ def generate_dashboard(
     Returns:
         Path to the generated .html file.
     """
-    with open(config_path, "r") as fh:
-        cfg = yaml.safe_load(fh)
+    cfg = load_config(config_path)
 
-    brand = cfg["report"]["brand"]
+    palette = _resolve_palette(cfg["report"]["brand"])
+    shared_script = _brand_plot_script(tuple(sorted(palette.items())))
     output_dir = Path(cfg["paths"]["output_dir"])
     output_dir.mkdir(parents=True, exist_ok=True)
     filename = cfg["paths"]["dashboard_filename"].format(period=pkg.report_period)
@@ -330,55 +528,47 @@ def generate_dashboard(
 
     logger.info("Building dashboard for period %s", pkg.report_period)
 
-    charts = {
-        "rev_budget":   _chart_revenue_budget(pkg, brand),
-        "ebitda_margin": _chart_ebitda_margin(pkg, brand),
-        "pipeline":     _chart_pipeline_waterfall(pkg, brand),
-        "arr":          _chart_arr_trend(pkg, brand),
-        "headcount":    _chart_headcount(pkg, brand),
-        "churn_nps":    _chart_churn_nps(pkg, brand),
+    builders = {
+        "rev_budget":   _chart_revenue_budget,
+        "ebitda_margin": _chart_ebitda_margin,
+        "pipeline":     _chart_pipeline_waterfall,
+        "arr":          _chart_arr_trend,
+        "headcount":    _chart_headcount,
+        "churn_nps":    _chart_churn_nps,
     }
 
-    chart_args = {"include_plotlyjs": False, "full_html": False}
-    divs = {k: v.to_html(**chart_args) for k, v in charts.items()}
-
-    kpi_header = _build_kpi_header(pkg, brand)
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width,initial-scale=1.0">
-    <title>Board Report — {pkg.report_period}</title>
-    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
-    <style>
-        *{{box-sizing:border-box;margin:0;padding:0;}}
-        body{{font-family:'Segoe UI',Arial,sans-serif;background:#F4F7FA;}}
-        .grid{{display:grid;grid-template-columns:1fr 1fr;gap:14px;padding:18px;}}
-        .card{{background:#fff;border-radius:8px;padding:6px;
-               box-shadow:0 2px 8px rgba(0,0,0,.07);}}
-        .full{{grid-column:1/-1;}}
-        .footer{{text-align:center;padding:14px;color:#888;font-size:11px;}}
-        @media(max-width:880px){{.grid{{grid-template-columns:1fr;}}.full{{grid-column:1;}}}}
-    </style>
-</head>
-<body>
-    {kpi_header}
-    <div class="grid">
-        <div class="card">{divs['rev_budget']}</div>
-        <div class="card">{divs['ebitda_margin']}</div>
-        <div class="card">{divs['pipeline']}</div>
-        <div class="card">{divs['arr']}</div>
-        <div class="card">{divs['headcount']}</div>
-        <div class="card">{divs['churn_nps']}</div>
-    </div>
-    <div class="footer">
-        Automated Board Report Generator v1.0 &nbsp;|&nbsp; {pkg.company_name} &nbsp;|&nbsp;
-        {datetime.today().strftime('%Y-%m-%d %H:%M')} &nbsp;|&nbsp; STRICTLY CONFIDENTIAL
-    </div>
-</body>
-</html>"""
+    cache_dir = None
+    if os.environ.get(_HTML_CACHE_ENV) == "1":
+        cache_dir = Path(cfg["paths"]["html_cache_dir"])
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # The builders share no state, so each chart is built and rendered on its
+    # own thread; wall-clock is the slowest chart rather than the sum.
+    def _build_and_render(name: str) -> str:
+        return _render_div(name, builders[name](pkg, palette), cache_dir)
+
+    with ThreadPoolExecutor(max_workers=len(builders)) as pool:
+        divs = dict(zip(builders, pool.map(_build_and_render, builders)))
+
+    kpi_header = _build_kpi_header(pkg, palette)
+
+    # The chart divs dominate the page size, so the fragments are streamed to
+    # the file in order instead of being concatenated into one large string.
+    parts = [
+        _PAGE_HEAD.format(period=pkg.report_period),
+        _PAGE_STYLE,
+        shared_script,
+        kpi_header,
+        _GRID_OPEN,
+    ]
+    for div in divs.values():
+        parts += [_CARD_OPEN, div, _CARD_CLOSE]
+    parts.append(_PAGE_FOOTER.format(
+        company=pkg.company_name,
+        generated=datetime.today().strftime("%Y-%m-%d %H:%M"),
+    ))
 
-    output_path.write_text(html, encoding="utf-8")
+    with open(output_path, "w", encoding="utf-8") as fh:
+        fh.writelines(parts)
     logger.info("Dashboard saved to %s", output_path)
     return output_path
@@ -17,34 +17,94 @@ All datasets have 24 months of history with:
 """
 
 import logging
-from datetime import date
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 import pandas as pd
-import yaml
+
+from src.config import load_config
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional — run the kernels as plain Python
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports bare and called forms)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
 
 logger = logging.getLogger(__name__)
 
 
-def _load_config(config_path: str = "config.yaml") -> dict[str, Any]:
-    with open(config_path, "r") as fh:
-        return yaml.safe_load(fh)
+def _month_range(months: int) -> pd.DatetimeIndex:
+    """Return month-start dates for the last `months` months, ending this month."""
+    end = pd.Timestamp.today().normalize().replace(day=1)
+    return pd.date_range(end=end, periods=months, freq="MS")
 
 
-def _month_range(months: int) -> list[date]:
-    """Return a list of the first day of each month going back `months` months."""
-    today = date.today()
-    result = []
-    year, month = today.year, today.month
-    for _ in range(months):
-        result.append(date(year, month, 1))
-        month -= 1
-        if month == 0:
-            month = 12
-            year -= 1
-    return list(reversed(result))
+def _noise(
+    rng: np.random.Generator,
+    scale: float,
+    size: int | tuple[int, ...],
+    loc: float = 0.0,
+) -> np.ndarray:
+    """Draw a block of N(loc, scale) noise from one standard_normal call.
+
+    Scales the buffer in place rather than going through rng.normal, so no
+    second temporary is allocated. Consumes the generator exactly as
+    rng.normal(loc, scale, size) would, keeping seeded output unchanged.
+    """
+    out = rng.standard_normal(size)
+    out *= scale
+    if loc:
+        out += loc
+    return out
+
+
+@njit(cache=True)
+def _arr_walk(
+    starting_arr: float,
+    churn_rate: np.ndarray,
+    new_arr: np.ndarray,
+    churn_budget: float,
+    new_arr_budget: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Walk the monthly ARR waterfall for actuals and budget.
+
+    The only sequential step in the simulator: each month's ARR depends on
+    the previous one. Takes pre-drawn noise vectors and uses scalar ops only,
+    so numba (when installed) compiles it to a tight native loop.
+
+    Returns:
+        (arr, arr_budget, churned) arrays, one value per month.
+    """
+    n = churn_rate.shape[0]
+    arr_out = np.empty(n)
+    arr_budget_out = np.empty(n)
+    churned = np.empty(n)
+    arr = starting_arr
+    arr_budget = starting_arr
+    for t in range(n):
+        churned[t] = arr * churn_rate[t]
+        arr = max(0.0, arr - churned[t] + new_arr[t])
+        arr_budget = max(0.0, arr_budget - arr_budget * churn_budget + new_arr_budget)
+        arr_out[t] = arr
+        arr_budget_out[t] = arr_budget
+    return arr_out, arr_budget_out, churned
+
+
+def _tiled_categorical(labels: list[str], reps: int) -> pd.Categorical:
+    """Return `labels` repeated `reps` times as a Categorical.
+
+    Built from integer codes, so no per-row string objects are created and
+    the label columns are stored as small int codes rather than objects.
+    Duplicate labels share one category.
+    """
+    categories = list(dict.fromkeys(labels))
+    codes = np.array([categories.index(label) for label in labels])
+    return pd.Categorical.from_codes(np.tile(codes, reps), categories=categories)
 
 
 def _generate_financials(
@@ -55,6 +115,8 @@ def _generate_financials(
 
     Each row represents one month × one revenue line.
     OpEx is aggregated at the department level and included as separate rows.
+    All noise is drawn as (months × lines) arrays and combined by broadcasting;
+    the DataFrame is built column-wise in one call.
 
     Args:
         cfg: Full configuration dictionary.
@@ -75,80 +137,72 @@ def _generate_financials(
     seasonality = sim["seasonality"]
 
     periods = _month_range(months_history)
-    records = []
-
-    for period in periods:
-        m_idx = period.month - 1  # 0-based
-        seasonal_factor = seasonality[m_idx]
-
-        # ------------------------------------------------------------------
-        # Revenue lines
-        # ------------------------------------------------------------------
-        for line_name, mix_pct in rev_mix.items():
-            monthly_budget = (annual_budget * mix_pct / 12) * seasonal_factor
-            # Actual: random ±6% around budget
-            actual_variance = float(rng.normal(0, 0.045))
-            monthly_actual = monthly_budget * (1 + actual_variance)
-
-            # Prior year: budget deflated by growth rate, with noise
-            py_budget = monthly_budget / (1 + growth_rate)
-            monthly_py = py_budget * (1 + float(rng.normal(0, 0.03)))
-
-            records.append({
-                "period": period.strftime("%Y-%m"),
-                "year": period.year,
-                "month": period.month,
-                "line_type": "Revenue",
-                "line_name": line_name.replace("_", " "),
-                "budget_gbp": round(monthly_budget, 2),
-                "actual_gbp": round(max(0, monthly_actual), 2),
-                "prior_year_gbp": round(max(0, monthly_py), 2),
-            })
-
-            # COGS for this revenue line
-            cogs_rate = cogs_rates[line_name]
-            cogs_budget = monthly_budget * cogs_rate
-            cogs_actual = monthly_actual * (cogs_rate + float(rng.normal(0, 0.02)))
-            cogs_py = monthly_py * (cogs_rate + float(rng.normal(0, 0.015)))
-
-            records.append({
-                "period": period.strftime("%Y-%m"),
-                "year": period.year,
-                "month": period.month,
-                "line_type": "COGS",
-                "line_name": f"COGS — {line_name.replace('_', ' ')}",
-                "budget_gbp": round(cogs_budget, 2),
-                "actual_gbp": round(max(0, cogs_actual), 2),
-                "prior_year_gbp": round(max(0, cogs_py), 2),
-            })
-
-        # ------------------------------------------------------------------
-        # OpEx departments
-        # ------------------------------------------------------------------
-        monthly_rev_budget = annual_budget / 12 * seasonal_factor
-        for dept, pct in opex_pct.items():
-            dept_budget = monthly_rev_budget * pct
-            dept_actual = dept_budget * (1 + float(rng.normal(0.02, 0.04)))
-            dept_py = dept_budget / (1 + growth_rate * 0.5) * (
-                1 + float(rng.normal(0, 0.03))
-            )
-            records.append({
-                "period": period.strftime("%Y-%m"),
-                "year": period.year,
-                "month": period.month,
-                "line_type": "OpEx",
-                "line_name": dept.replace("_", " & "),
-                "budget_gbp": round(dept_budget, 2),
-                "actual_gbp": round(max(0, dept_actual), 2),
-                "prior_year_gbp": round(max(0, dept_py), 2),
-            })
-
-    df = pd.DataFrame(records)
-
-    # Inject a weaker quarter (Q3 of first year) for narrative interest
-    q3_mask = (df["year"] == periods[0].year) & (df["month"].isin([7, 8, 9]))
-    rev_mask = df["line_type"] == "Revenue"
-    df.loc[q3_mask & rev_mask, "actual_gbp"] *= 0.91  # 9% miss
+    n_months = len(periods)
+    line_keys = list(rev_mix)
+    dept_keys = list(opex_pct)
+    n_lines, n_depts = len(line_keys), len(dept_keys)
+
+    month_idx = periods.month.to_numpy() - 1  # 0-based
+    seasonal = np.asarray(seasonality, dtype=np.float64)[month_idx]
+    mix = np.array([rev_mix[k] for k in line_keys])
+    cogs = np.array([cogs_rates[k] for k in line_keys])
+    dept_pct = np.array([opex_pct[k] for k in dept_keys])
+
+    # ------------------------------------------------------------------
+    # Revenue lines — (months, lines)
+    # ------------------------------------------------------------------
+    rev_budget = (annual_budget * mix[None, :] / 12) * seasonal[:, None]
+    # Actual: random ±6% around budget
+    rev_actual = rev_budget * (1 + _noise(rng, 0.045, (n_months, n_lines)))
+    # Prior year: budget deflated by growth rate, with noise
+    rev_py = rev_budget / (1 + growth_rate) * (1 + _noise(rng, 0.03, (n_months, n_lines)))
+
+    # COGS for each revenue line
+    cogs_budget = rev_budget * cogs
+    cogs_actual = rev_actual * (cogs + _noise(rng, 0.02, (n_months, n_lines)))
+    cogs_py = rev_py * (cogs + _noise(rng, 0.015, (n_months, n_lines)))
+
+    # Inject a weaker quarter (Q3 of first year) for narrative interest —
+    # applied after COGS so cost of sales tracks the unadjusted actual.
+    q3 = (periods.year == periods[0].year) & periods.month.isin([7, 8, 9])
+    rev_actual_out = np.round(np.maximum(0, rev_actual), 2)
+    rev_actual_out[q3] *= 0.91  # 9% miss
+
+    # ------------------------------------------------------------------
+    # OpEx departments — (months, depts)
+    # ------------------------------------------------------------------
+    dept_budget = (annual_budget / 12 * seasonal)[:, None] * dept_pct[None, :]
+    dept_actual = dept_budget * (1 + _noise(rng, 0.04, (n_months, n_depts), loc=0.02))
+    dept_py = dept_budget / (1 + growth_rate * 0.5) * (
+        1 + _noise(rng, 0.03, (n_months, n_depts))
+    )
+
+    # Each month lays out Revenue/COGS pairs per line, then the OpEx rows.
+    def _layout(rev: np.ndarray, cogs_: np.ndarray, opex: np.ndarray) -> np.ndarray:
+        pairs = np.stack([rev, cogs_], axis=2).reshape(n_months, 2 * n_lines)
+        return np.hstack([pairs, opex]).ravel()
+
+    labels = [k.replace("_", " ") for k in line_keys]
+    line_type = ["Revenue", "COGS"] * n_lines + ["OpEx"] * n_depts
+    line_name = [
+        name for label in labels for name in (label, f"COGS — {label}")
+    ] + [d.replace("_", " & ") for d in dept_keys]
+    per_month = len(line_type)
+
+    df = pd.DataFrame({
+        "period": np.repeat(periods.strftime("%Y-%m"), per_month),
+        "year": np.repeat(periods.year, per_month),
+        "month": np.repeat(periods.month, per_month),
+        "line_type": _tiled_categorical(line_type, n_months),
+        "line_name": _tiled_categorical(line_name, n_months),
+        "budget_gbp": np.round(_layout(rev_budget, cogs_budget, dept_budget), 2),
+        "actual_gbp": _layout(
+            rev_actual_out,
+            np.round(np.maximum(0, cogs_actual), 2),
+            np.round(np.maximum(0, dept_actual), 2),
+        ),
+        "prior_year_gbp": np.round(np.maximum(0, _layout(rev_py, cogs_py, dept_py)), 2),
+    })
 
     logger.info(
         "Generated financials: %d records across %d months",
@@ -190,29 +244,30 @@ def _generate_pipeline(
         "Negotiation":    0.16,
     }
 
-    records = []
-    for week_idx in range(weeks):
-        week_start = pd.Timestamp(start_date) + pd.Timedelta(weeks=week_idx)
-        total_new_pipeline = weekly_budget * (1 + float(rng.normal(0, 0.15)))
-
-        for stage, stage_pct in stages.items():
-            stage_pipeline = total_new_pipeline * stage_pct
-            stage_actual = stage_pipeline * (1 + float(rng.normal(0, 0.12)))
-            n_deals = max(1, int(stage_actual / avg_deal))
-            win_rate_actual = win_rate_budget + float(rng.normal(0, 0.04))
-
-            records.append({
-                "week_start": week_start.strftime("%Y-%m-%d"),
-                "stage": stage.replace("_", " "),
-                "pipeline_value_gbp": round(max(0, stage_actual), 2),
-                "budget_pipeline_gbp": round(stage_pipeline, 2),
-                "deal_count": n_deals,
-                "win_rate_actual": round(max(0.05, min(0.65, win_rate_actual)), 4),
-                "win_rate_budget": win_rate_budget,
-            })
-
-    logger.info("Generated pipeline: %d weekly stage records", len(records))
-    return pd.DataFrame(records)
+    stage_pct = np.array(list(stages.values()))
+    n_stages = len(stages)
+
+    # One draw per week for the total, one per week × stage for the splits.
+    total_new_pipeline = weekly_budget * (1 + _noise(rng, 0.15, weeks))
+    stage_pipeline = total_new_pipeline[:, None] * stage_pct[None, :]
+    stage_actual = stage_pipeline * (1 + _noise(rng, 0.12, (weeks, n_stages)))
+    n_deals = np.maximum(1, (stage_actual / avg_deal).astype(np.int64))
+    win_rate_actual = win_rate_budget + _noise(rng, 0.04, (weeks, n_stages))
+
+    week_starts = pd.date_range(start_date, periods=weeks, freq="7D")
+
+    df = pd.DataFrame({
+        "week_start": np.repeat(week_starts.strftime("%Y-%m-%d"), n_stages),
+        "stage": _tiled_categorical([s.replace("_", " ") for s in stages], weeks),
+        "pipeline_value_gbp": np.round(np.maximum(0, stage_actual), 2).ravel(),
+        "budget_pipeline_gbp": np.round(stage_pipeline, 2).ravel(),
+        "deal_count": n_deals.ravel(),
+        "win_rate_actual": np.round(np.clip(win_rate_actual, 0.05, 0.65), 4).ravel(),
+        "win_rate_budget": win_rate_budget,
+    })
+
+    logger.info("Generated pipeline: %d weekly stage records", len(df))
+    return df
 
 
 def _generate_headcount(
@@ -236,33 +291,41 @@ def _generate_headcount(
     salaries = sim["avg_salary_by_dept"]
 
     periods = _month_range(months)
-    records = []
-
-    for period in periods:
-        for dept, budget_hc in hc_budget.items():
-            # Headcount grows ~8% pa with monthly variation
-            growth_factor = 1 + (0.08 / 12) * len(records) / len(hc_budget)
-            actual_hc = max(1, int(budget_hc * growth_factor + rng.normal(0, 1)))
-            py_hc = max(1, int(budget_hc * 0.88 + rng.normal(0, 1)))
-
-            monthly_salary = salaries.get(dept, 55000) / 12
-            cost_budget = budget_hc * monthly_salary
-            cost_actual = actual_hc * monthly_salary * (1 + float(rng.normal(0, 0.03)))
-
-            records.append({
-                "period": period.strftime("%Y-%m"),
-                "year": period.year,
-                "month": period.month,
-                "department": dept.replace("_", " "),
-                "headcount_budget": budget_hc,
-                "headcount_actual": actual_hc,
-                "headcount_prior_year": py_hc,
-                "cost_budget_gbp": round(cost_budget, 2),
-                "cost_actual_gbp": round(max(0, cost_actual), 2),
-            })
-
-    logger.info("Generated headcount: %d records", len(records))
-    return pd.DataFrame(records)
+    n_months = len(periods)
+    dept_keys = list(hc_budget)
+    n_depts = len(dept_keys)
+
+    budget_vec = np.array([hc_budget[d] for d in dept_keys])
+    salary_vec = np.array([salaries.get(d, 55000) for d in dept_keys]) / 12
+
+    # Headcount grows ~8% pa with monthly variation; the factor steps once
+    # per (month, department) row in generation order.
+    row_idx = np.arange(n_months * n_depts).reshape(n_months, n_depts)
+    growth_factor = 1 + (0.08 / 12) * row_idx / n_depts
+    actual_hc = np.maximum(
+        1, (budget_vec * growth_factor + _noise(rng, 1, (n_months, n_depts))).astype(np.int64)
+    )
+    py_hc = np.maximum(
+        1, (budget_vec * 0.88 + _noise(rng, 1, (n_months, n_depts))).astype(np.int64)
+    )
+
+    cost_budget = np.broadcast_to(budget_vec * salary_vec, (n_months, n_depts))
+    cost_actual = actual_hc * salary_vec * (1 + _noise(rng, 0.03, (n_months, n_depts)))
+
+    df = pd.DataFrame({
+        "period": np.repeat(periods.strftime("%Y-%m"), n_depts),
+        "year": np.repeat(periods.year, n_depts),
+        "month": np.repeat(periods.month, n_depts),
+        "department": _tiled_categorical([d.replace("_", " ") for d in dept_keys], n_months),
+        "headcount_budget": np.tile(budget_vec, n_months),
+        "headcount_actual": actual_hc.ravel(),
+        "headcount_prior_year": py_hc.ravel(),
+        "cost_budget_gbp": np.round(cost_budget, 2).ravel(),
+        "cost_actual_gbp": np.round(np.maximum(0, cost_actual), 2).ravel(),
+    })
+
+    logger.info("Generated headcount: %d records", len(df))
+    return df
 
 
 def _generate_customers(
@@ -292,50 +355,45 @@ def _generate_customers(
     nps_target = sim["nps_target"]
 
     periods = _month_range(months)
-    records = []
-    arr = starting_arr
-    arr_budget = starting_arr
+    n_months = len(periods)
+
+    # All noise is drawn up front; only the ARR recurrence is sequential.
+    churn_rate = np.maximum(0.003, monthly_churn_budget + _noise(rng, 0.004, n_months))
+    new_arr = monthly_new_arr * (1 + _noise(rng, 0.12, n_months))
+    new_arr_budget = monthly_new_arr
+    nps = np.clip((nps_target + _noise(rng, 8, n_months)).astype(np.int64), -100, 100)
+
+    arr_out, arr_budget_out, churned = _arr_walk(
+        float(starting_arr),
+        churn_rate,
+        new_arr,
+        float(monthly_churn_budget),
+        float(new_arr_budget),
+    )
 
-    for period in periods:
-        # Churn
-        churn_rate = max(0.003, monthly_churn_budget + float(rng.normal(0, 0.004)))
-        churned = arr * churn_rate
-        churned_budget = arr_budget * monthly_churn_budget
-
-        # New ARR
-        new_arr = monthly_new_arr * (1 + float(rng.normal(0, 0.12)))
-        new_arr_budget = monthly_new_arr
-
-        # Update ARR
-        arr = max(0, arr - churned + new_arr)
-        arr_budget = max(0, arr_budget - churned_budget + new_arr_budget)
-
-        # NPS
-        nps = max(-100, min(100, int(nps_target + rng.normal(0, 8))))
-
-        # Customer counts (approximate from ARR and avg contract value)
-        avg_contract = 28000
-        new_customers = max(0, int(new_arr / avg_contract))
-        churned_customers = max(0, int(churned / avg_contract))
-
-        records.append({
-            "period": period.strftime("%Y-%m"),
-            "year": period.year,
-            "month": period.month,
-            "arr_gbp": round(arr, 2),
-            "arr_budget_gbp": round(arr_budget, 2),
-            "new_arr_gbp": round(max(0, new_arr), 2),
-            "churned_arr_gbp": round(max(0, churned), 2),
-            "churn_rate_actual": round(churn_rate, 5),
-            "churn_rate_budget": monthly_churn_budget,
-            "nps_actual": nps,
-            "nps_budget": nps_target,
-            "new_customers": new_customers,
-            "churned_customers": churned_customers,
-        })
-
-    logger.info("Generated customer metrics: %d monthly records", len(records))
-    return pd.DataFrame(records)
+    # Customer counts (approximate from ARR and avg contract value)
+    avg_contract = 28000
+    new_customers = np.maximum(0, (new_arr / avg_contract).astype(np.int64))
+    churned_customers = np.maximum(0, (churned / avg_contract).astype(np.int64))
+
+    df = pd.DataFrame({
+        "period": periods.strftime("%Y-%m"),
+        "year": periods.year,
+        "month": periods.month,
+        "arr_gbp": np.round(arr_out, 2),
+        "arr_budget_gbp": np.round(arr_budget_out, 2),
+        "new_arr_gbp": np.round(np.maximum(0, new_arr), 2),
+        "churned_arr_gbp": np.round(np.maximum(0, churned), 2),
+        "churn_rate_actual": np.round(churn_rate, 5),
+        "churn_rate_budget": monthly_churn_budget,
+        "nps_actual": nps,
+        "nps_budget": nps_target,
+        "new_customers": new_customers,
+        "churned_customers": churned_customers,
+    })
+
+    logger.info("Generated customer metrics: %d monthly records", len(df))
+    return df
 
 
 def generate_all_datasets(config_path: str = "config.yaml") -> dict[str, pd.DataFrame]:
@@ -347,7 +405,7 @@ def generate_all_datasets(config_path: str = "config.yaml") -> dict[str, pd.Data
     Returns:
         Dict with keys: 'financials', 'pipeline', 'headcount', 'customers'
     """
-    cfg = _load_config(config_path)
+    cfg = load_config(config_path)
     seed = cfg["data_simulation"]["seed"]
     rng = np.random.default_rng(seed)
 
@@ -370,10 +428,17 @@ def generate_all_datasets(config_path: str = "config.yaml") -> dict[str, pd.Data
         "customers":  cfg["paths"]["customers_file"],
     }
 
-    for key, df in datasets.items():
-        path = Path(file_map[key])
-        path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(path, index=False)
-        logger.info("Written %s: %d rows -> %s", key, len(df), path)
+    # Create parent directories sequentially first so the writers never race
+    # on mkdir, then encode and write the four files concurrently.
+    paths = {key: Path(file_map[key]) for key in datasets}
+    for parent in {p.parent for p in paths.values()}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    def _write(key: str) -> None:
+        datasets[key].to_csv(paths[key], index=False, lineterminator="\n")
+        logger.info("Written %s: %d rows -> %s", key, len(datasets[key]), paths[key])
+
+    with ThreadPoolExecutor(max_workers=len(datasets)) as pool:
+        list(pool.map(_write, datasets))
 
     return datasets
@@ -6,51 +6,75 @@ Handles delivery of the board report pack via two channels:
     2. Slack webhook — KPI summary with RAG status blocks
 
 Both channels support dry-run mode when credentials are absent —
-the payload is logged rather than sent, making local development safe.
+a summary is logged rather than sent (the full Slack payload at DEBUG),
+making local development safe.
 
 SMTP credentials and Slack webhook URL are read exclusively from
 environment variables (.env file). No credentials in config.yaml.
 """
 
+import functools
 import json
 import logging
 import os
 import smtplib
-import time
-from email import encoders
-from email.mime.base import MIMEBase
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import string
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from email.message import EmailMessage
 from pathlib import Path
 from typing import Any
 
 import requests
-import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from src.config import load_config
 from src.metrics import MetricsPackage
 
+try:
+    import orjson
+except ImportError:  # optional — fall back to the stdlib encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _parse_env_file(path: str, mtime_ns: int) -> dict[str, str]:
+    """Parse KEY=VALUE lines from a .env file (mtime in the key invalidates).
+
+    Blank lines, comments and empty values are skipped; the first occurrence
+    of a key wins. The returned dict is shared — callers copy before merging.
+    """
+    parsed: dict[str, str] = {}
+    for line in Path(path).read_text().splitlines():
+        line = line.strip()
+        if line and not line.startswith("#") and "=" in line:
+            key, val = line.split("=", 1)
+            val = val.strip().strip("\"'")
+            if val:
+                parsed.setdefault(key.strip(), val)
+    return parsed
+
+
 def _load_env() -> dict[str, str]:
     """Load environment variables, falling back to .env file parsing.
 
+    Process environment variables take precedence over .env entries. The
+    file is parsed once per mtime; only os.environ is re-read on each call.
+
     Returns:
         Dict of environment variable name → value.
     """
     env = dict(os.environ)
-
-    env_path = Path(".env")
-    if env_path.exists():
-        with open(env_path, "r") as fh:
-            for line in fh:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, val = line.split("=", 1)
-                    key = key.strip()
-                    val = val.strip().strip('"').strip("'")
-                    if key not in env and val:
-                        env[key] = val
+    try:
+        mtime_ns = os.stat(".env").st_mtime_ns
+    except FileNotFoundError:
+        return env
+    for key, val in _parse_env_file(os.path.abspath(".env"), mtime_ns).items():
+        env.setdefault(key, val)
     return env
 
 
@@ -58,6 +82,46 @@ def _load_env() -> dict[str, str]:
 # Email distribution
 # ---------------------------------------------------------------------------
 
+_EMAIL_KPI_CELL = string.Template("""
+        <td style="background:$bg;color:#fff;padding:10px 14px;text-align:center;border-radius:4px;">
+            <div style="font-size:10px;opacity:.8;">$label</div>
+            <div style="font-size:18px;font-weight:bold;">$value</div>
+        </td>
+        <td style="width:8px;"></td>""")
+
+_EMAIL_TEMPLATE = string.Template("""
+    <html><body style="font-family:Arial,sans-serif;color:#2D3748;max-width:700px;margin:auto;">
+    <div style="background:#$primary;padding:24px 28px;border-radius:6px 6px 0 0;">
+        <h2 style="color:#fff;margin:0;">$company</h2>
+        <p style="color:rgba(255,255,255,.75);margin:4px 0 0;">
+            Board Performance Report — $period | Strictly Confidential
+        </p>
+    </div>
+    <div style="background:#F4F7FA;padding:20px 28px;">
+        <table style="border-spacing:0;"><tr>$kpis</tr></table>
+        <p style="margin-top:18px;font-size:13px;line-height:1.6;">
+            Please find attached the Board Report pack for <strong>$period</strong>,
+            comprising the PDF narrative report and the Excel data pack.
+        </p>
+        <p style="font-size:13px;line-height:1.6;">
+            This report was generated automatically by the Board Report Generator pipeline
+            and delivered at $generated.
+        </p>
+        <hr style="border:none;border-top:1px solid #D1D5DB;margin:16px 0;">
+        <p style="font-size:11px;color:#888;">
+            This email and its attachments are intended solely for the named recipients.
+            If you have received this in error, please delete it immediately and notify the sender.
+        </p>
+    </div>
+    </body></html>""")
+
+
+@functools.lru_cache(maxsize=4)
+def _rag_palette(green: str, amber: str, red: str) -> dict[str, str]:
+    """Map RAG statuses to CSS colours for one brand (shared — do not mutate)."""
+    return {"Green": f"#{green}", "Amber": f"#{amber}", "Red": f"#{red}"}
+
+
 def _build_email_body(pkg: MetricsPackage, cfg: dict[str, Any]) -> str:
     """Build an HTML email body with inline KPI summary.
 
@@ -74,13 +138,8 @@ def _build_email_body(pkg: MetricsPackage, cfg: dict[str, Any]) -> str:
     rag = pkg.rag
     brand = cfg["report"]["brand"]
 
-    rag_colours = {
-        "Green": f"#{brand['green']}",
-        "Amber": f"#{brand['amber']}",
-        "Red":   f"#{brand['red']}",
-    }
+    rag_colours = _rag_palette(brand["green"], brand["amber"], brand["red"])
 
-    kpis_html = ""
     kpis = [
         ("Revenue",       f"&pound;{fin.revenue_actual/1e6:.1f}M", rag.revenue.status),
         ("Gross Margin",  f"{fin.gross_margin_pct_actual*100:.1f}%", rag.gross_margin.status),
@@ -89,40 +148,40 @@ def _build_email_body(pkg: MetricsPackage, cfg: dict[str, Any]) -> str:
         ("Pipeline Cov.", f"{comm.pipeline_coverage_ratio:.1f}x", rag.pipeline_coverage.status),
         ("Churn Rate",    f"{cust.churn_rate_actual*100:.2f}%", rag.churn_rate.status),
     ]
-    for label, value, status in kpis:
-        bg = rag_colours.get(status, "#1B3A5C")
-        kpis_html += f"""
-        <td style="background:{bg};color:#fff;padding:10px 14px;text-align:center;border-radius:4px;">
-            <div style="font-size:10px;opacity:.8;">{label}</div>
-            <div style="font-size:18px;font-weight:bold;">{value}</div>
-        </td>
-        <td style="width:8px;"></td>"""
+    kpis_html = "".join(
+        _EMAIL_KPI_CELL.substitute(bg=rag_colours.get(status, "#1B3A5C"), label=label, value=value)
+        for label, value, status in kpis
+    )
+
+    return _EMAIL_TEMPLATE.substitute(
+        primary=brand["primary"],
+        company=pkg.company_name,
+        period=pkg.report_period,
+        kpis=kpis_html,
+        generated=datetime.now().strftime("%H:%M on %A %d %B %Y"),
+    )
 
-    return f"""
-    <html><body style="font-family:Arial,sans-serif;color:#2D3748;max-width:700px;margin:auto;">
-    <div style="background:#{brand['primary']};padding:24px 28px;border-radius:6px 6px 0 0;">
-        <h2 style="color:#fff;margin:0;">{pkg.company_name}</h2>
-        <p style="color:rgba(255,255,255,.75);margin:4px 0 0;">
-            Board Performance Report — {pkg.report_period} | Strictly Confidential
-        </p>
-    </div>
-    <div style="background:#F4F7FA;padding:20px 28px;">
-        <table style="border-spacing:0;"><tr>{kpis_html}</tr></table>
-        <p style="margin-top:18px;font-size:13px;line-height:1.6;">
-            Please find attached the Board Report pack for <strong>{pkg.report_period}</strong>,
-            comprising the PDF narrative report and the Excel data pack.
-        </p>
-        <p style="font-size:13px;line-height:1.6;">
-            This report was generated automatically by the Board Report Generator pipeline
-            and delivered at {__import__('datetime').datetime.now().strftime('%H:%M on %A %d %B %Y')}.
-        </p>
-        <hr style="border:none;border-top:1px solid #D1D5DB;margin:16px 0;">
-        <p style="font-size:11px;color:#888;">
-            This email and its attachments are intended solely for the named recipients.
-            If you have received this in error, please delete it immediately and notify the sender.
-        </p>
-    </div>
-    </body></html>"""
+
+@contextmanager
+def smtp_session(env: dict[str, str] | None = None) -> Iterator[smtplib.SMTP]:
+    """Open one authenticated SMTP session for sending several reports.
+
+    EHLO, STARTTLS and LOGIN happen once on entry; pass the yielded server
+    to send_email(smtp_conn=...) for each message to skip the per-message
+    TLS handshake and AUTH round trips.
+
+    Args:
+        env: Environment dict (defaults to _load_env()).
+
+    Yields:
+        The connected, logged-in smtplib.SMTP instance.
+    """
+    env = env if env is not None else _load_env()
+    with smtplib.SMTP(env["SMTP_HOST"], int(env.get("SMTP_PORT", "587"))) as server:
+        server.ehlo()
+        server.starttls()
+        server.login(env["SMTP_USER"], env["SMTP_PASSWORD"])
+        yield server
 
 
 def send_email(
@@ -130,6 +189,7 @@ def send_email(
     pdf_path: Path,
     excel_path: Path,
     config_path: str = "config.yaml",
+    smtp_conn: smtplib.SMTP | None = None,
 ) -> bool:
     """Send the board report via SMTP email with PDF and Excel attachments.
 
@@ -138,16 +198,16 @@ def send_email(
         pdf_path: Path to the PDF report.
         excel_path: Path to the Excel data pack.
         config_path: Path to configuration YAML.
+        smtp_conn: Open session from smtp_session() to reuse; when None a
+            session is opened and closed for this message alone.
 
     Returns:
         True if sent (or dry-run completed), False on delivery failure.
     """
-    with open(config_path, "r") as fh:
-        cfg = yaml.safe_load(fh)
+    cfg = load_config(config_path)
 
     env = _load_env()
     smtp_host = env.get("SMTP_HOST", "")
-    smtp_port = int(env.get("SMTP_PORT", "587"))
     smtp_user = env.get("SMTP_USER", "")
     smtp_password = env.get("SMTP_PASSWORD", "")
     from_addr = env.get("EMAIL_FROM", smtp_user)
@@ -159,7 +219,7 @@ def send_email(
         company=pkg.company_name,
     )
 
-    if not all([smtp_host, smtp_user, smtp_password]):
+    if smtp_conn is None and not all([smtp_host, smtp_user, smtp_password]):
         logger.warning(
             "SMTP credentials not set — email dry-run mode.\n"
             "  Subject: %s\n  Recipients: %s\n  Attachments: %s, %s",
@@ -170,32 +230,29 @@ def send_email(
         )
         return True
 
-    msg = MIMEMultipart("alternative")
+    msg = EmailMessage()
     msg["Subject"] = subject
     msg["From"] = from_addr
     msg["To"] = ", ".join(recipients)
+    msg.set_content(_build_email_body(pkg, cfg), subtype="html")
 
-    html_body = _build_email_body(pkg, cfg)
-    msg.attach(MIMEText(html_body, "html"))
-
+    # add_attachment base64-encodes the bytes in a single pass and turns the
+    # message into multipart/mixed with the HTML body as its first part.
     for attach_path in [pdf_path, excel_path]:
         if attach_path and attach_path.exists():
-            with open(attach_path, "rb") as fh:
-                part = MIMEBase("application", "octet-stream")
-                part.set_payload(fh.read())
-            encoders.encode_base64(part)
-            part.add_header(
-                "Content-Disposition",
-                f'attachment; filename="{attach_path.name}"',
+            msg.add_attachment(
+                attach_path.read_bytes(),
+                maintype="application",
+                subtype="octet-stream",
+                filename=attach_path.name,
             )
-            msg.attach(part)
 
     try:
-        with smtplib.SMTP(smtp_host, smtp_port) as server:
-            server.ehlo()
-            server.starttls()
-            server.login(smtp_user, smtp_password)
-            server.sendmail(from_addr, recipients, msg.as_string())
+        if smtp_conn is not None:
+            smtp_conn.send_message(msg, from_addr, recipients)
+        else:
+            with smtp_session(env) as server:
+                server.send_message(msg, from_addr, recipients)
         logger.info("Email sent to %d recipients", len(recipients))
         return True
     except smtplib.SMTPException as exc:
@@ -207,6 +264,33 @@ def send_email(
 # Slack distribution
 # ---------------------------------------------------------------------------
 
+_RAG_EMOJI = {
+    "Green": ":large_green_circle:",
+    "Amber": ":large_yellow_circle:",
+    "Red": ":red_circle:",
+}
+
+# One pooled session for webhook posts: urllib3 handles the retry/backoff
+# (3 attempts, honouring Retry-After on 429) and keeps the TLS connection
+# alive between attempts and between runs in a long-lived scheduler process.
+_SLACK_ATTEMPTS = 3
+_SLACK_SESSION = requests.Session()
+_SLACK_SESSION.mount("https://", HTTPAdapter(max_retries=Retry(
+    total=_SLACK_ATTEMPTS - 1,
+    backoff_factor=2,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False,
+)))
+
+
+def _dumps(payload: dict[str, Any], indent: bool = False) -> bytes:
+    """Serialise a payload to UTF-8 JSON, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(payload, indent=2 if indent else None, ensure_ascii=False).encode()
+
+
 def _build_slack_payload(
     pkg: MetricsPackage,
     cfg: dict[str, Any],
@@ -226,25 +310,22 @@ def _build_slack_payload(
     rag = pkg.rag
     dist_cfg = cfg["distribution"]
 
-    def rag_emoji(status: str) -> str:
-        return {"Green": ":large_green_circle:", "Amber": ":large_yellow_circle:",
-                "Red": ":red_circle:"}.get(status, ":white_circle:")
-
-    kpi_lines = (
-        f"{rag_emoji(rag.revenue.status)} *Revenue:* "
-        f"£{fin.revenue_actual/1e6:.1f}M ({rag.revenue.variance_pct*100:+.1f}% vs budget)\n"
-        f"{rag_emoji(rag.gross_margin.status)} *Gross Margin:* "
-        f"{fin.gross_margin_pct_actual*100:.1f}%\n"
-        f"{rag_emoji(rag.ebitda_margin.status)} *EBITDA Margin:* "
-        f"{fin.ebitda_margin_pct_actual*100:.1f}%\n"
+    emoji = _RAG_EMOJI.get
+    kpi_lines = "\n".join([
+        f"{emoji(rag.revenue.status, ':white_circle:')} *Revenue:* "
+        f"£{fin.revenue_actual/1e6:.1f}M ({rag.revenue.variance_pct*100:+.1f}% vs budget)",
+        f"{emoji(rag.gross_margin.status, ':white_circle:')} *Gross Margin:* "
+        f"{fin.gross_margin_pct_actual*100:.1f}%",
+        f"{emoji(rag.ebitda_margin.status, ':white_circle:')} *EBITDA Margin:* "
+        f"{fin.ebitda_margin_pct_actual*100:.1f}%",
         f":chart_with_upwards_trend: *ARR:* £{cust.arr_actual/1e6:.1f}M "
-        f"(net movement: £{cust.net_arr_movement/1000:+.0f}k)\n"
-        f"{rag_emoji(rag.pipeline_coverage.status)} *Pipeline Coverage:* "
-        f"{comm.pipeline_coverage_ratio:.1f}x\n"
-        f"{rag_emoji(rag.churn_rate.status)} *Churn Rate:* "
-        f"{cust.churn_rate_actual*100:.2f}% (budget: {cust.churn_rate_budget*100:.2f}%)\n"
-        f":star: *NPS:* {cust.nps_actual} (target: {cust.nps_budget})"
-    )
+        f"(net movement: £{cust.net_arr_movement/1000:+.0f}k)",
+        f"{emoji(rag.pipeline_coverage.status, ':white_circle:')} *Pipeline Coverage:* "
+        f"{comm.pipeline_coverage_ratio:.1f}x",
+        f"{emoji(rag.churn_rate.status, ':white_circle:')} *Churn Rate:* "
+        f"{cust.churn_rate_actual*100:.2f}% (budget: {cust.churn_rate_budget*100:.2f}%)",
+        f":star: *NPS:* {cust.nps_actual} (target: {cust.nps_budget})",
+    ])
 
     blocks = [
         {
@@ -297,32 +378,35 @@ def send_slack_summary(
     Returns:
         True if sent (or dry-run), False on failure.
     """
-    with open(config_path, "r") as fh:
-        cfg = yaml.safe_load(fh)
+    cfg = load_config(config_path)
 
     env = _load_env()
     webhook_url = env.get("SLACK_WEBHOOK_URL", "").strip()
 
+    if not webhook_url:
+        logger.warning("SLACK_WEBHOOK_URL not set — Slack dry-run mode.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Slack dry-run payload:\n%s",
+                _dumps(_build_slack_payload(pkg, cfg), indent=True).decode(),
+            )
+        return True
+
     payload = _build_slack_payload(pkg, cfg)
 
-    if not webhook_url:
-        logger.warning(
-            "SLACK_WEBHOOK_URL not set — Slack dry-run mode.\n%s",
-            json.dumps(payload, indent=2),
+    try:
+        resp = _SLACK_SESSION.post(
+            webhook_url,
+            data=_dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=10,
         )
-        return True
+    except requests.RequestException as exc:
+        logger.error("Slack delivery failed after %d attempts: %s", _SLACK_ATTEMPTS, exc)
+        return False
 
-    for attempt in range(1, 4):
-        try:
-            resp = requests.post(webhook_url, json=payload, timeout=10)
-            if resp.status_code == 200:
-                logger.info("Slack summary sent (attempt %d)", attempt)
-                return True
-            logger.warning("Slack returned %s (attempt %d)", resp.status_code, attempt)
-        except requests.RequestException as exc:
-            logger.warning("Slack request failed (attempt %d): %s", attempt, exc)
-        if attempt < 3:
-            time.sleep(2 ** attempt)
-
-    logger.error("Slack delivery failed after 3 attempts")
+    if resp.status_code == 200:
+        logger.info("Slack summary sent")
+        return True
+    logger.error("Slack delivery failed after %d attempts: HTTP %s", _SLACK_ATTEMPTS, resp.status_code)
     return False
@@ -17,24 +17,29 @@ Sheets:
     6. Data Dictionary — Column definitions for all sheets
 """
 
+import csv
+import functools
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
-import yaml
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.chart import BarChart, LineChart, Reference
 from openpyxl.chart.series import SeriesLabel
 from openpyxl.formatting.rule import ColorScaleRule, CellIsRule
 from openpyxl.styles import (
-    Alignment, Border, Font, PatternFill, Side
+    Alignment, Border, Font, NamedStyle, PatternFill, Side
 )
 from openpyxl.utils import get_column_letter
-from openpyxl.utils.dataframe import dataframe_to_rows
 
+from src.config import load_config
 from src.metrics import MetricsPackage
 
 logger = logging.getLogger(__name__)
@@ -62,161 +67,304 @@ def _center() -> Alignment:
     return Alignment(horizontal="center", vertical="center", wrap_text=False)
 
 
-def _auto_fit(ws, min_w: int = 8, max_w: int = 55) -> None:
-    for col in ws.columns:
-        max_len = max(
-            (len(str(cell.value)) if cell.value else 0 for cell in col), default=0
-        )
-        ws.column_dimensions[get_column_letter(col[0].column)].width = \
+# Shared style objects — built once and assigned by reference in the builders.
+CENTER = _center()
+BODY_FONT = _font(size=9)
+BODY_FONT_WHITE = _font(bold=True, colour="FFFFFF", size=9)
+LABEL_FONT = _font(bold=True, colour="333333", size=9)
+HEADER_FONT = _font(bold=True, colour="FFFFFF", size=10)
+TITLE_FONT = _font(bold=True, colour="FFFFFF", size=14)
+SUBTITLE_FONT = _font(italic=True, colour="555555", size=9)
+EVEN_FILL = _fill("F9F9F9")
+ODD_FILL = _fill("FFFFFF")
+MONEY_FMT = "#,##0"
+PCT_FMT = "0.0%"
+
+
+def _register_body_styles(wb: Workbook) -> None:
+    """Register the named styles shared by every data-sheet body cell.
+
+    Names are ``body[_even|_odd][_money|_pct]``: 9pt Calibri with a thin
+    border, an optional zebra fill and an optional number format.
+    """
+    for fill_key, fill in (("", None), ("_even", EVEN_FILL), ("_odd", ODD_FILL)):
+        for fmt_key, fmt in (("", "General"), ("_money", MONEY_FMT), ("_pct", PCT_FMT)):
+            style = NamedStyle(
+                name=f"body{fill_key}{fmt_key}", font=BODY_FONT,
+                border=THIN_BORDER, number_format=fmt,
+            )
+            if fill:
+                style.fill = fill
+            wb.add_named_style(style)
+
+
+def _cell(ws, value: Any, style: str | None = None, **attrs: Any) -> WriteOnlyCell:
+    """Build a write-only cell with a named style and/or explicit style attrs."""
+    cell = WriteOnlyCell(ws, value=value)
+    if style:
+        cell.style = style
+    for name, attr in attrs.items():
+        setattr(cell, name, attr)
+    return cell
+
+
+def _auto_fit(ws, headers: list[str], rows: list[tuple], min_w: int = 8, max_w: int = 55) -> None:
+    """Size columns from the rows about to be written.
+
+    Write-only sheets emit <cols> before the first row, so widths come from
+    the values up front — one map(len, map(str, ...)) pass per column.
+    """
+    columns = zip(*rows) if rows else ([] for _ in headers)
+    for col_i, (name, values) in enumerate(zip(headers, columns), start=1):
+        max_len = max(len(str(name)), max(map(len, map(str, values)), default=0))
+        ws.column_dimensions[get_column_letter(col_i)].width = \
             min(max(max_len + 3, min_w), max_w)
 
 
-def _write_header_row(ws, row: int, headers: list[str], brand: dict) -> None:
-    """Write a formatted header row at the given row index."""
-    primary = brand["primary"].lstrip("#")
-    for col_i, h in enumerate(headers, start=1):
-        cell = ws.cell(row=row, column=col_i, value=h)
-        cell.fill = _fill(primary)
-        cell.font = _font(bold=True, colour="FFFFFF", size=10)
-        cell.alignment = _center()
-        cell.border = THIN_BORDER
-    ws.row_dimensions[row].height = 20
+def _growth(actual: pd.Series, base: pd.Series) -> np.ndarray:
+    """Return actual / base - 1 element-wise, with 0 wherever base is 0.
+
+    Division and the subtraction run masked into one preallocated array,
+    so there is no inf/NaN clean-up pass afterwards.
+    """
+    a = actual.to_numpy(dtype=np.float64)
+    b = base.to_numpy(dtype=np.float64)
+    out = np.zeros_like(a)
+    nonzero = b != 0
+    np.divide(a, b, out=out, where=nonzero)
+    np.subtract(out, 1.0, out=out, where=nonzero)
+    return out
+
+
+def _write_header_row(ws, headers: list[str], brand: dict) -> None:
+    """Append the formatted header row that opens every data sheet."""
+    fill = _fill(brand["primary"])
+    ws.row_dimensions[1].height = 20
+    ws.append([
+        _cell(ws, h, fill=fill, font=HEADER_FONT, alignment=CENTER, border=THIN_BORDER)
+        for h in headers
+    ])
+
+
+# ---------------------------------------------------------------------------
+# Raw data loading
+# ---------------------------------------------------------------------------
+
+_CSV_DTYPES: dict[str, str] = {
+    "period": "str", "year": "int64", "month": "int64", "week_start": "str",
+    "line_type": "str", "line_name": "str", "stage": "str", "department": "str",
+    "budget_gbp": "float64", "actual_gbp": "float64", "prior_year_gbp": "float64",
+    "pipeline_value_gbp": "float64", "budget_pipeline_gbp": "float64", "deal_count": "int64",
+    "win_rate_actual": "float64", "win_rate_budget": "float64",
+    "arr_gbp": "float64", "arr_budget_gbp": "float64", "new_arr_gbp": "float64",
+    "churned_arr_gbp": "float64", "churn_rate_actual": "float64", "churn_rate_budget": "float64",
+    "nps_actual": "int64", "nps_budget": "int64", "new_customers": "int64",
+    "churned_customers": "int64",
+    "headcount_budget": "int64", "headcount_actual": "int64", "headcount_prior_year": "int64",
+    "cost_budget_gbp": "float64", "cost_actual_gbp": "float64",
+}
+
+_PL_COLUMNS = ("period", "line_type", "line_name", "budget_gbp", "actual_gbp", "prior_year_gbp")
+_CONVERTERS = {"str": str, "int64": int, "float64": float}
+
+
+@functools.lru_cache(maxsize=8)
+def _read_csv(path: str, mtime_ns: int, columns: tuple[str, ...]) -> pd.DataFrame:
+    """Parse a raw CSV (cache key includes mtime so regenerated data invalidates)."""
+    return pd.read_csv(path, usecols=list(columns), dtype={c: _CSV_DTYPES[c] for c in columns})
+
+
+@functools.lru_cache(maxsize=8)
+def _read_rows(path: str, mtime_ns: int) -> tuple[tuple[str, ...], tuple[tuple, ...]]:
+    """Parse a raw CSV into typed row tuples with the stdlib csv reader.
+
+    For the pass-through sheets that only append a column or two, this
+    skips building a DataFrame. Values are converted with _CSV_DTYPES so
+    numbers land in Excel as numbers.
+
+    Returns:
+        (header, rows) — both immutable, so cached results are shared as-is.
+    """
+    with open(path, newline="") as fh:
+        reader = csv.reader(fh)
+        header = tuple(next(reader))
+        convert = [_CONVERTERS[_CSV_DTYPES[name]] for name in header]
+        rows = tuple(tuple(f(v) for f, v in zip(convert, row)) for row in reader)
+    return header, rows
+
+
+def _load_rows(path: str) -> tuple[tuple[str, ...], tuple[tuple, ...]]:
+    """Return the cached typed (header, rows) for a raw CSV."""
+    path = os.path.abspath(path)
+    return _read_rows(path, os.stat(path).st_mtime_ns)
+
+
+def _load_csv(path: str, columns: tuple[str, ...]) -> pd.DataFrame:
+    """Load only the given columns of a raw CSV with fixed dtypes.
+
+    Args:
+        path: CSV path.
+        columns: Columns the sheet writes (returned in file order).
+
+    Returns:
+        A private copy of the cached frame, safe for the caller to mutate.
+    """
+    path = os.path.abspath(path)
+    return _read_csv(path, os.stat(path).st_mtime_ns, columns).copy()
+
+
+def _prefetch_csvs(cfg: dict[str, Any]) -> None:
+    """Parse every raw CSV concurrently so the sheet builders hit the cache.
+
+    pandas' C parser releases the GIL, so the P&L parse overlaps the csv
+    module reads. The openpyxl writes that follow stay sequential.
+    """
+    sources = (
+        ("financials_file", _read_csv, (_PL_COLUMNS,)),
+        ("pipeline_file", _read_rows, ()),
+        ("customers_file", _read_rows, ()),
+        ("headcount_file", _read_rows, ()),
+    )
+
+    def parse(source: tuple) -> None:
+        key, reader, args = source
+        path = os.path.abspath(cfg["paths"][key])
+        if os.path.exists(path):
+            reader(path, os.stat(path).st_mtime_ns, *args)
+
+    with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+        list(pool.map(parse, sources))
 
 
 # ---------------------------------------------------------------------------
 # Sheet builders
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=4)
+def _rag_fills(green: str, amber: str, red: str) -> dict[str, PatternFill]:
+    """Map RAG statuses to solid fills for one brand (shared — do not mutate)."""
+    return {"Green": _fill(green), "Amber": _fill(amber), "Red": _fill(red)}
+
+
+# Summary layout. Section banners, column-header and spacer rows are static;
+# KPI rows map the package to (actual, budget, RAG status).
+_SUMMARY_SECTIONS = frozenset({
+    "FINANCIAL PERFORMANCE", "COMMERCIAL PERFORMANCE", "CUSTOMER METRICS", "PEOPLE & OPERATIONS",
+})
+
+_SUMMARY_ROWS: tuple[tuple[str, Any], ...] = (
+    ("FINANCIAL PERFORMANCE", None),
+    ("Metric", ("Actual", "Budget", "RAG")),
+    ("Revenue", lambda p: (
+        f"£{p.financial.revenue_actual/1e6:.2f}M", f"£{p.financial.revenue_budget/1e6:.2f}M",
+        p.rag.revenue.status)),
+    ("Gross Margin %", lambda p: (
+        f"{p.financial.gross_margin_pct_actual*100:.1f}%", f"{p.financial.gross_margin_pct_budget*100:.1f}%",
+        p.rag.gross_margin.status)),
+    ("EBITDA", lambda p: (
+        f"£{p.financial.ebitda_actual/1000:.0f}k", f"£{p.financial.ebitda_budget/1000:.0f}k",
+        p.rag.ebitda_margin.status)),
+    ("EBITDA Margin %", lambda p: (
+        f"{p.financial.ebitda_margin_pct_actual*100:.1f}%", f"{p.financial.ebitda_margin_pct_budget*100:.1f}%",
+        p.rag.ebitda_margin.status)),
+    ("YTD Revenue", lambda p: (
+        f"£{p.financial.ytd_revenue_actual/1e6:.2f}M", f"£{p.financial.ytd_revenue_budget/1e6:.2f}M",
+        "Green" if p.financial.ytd_revenue_actual >= p.financial.ytd_revenue_budget * 0.95 else "Amber")),
+    ("", None),
+    ("COMMERCIAL PERFORMANCE", None),
+    ("Metric", ("Actual", "Budget / Target", "RAG")),
+    ("Pipeline Coverage", lambda p: (
+        f"{p.commercial.pipeline_coverage_ratio:.1f}x", "3.0x", p.rag.pipeline_coverage.status)),
+    ("Win Rate", lambda p: (
+        f"{p.commercial.win_rate_actual*100:.1f}%", f"{p.commercial.win_rate_budget*100:.1f}%",
+        p.rag.win_rate.status)),
+    ("Total Pipeline", lambda p: (
+        f"£{p.commercial.total_pipeline_gbp/1e6:.1f}M", f"£{p.commercial.pipeline_budget_gbp/1e6:.1f}M",
+        "Green")),
+    ("", None),
+    ("CUSTOMER METRICS", None),
+    ("Metric", ("Actual", "Budget / Target", "RAG")),
+    ("ARR", lambda p: (
+        f"£{p.customers.arr_actual/1e6:.2f}M", f"£{p.customers.arr_budget/1e6:.2f}M", "Green")),
+    ("Monthly Churn Rate", lambda p: (
+        f"{p.customers.churn_rate_actual*100:.2f}%", f"{p.customers.churn_rate_budget*100:.2f}%",
+        p.rag.churn_rate.status)),
+    ("NPS", lambda p: (str(p.customers.nps_actual), str(p.customers.nps_budget), p.rag.nps.status)),
+    ("", None),
+    ("PEOPLE & OPERATIONS", None),
+    ("Metric", ("Actual", "Budget", "RAG")),
+    ("Total Headcount", lambda p: (
+        str(p.headcount.total_hc_actual), str(p.headcount.total_hc_budget), p.rag.headcount.status)),
+    ("Monthly People Cost", lambda p: (
+        f"£{p.headcount.total_cost_actual/1000:.0f}k", f"£{p.headcount.total_cost_budget/1000:.0f}k", "Green")),
+    ("Cost Per Head (monthly)", lambda p: (
+        f"£{p.headcount.cost_per_head_actual:.0f}", f"£{p.headcount.cost_per_head_budget:.0f}", "Green")),
+)
+
+
 def _sheet_summary(ws, pkg: MetricsPackage, brand: dict) -> None:
     """Write the KPI summary dashboard sheet."""
     ws.sheet_properties.tabColor = brand["primary"].lstrip("#")
-    primary = brand["primary"].lstrip("#")
-    light = brand["light"].lstrip("#")
+    primary_fill = _fill(brand["primary"])
+    light_fill = _fill(brand["light"])
+    for col in range(1, 5):
+        ws.column_dimensions[get_column_letter(col)].width = 28
 
     # Title
-    ws.merge_cells("A1:H1")
-    cell = ws["A1"]
-    cell.value = f"{pkg.company_name} — Board Report KPI Dashboard"
-    cell.fill = _fill(primary)
-    cell.font = _font(bold=True, colour="FFFFFF", size=14)
-    cell.alignment = _center()
+    ws.merged_cells.add("A1:H1")
     ws.row_dimensions[1].height = 30
-
-    ws.merge_cells("A2:H2")
-    ws["A2"].value = f"Period: {pkg.report_period}  |  Generated: {datetime.today().strftime('%Y-%m-%d %H:%M')}"
-    ws["A2"].font = _font(italic=True, colour="555555", size=9)
-    ws["A2"].alignment = _center()
+    ws.append([_cell(
+        ws, f"{pkg.company_name} — Board Report KPI Dashboard",
+        fill=primary_fill, font=TITLE_FONT, alignment=CENTER,
+    )])
+
+    ws.merged_cells.add("A2:H2")
+    ws.append([_cell(
+        ws, f"Period: {pkg.report_period}  |  Generated: {datetime.today().strftime('%Y-%m-%d %H:%M')}",
+        font=SUBTITLE_FONT, alignment=CENTER,
+    )])
+    ws.append([])
 
     # KPI sections
-    rag = pkg.rag
-    fin = pkg.financial
-    comm = pkg.commercial
-    cust = pkg.customers
-    hc = pkg.headcount
-
-    rag_colour_map = {
-        "Green": brand["green"].lstrip("#"),
-        "Amber": brand["amber"].lstrip("#"),
-        "Red":   brand["red"].lstrip("#"),
-    }
-
-    kpis = [
-        ("FINANCIAL PERFORMANCE", "", "", ""),
-        ("Metric", "Actual", "Budget", "RAG"),
-        ("Revenue", f"£{fin.revenue_actual/1e6:.2f}M",
-         f"£{fin.revenue_budget/1e6:.2f}M", rag.revenue.status),
-        ("Gross Margin %", f"{fin.gross_margin_pct_actual*100:.1f}%",
-         f"{fin.gross_margin_pct_budget*100:.1f}%", rag.gross_margin.status),
-        ("EBITDA", f"£{fin.ebitda_actual/1000:.0f}k",
-         f"£{fin.ebitda_budget/1000:.0f}k", rag.ebitda_margin.status),
-        ("EBITDA Margin %", f"{fin.ebitda_margin_pct_actual*100:.1f}%",
-         f"{fin.ebitda_margin_pct_budget*100:.1f}%", rag.ebitda_margin.status),
-        ("YTD Revenue", f"£{fin.ytd_revenue_actual/1e6:.2f}M",
-         f"£{fin.ytd_revenue_budget/1e6:.2f}M",
-         "Green" if fin.ytd_revenue_actual >= fin.ytd_revenue_budget * 0.95 else "Amber"),
-        ("", "", "", ""),
-        ("COMMERCIAL PERFORMANCE", "", "", ""),
-        ("Metric", "Actual", "Budget / Target", "RAG"),
-        ("Pipeline Coverage", f"{comm.pipeline_coverage_ratio:.1f}x",
-         "3.0x", rag.pipeline_coverage.status),
-        ("Win Rate", f"{comm.win_rate_actual*100:.1f}%",
-         f"{comm.win_rate_budget*100:.1f}%", rag.win_rate.status),
-        ("Total Pipeline", f"£{comm.total_pipeline_gbp/1e6:.1f}M",
-         f"£{comm.pipeline_budget_gbp/1e6:.1f}M", "Green"),
-        ("", "", "", ""),
-        ("CUSTOMER METRICS", "", "", ""),
-        ("Metric", "Actual", "Budget / Target", "RAG"),
-        ("ARR", f"£{cust.arr_actual/1e6:.2f}M",
-         f"£{cust.arr_budget/1e6:.2f}M", "Green"),
-        ("Monthly Churn Rate", f"{cust.churn_rate_actual*100:.2f}%",
-         f"{cust.churn_rate_budget*100:.2f}%", rag.churn_rate.status),
-        ("NPS", str(cust.nps_actual), str(cust.nps_budget), rag.nps.status),
-        ("", "", "", ""),
-        ("PEOPLE & OPERATIONS", "", "", ""),
-        ("Metric", "Actual", "Budget", "RAG"),
-        ("Total Headcount", str(hc.total_hc_actual), str(hc.total_hc_budget),
-         rag.headcount.status),
-        ("Monthly People Cost", f"£{hc.total_cost_actual/1000:.0f}k",
-         f"£{hc.total_cost_budget/1000:.0f}k", "Green"),
-        ("Cost Per Head (monthly)", f"£{hc.cost_per_head_actual:.0f}",
-         f"£{hc.cost_per_head_budget:.0f}", "Green"),
-    ]
+    rag_fill_map = _rag_fills(brand["green"], brand["amber"], brand["red"])
 
-    for row_i, (label, actual, budget, rag_status) in enumerate(kpis, start=4):
-        if label in ("FINANCIAL PERFORMANCE", "COMMERCIAL PERFORMANCE",
-                     "CUSTOMER METRICS", "PEOPLE & OPERATIONS"):
-            ws.merge_cells(
-                start_row=row_i, start_column=1,
-                end_row=row_i, end_column=4
-            )
-            c = ws.cell(row=row_i, column=1, value=label)
-            c.fill = _fill(primary)
-            c.font = _font(bold=True, colour="FFFFFF", size=10)
-            c.alignment = _center()
+    for row_i, (label, spec) in enumerate(_SUMMARY_ROWS, start=4):
+        if label in _SUMMARY_SECTIONS:
+            ws.merged_cells.add(f"A{row_i}:D{row_i}")
             ws.row_dimensions[row_i].height = 18
+            ws.append([_cell(ws, label, fill=primary_fill, font=HEADER_FONT, alignment=CENTER)])
         elif label == "Metric":
-            for col_i, val in enumerate([label, actual, budget, rag_status], start=1):
-                c = ws.cell(row=row_i, column=col_i, value=val)
-                c.fill = _fill(light)
-                c.font = _font(bold=True, colour="333333", size=9)
-                c.alignment = _center()
-                c.border = THIN_BORDER
+            ws.append([
+                _cell(ws, val, fill=light_fill, font=LABEL_FONT, alignment=CENTER, border=THIN_BORDER)
+                for val in (label, *spec)
+            ])
         elif label == "":
-            pass
+            ws.append([])
         else:
-            for col_i, val in enumerate([label, actual, budget, rag_status], start=1):
-                c = ws.cell(row=row_i, column=col_i, value=val)
-                c.font = _font(size=9)
-                c.alignment = _center()
-                c.border = THIN_BORDER
-                if col_i == 4 and rag_status in rag_colour_map:
-                    c.fill = _fill(rag_colour_map[rag_status])
-                    c.font = _font(bold=True, colour="FFFFFF", size=9)
-
-    for col in range(1, 5):
-        ws.column_dimensions[get_column_letter(col)].width = 28
-
-
-def _sheet_pl(ws, pkg: MetricsPackage, brand: dict, config_path: str) -> None:
+            actual, budget, rag_status = spec(pkg)
+            row = [
+                _cell(ws, val, font=BODY_FONT, alignment=CENTER, border=THIN_BORDER)
+                for val in (label, actual, budget, rag_status)
+            ]
+            if rag_status in rag_fill_map:
+                row[3].fill = rag_fill_map[rag_status]
+                row[3].font = BODY_FONT_WHITE
+            ws.append(row)
+
+
+def _sheet_pl(ws, pkg: MetricsPackage, brand: dict, cfg: dict[str, Any]) -> None:
     """Write the full P&L sheet with actuals, budget, and variances."""
     ws.sheet_properties.tabColor = brand["secondary"].lstrip("#")
 
-    with open(config_path, "r") as fh:
-        cfg = yaml.safe_load(fh)
-
     fin_path = cfg["paths"]["financials_file"]
     if not Path(fin_path).exists():
-        ws["A1"].value = "Run --generate-data first"
+        ws.append(["Run --generate-data first"])
         return
 
-    fin_df = pd.read_csv(fin_path)
+    fin_df = _load_csv(fin_path, _PL_COLUMNS)
     fin_df["variance_gbp"] = fin_df["actual_gbp"] - fin_df["budget_gbp"]
-    fin_df["variance_pct"] = (
-        (fin_df["actual_gbp"] / fin_df["budget_gbp"]) - 1
-    ).replace([float("inf"), float("-inf")], 0).fillna(0)
-    fin_df["yoy_growth_pct"] = (
-        (fin_df["actual_gbp"] / fin_df["prior_year_gbp"]) - 1
-    ).replace([float("inf"), float("-inf")], 0).fillna(0)
+    fin_df["variance_pct"] = _growth(fin_df["actual_gbp"], fin_df["budget_gbp"])
+    fin_df["yoy_growth_pct"] = _growth(fin_df["actual_gbp"], fin_df["prior_year_gbp"])
 
     display_cols = [
         "period", "line_type", "line_name",
@@ -235,24 +383,19 @@ def _sheet_pl(ws, pkg: MetricsPackage, brand: dict, config_path: str) -> None:
         "yoy_growth_pct": "YoY Growth %",
     })
 
-    _write_header_row(ws, 1, list(df_out.columns), brand)
+    headers = list(df_out.columns)
+    rows = list(df_out.itertuples(index=False, name=None))
+    _auto_fit(ws, headers, rows)
     ws.freeze_panes = "A2"
-    ws.auto_filter.ref = f"A1:{get_column_letter(len(df_out.columns))}1"
-
-    for row_i, row in enumerate(
-        dataframe_to_rows(df_out, index=False, header=False), start=2
-    ):
-        for col_i, val in enumerate(row, start=1):
-            c = ws.cell(row=row_i, column=col_i, value=val)
-            c.font = _font(size=9)
-            c.border = THIN_BORDER
-            col_name = df_out.columns[col_i - 1]
-            if "(£)" in col_name:
-                c.number_format = "#,##0"
-            elif "%" in col_name:
-                c.number_format = "0.0%"
-            row_fill = "F9F9F9" if row_i % 2 == 0 else "FFFFFF"
-            c.fill = _fill(row_fill)
+    ws.auto_filter.ref = f"A1:{get_column_letter(len(headers))}1"
+    _write_header_row(ws, headers, brand)
+
+    fmt_keys = ["_money" if "(£)" in h else "_pct" if "%" in h else "" for h in headers]
+    even_styles = [f"body_even{k}" for k in fmt_keys]
+    odd_styles = [f"body_odd{k}" for k in fmt_keys]
+    for row_i, row in enumerate(rows, start=2):
+        styles = even_styles if row_i % 2 == 0 else odd_styles
+        ws.append([_cell(ws, val, style) for val, style in zip(row, styles)])
 
     # Conditional formatting on variance column
     var_col = get_column_letter(df_out.columns.get_loc("Variance (£)") + 1)
@@ -265,94 +408,82 @@ def _sheet_pl(ws, pkg: MetricsPackage, brand: dict, config_path: str) -> None:
             end_type="max", end_color="C6EFCE",
         )
     )
-    _auto_fit(ws)
 
 
-def _sheet_pipeline(ws, brand: dict, config_path: str) -> None:
+def _sheet_pipeline(ws, brand: dict, cfg: dict[str, Any]) -> None:
     """Write the pipeline sheet."""
     ws.sheet_properties.tabColor = brand["accent"].lstrip("#")
-    with open(config_path, "r") as fh:
-        cfg = yaml.safe_load(fh)
     pipe_path = cfg["paths"]["pipeline_file"]
     if not Path(pipe_path).exists():
-        ws["A1"].value = "Run --generate-data first"
+        ws.append(["Run --generate-data first"])
         return
 
-    df = pd.read_csv(pipe_path)
-    df["pipeline_variance_gbp"] = df["pipeline_value_gbp"] - df["budget_pipeline_gbp"]
-    _write_header_row(ws, 1, list(df.columns), brand)
+    header, raw = _load_rows(pipe_path)
+    value_i = header.index("pipeline_value_gbp")
+    budget_i = header.index("budget_pipeline_gbp")
+    headers = [*header, "pipeline_variance_gbp"]
+    rows = [(*r, r[value_i] - r[budget_i]) for r in raw]
+    _auto_fit(ws, headers, rows)
     ws.freeze_panes = "A2"
-    ws.auto_filter.ref = f"A1:{get_column_letter(len(df.columns))}1"
-    for row_i, row in enumerate(
-        dataframe_to_rows(df, index=False, header=False), start=2
-    ):
-        for col_i, val in enumerate(row, start=1):
-            c = ws.cell(row=row_i, column=col_i, value=val)
-            c.font = _font(size=9)
-            c.border = THIN_BORDER
-            if isinstance(val, float) and "gbp" in df.columns[col_i - 1]:
-                c.number_format = "#,##0"
-    _auto_fit(ws)
-
-
-def _sheet_customers(ws, brand: dict, config_path: str) -> None:
+    ws.auto_filter.ref = f"A1:{get_column_letter(len(headers))}1"
+    _write_header_row(ws, headers, brand)
+
+    # Every *_gbp column is parsed as float, so all of them take the money format.
+    styles = ["body_money" if "gbp" in h else "body" for h in headers]
+    for row in rows:
+        ws.append([_cell(ws, val, style) for val, style in zip(row, styles)])
+
+
+def _sheet_customers(ws, brand: dict, cfg: dict[str, Any]) -> None:
     """Write the customer metrics sheet."""
     ws.sheet_properties.tabColor = brand["green"].lstrip("#")
-    with open(config_path, "r") as fh:
-        cfg = yaml.safe_load(fh)
     path = cfg["paths"]["customers_file"]
     if not Path(path).exists():
-        ws["A1"].value = "Run --generate-data first"
+        ws.append(["Run --generate-data first"])
         return
 
-    df = pd.read_csv(path)
-    df["net_arr_gbp"] = df["new_arr_gbp"] - df["churned_arr_gbp"]
-    df["arr_vs_budget_pct"] = (df["arr_gbp"] / df["arr_budget_gbp"] - 1).fillna(0)
-
-    _write_header_row(ws, 1, list(df.columns), brand)
+    header, raw = _load_rows(path)
+    new_i, churned_i = header.index("new_arr_gbp"), header.index("churned_arr_gbp")
+    arr_i, budget_i = header.index("arr_gbp"), header.index("arr_budget_gbp")
+    headers = [*header, "net_arr_gbp", "arr_vs_budget_pct"]
+    rows = [
+        (*r, r[new_i] - r[churned_i], r[arr_i] / r[budget_i] - 1 if r[budget_i] else 0.0)
+        for r in raw
+    ]
+    _auto_fit(ws, headers, rows)
     ws.freeze_panes = "A2"
-    for row_i, row in enumerate(
-        dataframe_to_rows(df, index=False, header=False), start=2
-    ):
-        for col_i, val in enumerate(row, start=1):
-            c = ws.cell(row=row_i, column=col_i, value=val)
-            c.font = _font(size=9)
-            c.border = THIN_BORDER
-    _auto_fit(ws)
+    _write_header_row(ws, headers, brand)
+
+    for row in rows:
+        ws.append([_cell(ws, val, "body") for val in row])
 
 
-def _sheet_headcount(ws, brand: dict, config_path: str) -> None:
+def _sheet_headcount(ws, brand: dict, cfg: dict[str, Any]) -> None:
     """Write the headcount sheet."""
     ws.sheet_properties.tabColor = brand["amber"].lstrip("#")
-    with open(config_path, "r") as fh:
-        cfg = yaml.safe_load(fh)
     path = cfg["paths"]["headcount_file"]
     if not Path(path).exists():
-        ws["A1"].value = "Run --generate-data first"
+        ws.append(["Run --generate-data first"])
         return
 
-    df = pd.read_csv(path)
-    df["hc_variance"] = df["headcount_actual"] - df["headcount_budget"]
-    df["cost_variance_gbp"] = df["cost_actual_gbp"] - df["cost_budget_gbp"]
-
-    _write_header_row(ws, 1, list(df.columns), brand)
+    header, raw = _load_rows(path)
+    hc_a, hc_b = header.index("headcount_actual"), header.index("headcount_budget")
+    cost_a, cost_b = header.index("cost_actual_gbp"), header.index("cost_budget_gbp")
+    headers = [*header, "hc_variance", "cost_variance_gbp"]
+    rows = [(*r, r[hc_a] - r[hc_b], r[cost_a] - r[cost_b]) for r in raw]
+    _auto_fit(ws, headers, rows)
     ws.freeze_panes = "A2"
-    for row_i, row in enumerate(
-        dataframe_to_rows(df, index=False, header=False), start=2
-    ):
-        for col_i, val in enumerate(row, start=1):
-            c = ws.cell(row=row_i, column=col_i, value=val)
-            c.font = _font(size=9)
-            c.border = THIN_BORDER
-            if "cost" in df.columns[col_i - 1]:
-                c.number_format = "#,##0"
-    _auto_fit(ws)
+    _write_header_row(ws, headers, brand)
+
+    styles = ["body_money" if "cost" in h else "body" for h in headers]
+    for row in rows:
+        ws.append([_cell(ws, val, style) for val, style in zip(row, styles)])
 
 
 def _sheet_data_dict(ws, brand: dict) -> None:
     """Write the data dictionary sheet."""
     ws.sheet_properties.tabColor = "888888"
-    primary = brand["primary"].lstrip("#")
+    primary_fill = _fill(brand["primary"])
 
     definitions = [
         ("Sheet", "Column", "Description", "Format"),
@@ -371,22 +502,20 @@ def _sheet_data_dict(ws, brand: dict) -> None:
         ("Headcount", "cost_actual_gbp", "Total payroll cost for the period", "£ integer"),
     ]
 
-    for row_i, row_data in enumerate(definitions, start=1):
-        is_header = row_i == 1
-        for col_i, val in enumerate(row_data, start=1):
-            c = ws.cell(row=row_i, column=col_i, value=val)
-            if is_header:
-                c.fill = _fill(primary)
-                c.font = _font(bold=True, colour="FFFFFF", size=9)
-            else:
-                c.font = _font(size=9)
-                c.fill = _fill("F9F9F9" if row_i % 2 == 0 else "FFFFFF")
-            c.border = THIN_BORDER
-
     col_widths = [12, 30, 65, 18]
     for col_i, w in enumerate(col_widths, start=1):
         ws.column_dimensions[get_column_letter(col_i)].width = w
 
+    for row_i, row_data in enumerate(definitions, start=1):
+        if row_i == 1:
+            ws.append([
+                _cell(ws, val, fill=primary_fill, font=BODY_FONT_WHITE, border=THIN_BORDER)
+                for val in row_data
+            ])
+        else:
+            style = "body_even" if row_i % 2 == 0 else "body_odd"
+            ws.append([_cell(ws, val, style) for val in row_data])
+
 
 # ---------------------------------------------------------------------------
 # Orchestrator
@@ -405,8 +534,7 @@ def generate_excel_pack(
     Returns:
         Path to the generated .xlsx file.
     """
-    with open(config_path, "r") as fh:
-        cfg = yaml.safe_load(fh)
+    cfg = load_config(config_path)
 
     brand = cfg["report"]["brand"]
     output_dir = Path(cfg["paths"]["output_dir"])
@@ -414,15 +542,16 @@ def generate_excel_pack(
     filename = cfg["paths"]["excel_filename"].format(period=pkg.report_period)
     output_path = output_dir / filename
 
-    wb = Workbook()
-    wb.remove(wb.active)
+    _prefetch_csvs(cfg)
+    wb = Workbook(write_only=True)
+    _register_body_styles(wb)
 
     sheets = [
         ("Summary",        lambda ws: _sheet_summary(ws, pkg, brand)),
-        ("P&L",            lambda ws: _sheet_pl(ws, pkg, brand, config_path)),
-        ("Pipeline",       lambda ws: _sheet_pipeline(ws, brand, config_path)),
-        ("Customers",      lambda ws: _sheet_customers(ws, brand, config_path)),
-        ("Headcount",      lambda ws: _sheet_headcount(ws, brand, config_path)),
+        ("P&L",            lambda ws: _sheet_pl(ws, pkg, brand, cfg)),
+        ("Pipeline",       lambda ws: _sheet_pipeline(ws, brand, cfg)),
+        ("Customers",      lambda ws: _sheet_customers(ws, brand, cfg)),
+        ("Headcount",      lambda ws: _sheet_headcount(ws, brand, cfg)),
         ("Data Dictionary",lambda ws: _sheet_data_dict(ws, brand)),
     ]
 
@@ -16,16 +16,72 @@ KPIs computed:
     RAG:         Red/Amber/Green status for each headline KPI
 """
 
+import functools
+import hashlib
 import logging
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
-import yaml
+
+from src.config import load_config
+
+# PyArrow's multithreaded CSV reader is used when installed; pandas' C
+# parser (with the same explicit dtypes) otherwise.
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = pacsv = None
 
 logger = logging.getLogger(__name__)
 
+# Set to "1" to memoise the computed MetricsPackage on disk (paths.metrics_cache_dir).
+_METRICS_CACHE_ENV = "BRG_METRICS_CACHE"
+
+_DATASET_FILES = {
+    "financials": "financials_file",
+    "pipeline":   "pipeline_file",
+    "headcount":  "headcount_file",
+    "customers":  "customers_file",
+}
+
+# Columns the calculators read, with explicit types — everything else in the
+# CSVs is skipped by the parser and there is no inference pass. Types match
+# what pandas inferred before, so every downstream figure is unchanged.
+_DATASET_DTYPES: dict[str, dict[str, str]] = {
+    "financials": {
+        "period": "str", "year": "int64", "month": "int64", "line_type": "str",
+        "budget_gbp": "float64", "actual_gbp": "float64", "prior_year_gbp": "float64",
+    },
+    "pipeline": {
+        "week_start": "str", "stage": "str", "pipeline_value_gbp": "float64",
+        "budget_pipeline_gbp": "float64", "deal_count": "int64", "win_rate_actual": "float64",
+    },
+    "headcount": {
+        "period": "str", "department": "str",
+        "headcount_budget": "int64", "headcount_actual": "int64", "headcount_prior_year": "int64",
+        "cost_budget_gbp": "float64", "cost_actual_gbp": "float64",
+    },
+    "customers": {
+        "period": "str", "arr_gbp": "float64", "arr_budget_gbp": "float64", "new_arr_gbp": "float64",
+        "churned_arr_gbp": "float64", "churn_rate_actual": "float64", "churn_rate_budget": "float64",
+        "nps_actual": "int64", "nps_budget": "int64", "new_customers": "int64", "churned_customers": "int64",
+    },
+}
+
+# ISO date columns parsed to datetime64 once at load; the frame is then
+# stable-sorted on them so date windows are a searchsorted slice.
+_DATE_COLS: dict[str, tuple[str, ...]] = {"pipeline": ("week_start",)}
+
+# Low-cardinality label columns held as pandas categoricals after load.
+_CATEGORY_COLS = frozenset({"line_type", "stage", "department"})
+
 
 # ---------------------------------------------------------------------------
 # Data structures
@@ -239,40 +295,124 @@ def _rag_lower_is_better(
 # Dataset loaders
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=8)
+def _read_dataset(name: str, path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parse one raw CSV (cache key includes mtime/size so regenerated data invalidates)."""
+    dtypes = _DATASET_DTYPES[name]
+    if pacsv is not None:
+        table = pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(block_size=4 << 20),
+            convert_options=pacsv.ConvertOptions(
+                column_types={col: pa.type_for_alias(t) for col, t in dtypes.items()},
+                include_columns=list(dtypes),
+            ),
+        )
+        df = table.to_pandas(split_blocks=True, self_destruct=True)
+    else:
+        df = pd.read_csv(path, usecols=list(dtypes), dtype=dtypes)
+    if name in _DATE_COLS:
+        date_cols = list(_DATE_COLS[name])
+        for col in date_cols:
+            df[col] = pd.to_datetime(df[col])
+        df = df.sort_values(date_cols, kind="stable", ignore_index=True)
+    df = _compact(df)
+    if "period" in df.columns:
+        # Sorted period index: latest/first period are df.index[-1]/[0] and
+        # .loc[p:p] is a binary search instead of a full-column mask.
+        df = df.set_index("period").sort_index(kind="stable")
+    return df
+
+
+def _compact(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink a freshly parsed dataset in place without changing any value.
+
+    Label columns become categoricals and integer columns are downcast to
+    the narrowest signed type that holds them. Money and rate columns stay
+    float64 so every reported figure is bit-for-bit the same.
+
+    Args:
+        df: DataFrame straight from the CSV reader.
+
+    Returns:
+        The same DataFrame.
+    """
+    for col in df.columns:
+        if col in _CATEGORY_COLS:
+            df[col] = df[col].astype("category")
+        elif df[col].dtype == "int64":
+            df[col] = pd.to_numeric(df[col], downcast="signed")
+    return df
+
+
 def _load_datasets(cfg: dict[str, Any]) -> dict[str, pd.DataFrame]:
-    """Load all four CSVs from disk.
+    """Load all four CSVs from disk, memoised per file on (path, mtime, size).
 
     Args:
         cfg: Configuration dict.
 
     Returns:
-        Dict of DataFrames keyed by name.
+        Dict of DataFrames keyed by name (shared with the cache — do not mutate).
+        Monthly datasets are indexed by a sorted ``period`` index.
 
     Raises:
         FileNotFoundError: If any dataset is missing.
     """
-    files = {
-        "financials": cfg["paths"]["financials_file"],
-        "pipeline":   cfg["paths"]["pipeline_file"],
-        "headcount":  cfg["paths"]["headcount_file"],
-        "customers":  cfg["paths"]["customers_file"],
-    }
-    datasets = {}
-    for name, path in files.items():
-        p = Path(path)
+    keys = []
+    for name, key in _DATASET_FILES.items():
+        p = Path(cfg["paths"][key])
         if not p.exists():
             raise FileNotFoundError(
                 f"{name} dataset not found at {p}. Run --generate-data first."
             )
-        datasets[name] = pd.read_csv(p)
-        logger.debug("Loaded %s: %d rows", name, len(datasets[name]))
+        st = p.stat()
+        keys.append((name, str(p.resolve()), st.st_mtime_ns, st.st_size))
+
+    # Cold parses overlap (the C/Arrow parsers release the GIL); the KPI
+    # calculators that follow are small GIL-bound pandas calls and stay serial.
+    with ThreadPoolExecutor(max_workers=len(keys)) as pool:
+        frames = list(pool.map(lambda k: _read_dataset(*k), keys))
+
+    datasets = {}
+    for (name, *_), df in zip(keys, frames):
+        datasets[name] = df
+        logger.debug("Loaded %s: %d rows", name, len(df))
     return datasets
 
 
+def _metrics_cache_file(config_path: str, cfg: dict[str, Any]) -> Path | None:
+    """Return the on-disk cache file for the current config and datasets.
+
+    The name is a BLAKE2b fingerprint of the config file and the four CSVs
+    (absolute path, mtime, size), so any edit or regeneration misses.
+
+    Args:
+        config_path: Path to configuration YAML.
+        cfg: Configuration dict.
+
+    Returns:
+        Cache file path, or None if a dataset is missing.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for path in (config_path, *(cfg["paths"][key] for key in _DATASET_FILES.values())):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        h.update(f"{os.path.abspath(path)}\0{st.st_mtime_ns}\0{st.st_size}\0".encode())
+    cache_dir = Path(cfg["paths"]["metrics_cache_dir"])
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir / f"metrics_{h.hexdigest()}.pkl"
+
+
 # ---------------------------------------------------------------------------
 # KPI calculators
 # ---------------------------------------------------------------------------
 
+_FIN_VALUE_COLS = ("actual_gbp", "budget_gbp", "prior_year_gbp")
+_FIN_LINE_TYPES = ("Revenue", "COGS", "OpEx")
+
+
 def _calc_financial(
     fin: pd.DataFrame,
     cfg: dict[str, Any],
@@ -280,40 +420,45 @@ def _calc_financial(
     """Calculate financial P&L KPIs for the most recent period.
 
     Args:
-        fin: Financials DataFrame.
+        fin: Financials DataFrame (sorted period index).
         cfg: Configuration dict.
 
     Returns:
         FinancialMetrics dataclass.
     """
-    latest_period = fin["period"].max()
+    latest_period = fin.index[-1]
     current_year = pd.to_datetime(latest_period).year
     fy_start_month = cfg["project"]["fiscal_year_start_month"]
 
-    current = fin[fin["period"] == latest_period]
+    # One grouped pass → period × (value column, line type) table; every
+    # current-period, YTD and trend figure below is a lookup into it.
+    agg = (
+        fin.groupby(["period", "line_type"])[list(_FIN_VALUE_COLS)].sum()
+        .unstack("line_type", fill_value=0)
+        .reindex(columns=pd.MultiIndex.from_product([_FIN_VALUE_COLS, _FIN_LINE_TYPES]), fill_value=0)
+    )
+
     ytd_mask = (
         (fin["year"] == current_year)
         & (fin["month"] >= fy_start_month)
-        & (fin["period"] <= latest_period)
     )
-    ytd = fin[ytd_mask]
+    current = agg.loc[latest_period]
+    ytd = agg.loc[fin.index[ytd_mask.to_numpy()].unique()].sum()
 
-    def _sum(df, line_type, col): return df[df["line_type"] == line_type][col].sum()
+    rev_act = current[("actual_gbp", "Revenue")]
+    rev_bud = current[("budget_gbp", "Revenue")]
+    rev_py  = current[("prior_year_gbp", "Revenue")]
 
-    rev_act = _sum(current, "Revenue", "actual_gbp")
-    rev_bud = _sum(current, "Revenue", "budget_gbp")
-    rev_py  = _sum(current, "Revenue", "prior_year_gbp")
-
-    cogs_act = _sum(current, "COGS", "actual_gbp")
-    cogs_bud = _sum(current, "COGS", "budget_gbp")
+    cogs_act = current[("actual_gbp", "COGS")]
+    cogs_bud = current[("budget_gbp", "COGS")]
 
     gross_act = rev_act - cogs_act
     gross_bud = rev_bud - cogs_bud
     gm_act = gross_act / rev_act if rev_act else 0
     gm_bud = gross_bud / rev_bud if rev_bud else 0
 
-    opex_act = _sum(current, "OpEx", "actual_gbp")
-    opex_bud = _sum(current, "OpEx", "budget_gbp")
+    opex_act = current[("actual_gbp", "OpEx")]
+    opex_bud = current[("budget_gbp", "OpEx")]
 
     ebitda_act = gross_act - opex_act
     ebitda_bud = gross_bud - opex_bud
@@ -321,26 +466,20 @@ def _calc_financial(
     em_bud = ebitda_bud / rev_bud if rev_bud else 0
 
     # YTD
-    ytd_rev_act = _sum(ytd, "Revenue", "actual_gbp")
-    ytd_rev_bud = _sum(ytd, "Revenue", "budget_gbp")
-    ytd_ebitda_act = (_sum(ytd, "Revenue", "actual_gbp")
-                      - _sum(ytd, "COGS", "actual_gbp")
-                      - _sum(ytd, "OpEx", "actual_gbp"))
-    ytd_ebitda_bud = (_sum(ytd, "Revenue", "budget_gbp")
-                      - _sum(ytd, "COGS", "budget_gbp")
-                      - _sum(ytd, "OpEx", "budget_gbp"))
-
-    # 12-month trend for charts
-    trend_periods = sorted(fin["period"].unique())[-12:]
-    monthly_rev, monthly_ebitda, monthly_gm = [], [], []
-    for p in trend_periods:
-        pf = fin[fin["period"] == p]
-        r = _sum(pf, "Revenue", "actual_gbp")
-        c = _sum(pf, "COGS", "actual_gbp")
-        o = _sum(pf, "OpEx", "actual_gbp")
-        monthly_rev.append(round(r, 2))
-        monthly_ebitda.append(round(r - c - o, 2))
-        monthly_gm.append(round((r - c) / r * 100 if r else 0, 2))
+    ytd_rev_act, ytd_cogs_act, ytd_opex_act = (ytd[("actual_gbp", lt)] for lt in _FIN_LINE_TYPES)
+    ytd_rev_bud, ytd_cogs_bud, ytd_opex_bud = (ytd[("budget_gbp", lt)] for lt in _FIN_LINE_TYPES)
+    ytd_ebitda_act = ytd_rev_act - ytd_cogs_act - ytd_opex_act
+    ytd_ebitda_bud = ytd_rev_bud - ytd_cogs_bud - ytd_opex_bud
+
+    # 12-month trend for charts (agg's index is the sorted period list)
+    trend = agg["actual_gbp"].iloc[-12:]
+    trend_periods = trend.index
+    rev, cogs, opex = (trend[lt].to_numpy() for lt in _FIN_LINE_TYPES)
+    gross = rev - cogs
+    gm_pct = np.divide(gross, rev, out=np.zeros_like(rev), where=rev != 0) * 100
+    monthly_rev = [round(v, 2) for v in rev.tolist()]
+    monthly_ebitda = [round(v, 2) for v in (gross - opex).tolist()]
+    monthly_gm = [round(v, 2) for v in gm_pct.tolist()]
 
     return FinancialMetrics(
         period=latest_period,
@@ -376,21 +515,26 @@ def _calc_commercial(
     """Calculate sales pipeline KPIs from the last 4 weeks of data.
 
     Args:
-        pipeline_df: Pipeline DataFrame.
-        fin: Financials DataFrame (for coverage ratio denominator).
+        pipeline_df: Pipeline DataFrame (``week_start`` datetime64, sorted, as
+            loaded by ``_read_dataset``; raw string dates are parsed on a copy).
+        fin: Financials DataFrame (sorted period index; coverage ratio denominator).
         cfg: Configuration dict.
 
     Returns:
         CommercialMetrics dataclass.
     """
     sim = cfg["data_simulation"]
-    pipeline_df = pipeline_df.copy()
-    pipeline_df["week_start"] = pd.to_datetime(pipeline_df["week_start"])
-
-    latest_week = pipeline_df["week_start"].max()
-    recent_4w = pipeline_df[
-        pipeline_df["week_start"] >= latest_week - pd.Timedelta(weeks=3)
-    ]
+    # Parsed once by _read_dataset; the frame is shared, so it is never mutated
+    # here. A caller passing raw string dates gets a parsed, sorted copy.
+    if not pd.api.types.is_datetime64_any_dtype(pipeline_df["week_start"]):
+        pipeline_df = pipeline_df.assign(
+            week_start=pd.to_datetime(pipeline_df["week_start"])
+        ).sort_values("week_start", kind="stable", ignore_index=True)
+
+    # Sorted on week_start at load: the 4-week window is a tail slice.
+    weeks = pipeline_df["week_start"].to_numpy()
+    latest_week = pipeline_df["week_start"].iat[-1]
+    recent_4w = pipeline_df.iloc[weeks.searchsorted(weeks[-1] - np.timedelta64(3, "W")):]
 
     total_pipe = recent_4w["pipeline_value_gbp"].sum()
     total_pipe_budget = recent_4w["budget_pipeline_gbp"].sum()
@@ -399,10 +543,8 @@ def _calc_commercial(
     win_rate = recent_4w["win_rate_actual"].mean()
 
     # Pipeline coverage = total pipeline / quarterly revenue target
-    latest_period = fin["period"].max()
-    current_rev = fin[
-        (fin["period"] == latest_period) & (fin["line_type"] == "Revenue")
-    ]["budget_gbp"].sum()
+    latest_fin = fin.loc[fin.index[-1]:]
+    current_rev = latest_fin.loc[latest_fin["line_type"] == "Revenue", "budget_gbp"].sum()
     quarterly_rev_target = current_rev * 3
     coverage = total_pipe / quarterly_rev_target if quarterly_rev_target else 0
 
@@ -411,13 +553,9 @@ def _calc_commercial(
     )
 
     # 12-week trend
-    weeks_12 = pipeline_df["week_start"].unique()
-    weeks_12 = sorted(weeks_12)[-12:]
-    trend_vals, trend_labels = [], []
-    for w in weeks_12:
-        wf = pipeline_df[pipeline_df["week_start"] == w]
-        trend_vals.append(round(wf["pipeline_value_gbp"].sum(), 2))
-        trend_labels.append(pd.Timestamp(w).strftime("%Y-%m-%d"))
+    weekly = pipeline_df.groupby("week_start")["pipeline_value_gbp"].sum().iloc[-12:]
+    trend_vals = [round(v, 2) for v in weekly.tolist()]
+    trend_labels = weekly.index.strftime("%Y-%m-%d").tolist()
 
     return CommercialMetrics(
         period=latest_week.strftime("%Y-%m-%d"),
@@ -441,35 +579,35 @@ def _calc_customers(
     """Calculate ARR and customer health KPIs.
 
     Args:
-        cust: Customers DataFrame.
+        cust: Customers DataFrame (sorted period index, one row per period).
         cfg: Configuration dict.
 
     Returns:
         CustomerMetrics dataclass.
     """
-    latest_period = cust["period"].max()
-    current = cust[cust["period"] == latest_period].iloc[0]
-    prior_period = sorted(cust["period"].unique())[-2] if len(cust) > 1 else None
-    prior_year = cust[cust["period"] == cust["period"].min()].iloc[0] if len(cust) else None
+    # First row per period; every lookup below is positional on this frame.
+    by_period = cust[~cust.index.duplicated()]
+    latest_period = by_period.index[-1]
+    # Latest row unboxed to Python floats in one pass (all remaining columns
+    # are numeric) instead of a float()/round() per Series lookup.
+    current = dict(zip(by_period.columns, by_period.iloc[-1].tolist()))
 
-    arr_py = float(prior_year["arr_gbp"]) if prior_year is not None else 0
+    arr_py = float(by_period["arr_gbp"].iat[0]) if len(by_period) else 0
 
-    trend_periods = sorted(cust["period"].unique())[-12:]
-    arr_trend = [
-        round(float(cust[cust["period"] == p]["arr_gbp"].iloc[0]), 2)
-        for p in trend_periods
-    ]
+    trend = by_period["arr_gbp"].iloc[-12:]
+    trend_periods = trend.index.tolist()
+    arr_trend = [round(v, 2) for v in trend.tolist()]
 
     return CustomerMetrics(
         period=latest_period,
-        arr_actual=round(float(current["arr_gbp"]), 2),
-        arr_budget=round(float(current["arr_budget_gbp"]), 2),
+        arr_actual=round(current["arr_gbp"], 2),
+        arr_budget=round(current["arr_budget_gbp"], 2),
         arr_prior_year=round(arr_py, 2),
-        new_arr_gbp=round(float(current["new_arr_gbp"]), 2),
-        churned_arr_gbp=round(float(current["churned_arr_gbp"]), 2),
-        net_arr_movement=round(float(current["new_arr_gbp"]) - float(current["churned_arr_gbp"]), 2),
-        churn_rate_actual=round(float(current["churn_rate_actual"]), 5),
-        churn_rate_budget=float(current["churn_rate_budget"]),
+        new_arr_gbp=round(current["new_arr_gbp"], 2),
+        churned_arr_gbp=round(current["churned_arr_gbp"], 2),
+        net_arr_movement=round(current["new_arr_gbp"] - current["churned_arr_gbp"], 2),
+        churn_rate_actual=round(current["churn_rate_actual"], 5),
+        churn_rate_budget=current["churn_rate_budget"],
         nps_actual=int(current["nps_actual"]),
         nps_budget=int(current["nps_budget"]),
         new_customers=int(current["new_customers"]),
@@ -486,16 +624,15 @@ def _calc_headcount(
     """Calculate headcount and people-cost KPIs.
 
     Args:
-        hc: Headcount DataFrame.
+        hc: Headcount DataFrame (sorted period index).
         cfg: Configuration dict.
 
     Returns:
         HeadcountMetrics dataclass.
     """
-    latest_period = hc["period"].max()
-    current = hc[hc["period"] == latest_period]
-    prior_year_period = sorted(hc["period"].unique())[0]
-    prior_year = hc[hc["period"] == prior_year_period]
+    latest_period = hc.index[-1]
+    current = hc.loc[latest_period:]
+    prior_year = hc.loc[:hc.index[0]]
 
     total_act = int(current["headcount_actual"].sum())
     total_bud = int(current["headcount_budget"].sum())
@@ -507,20 +644,18 @@ def _calc_headcount(
     cph_act = cost_act / total_act if total_act else 0
     cph_bud = cost_bud / total_bud if total_bud else 0
 
-    by_dept = {}
-    for _, row in current.iterrows():
-        by_dept[row["department"]] = {
-            "actual": int(row["headcount_actual"]),
-            "budget": int(row["headcount_budget"]),
-            "variance": int(row["headcount_actual"]) - int(row["headcount_budget"]),
-        }
+    by_dept = (
+        current.set_index("department")[["headcount_actual", "headcount_budget"]]
+        .set_axis(["actual", "budget"], axis=1)
+        .astype("int64")
+        .assign(variance=lambda d: d["actual"] - d["budget"])
+        .to_dict("index")
+    )
 
     # 12-month trend
-    trend_periods = sorted(hc["period"].unique())[-12:]
-    hc_trend = [
-        int(hc[hc["period"] == p]["headcount_actual"].sum())
-        for p in trend_periods
-    ]
+    trend = hc.groupby("period")["headcount_actual"].sum().iloc[-12:]
+    trend_periods = trend.index.tolist()
+    hc_trend = trend.tolist()
 
     return HeadcountMetrics(
         period=latest_period,
@@ -610,7 +745,10 @@ def _build_rag_dashboard(
 def compute_metrics(config_path: str = "config.yaml") -> MetricsPackage:
     """Load datasets and compute the full metrics package.
 
-    This is the single public entry point for the metrics module.
+    This is the single public entry point for the metrics module. Parsed
+    CSVs are memoised in-process per file; with BRG_METRICS_CACHE=1 the
+    whole package is also pickled to paths.metrics_cache_dir and reused
+    until the config or any dataset changes.
 
     Args:
         config_path: Path to configuration YAML.
@@ -618,8 +756,19 @@ def compute_metrics(config_path: str = "config.yaml") -> MetricsPackage:
     Returns:
         Complete MetricsPackage for the most recent reporting period.
     """
-    with open(config_path, "r") as fh:
-        cfg = yaml.safe_load(fh)
+    cfg = load_config(config_path)
+
+    cache_file = None
+    if os.environ.get(_METRICS_CACHE_ENV) == "1":
+        cache_file = _metrics_cache_file(config_path, cfg)
+        if cache_file is not None and cache_file.exists():
+            try:
+                with open(cache_file, "rb") as fh:
+                    pkg = pickle.load(fh)
+                logger.info("Metrics for %s served from cache (%s)", pkg.report_period, cache_file.name)
+                return pkg
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as exc:
+                logger.warning("Ignoring unreadable metrics cache %s: %s", cache_file, exc)
 
     datasets = _load_datasets(cfg)
     fin_df = datasets["financials"]
@@ -627,7 +776,7 @@ def compute_metrics(config_path: str = "config.yaml") -> MetricsPackage:
     hc_df = datasets["headcount"]
     cust_df = datasets["customers"]
 
-    logger.info("Computing KPIs for period: %s", fin_df["period"].max())
+    logger.info("Computing KPIs for period: %s", fin_df.index[-1])
 
     fin = _calc_financial(fin_df, cfg)
     comm = _calc_commercial(pipe_df, fin_df, cfg)
@@ -653,4 +802,10 @@ def compute_metrics(config_path: str = "config.yaml") -> MetricsPackage:
         fin.ebitda_margin_pct_actual * 100,
         cust.arr_actual,
     )
+
+    if cache_file is not None:
+        tmp = cache_file.with_suffix(".tmp")
+        with open(tmp, "wb") as fh:
+            pickle.dump(pkg, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)
     return pkg
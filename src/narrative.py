@@ -13,13 +13,16 @@ All output is boardroom-appropriate financial language — no raw code values
 are presented to the reader without context or formatting.
 """
 
+import bisect
+import functools
 import logging
+import os
+import string
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
-
-import yaml
+from typing import Any, Callable
 
+from src.config import load_config, load_yaml
 from src.metrics import MetricsPackage
 
 logger = logging.getLogger(__name__)
@@ -29,9 +32,18 @@ logger = logging.getLogger(__name__)
 # Data structure
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class RiskEntry:
+    """One risk register row from narrative.yaml (immutable, picklable)."""
+    risk: str
+    detail: str
+    mitigation: str
+    rating: str
+
+
+@dataclass(slots=True, frozen=True)
 class NarrativePackage:
-    """One commentary block per report section."""
+    """One commentary block per report section (immutable once generated)."""
     period: str
     company_name: str
     executive_summary: str
@@ -40,13 +52,18 @@ class NarrativePackage:
     customer_metrics: str
     operational_metrics: str
     outlook_and_risks: str
-    risk_register: list[dict]
+    risk_register: tuple[RiskEntry, ...]
 
 
 # ---------------------------------------------------------------------------
 # Formatting helpers
 # ---------------------------------------------------------------------------
 
+# _gbp and _pp are memoised: sections format the same headline figures
+# repeatedly. _pct is not — its cache key could not tell 0.0 from -0.0,
+# which it renders differently ("+0.0%" vs "+-0.0%").
+
+@functools.lru_cache(maxsize=1024)
 def _gbp(value: float, units: str = "full") -> str:
     """Format a GBP value as a clean string for board reports.
 
@@ -67,6 +84,11 @@ def _gbp(value: float, units: str = "full") -> str:
         return f"{sign}£{abs_val:,.0f}"
 
 
+# (plain, signed) bound str.format methods for the common precisions — saves
+# rebuilding the nested format spec on every call.
+_PCT_FORMATS = {d: (f"{{:.{d}f}}%".format, f"+{{:.{d}f}}%".format) for d in range(4)}
+
+
 def _pct(value: float, sign: bool = True, decimals: int = 1) -> str:
     """Format a float as a percentage string.
 
@@ -79,10 +101,15 @@ def _pct(value: float, sign: bool = True, decimals: int = 1) -> str:
         Formatted percentage string.
     """
     pct_val = value * 100
-    prefix = "+" if sign and pct_val >= 0 else ""
-    return f"{prefix}{pct_val:.{decimals}f}%"
+    formats = _PCT_FORMATS.get(decimals)
+    if formats is None:
+        prefix = "+" if sign and pct_val >= 0 else ""
+        return f"{prefix}{pct_val:.{decimals}f}%"
+    plain, signed = formats
+    return signed(pct_val) if sign and pct_val >= 0 else plain(pct_val)
 
 
+@functools.lru_cache(maxsize=1024)
 def _pp(value: float) -> str:
     """Format a float as percentage-points (pp) difference.
 
@@ -100,24 +127,110 @@ def _above_below(value: float, budget: float) -> str:
     return "above" if value >= budget else "below"
 
 
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_template(tmpl: str) -> Callable[..., str]:
+    """Pre-parse a ``str.format`` template into a reusable renderer.
+
+    The template is split into (literal, field, spec, conversion) segments
+    once; the returned callable takes the same keyword arguments as
+    ``tmpl.format(**kwargs)`` and produces the same text without re-parsing.
+    Templates using positional, attribute or index fields, or nested
+    ``{...}`` inside a format spec, fall back to ``tmpl.format``.
+
+    Args:
+        tmpl: Template text with ``{name}`` / ``{name:spec}`` placeholders.
+
+    Returns:
+        Callable rendering the template from keyword arguments.
+    """
+    segments = tuple(string.Formatter().parse(tmpl))
+    for _, field, spec, _ in segments:
+        if field is not None and (not field.isidentifier() or "{" in spec):
+            return tmpl.format
+
+    def _render(**kw: Any) -> str:
+        parts = []
+        for literal, field, spec, conversion in segments:
+            parts.append(literal)
+            if field is not None:
+                value = kw[field]
+                if conversion:
+                    value = _CONVERSIONS[conversion](value)
+                parts.append(format(value, spec))
+        return "".join(parts)
+
+    return _render
+
+
+@functools.lru_cache(maxsize=8)
+def _read_templates(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse narrative.yaml and attach the frozen risk register.
+
+    The register is built once per (path, mtime) as a tuple of RiskEntry
+    under ``_frozen_risk_register``; every NarrativePackage shares that one
+    object, which cannot be mutated through a package and still pickles for
+    main.py's forked output stages.
+    """
+    templates = dict(load_yaml(path))
+    templates["_frozen_risk_register"] = tuple(
+        RiskEntry(
+            risk=risk.get("risk", ""),
+            detail=risk.get("detail", ""),
+            mitigation=risk.get("mitigation", ""),
+            rating=risk.get("rating", "Low"),
+        )
+        for risk in templates["outlook_and_risks"]["risk_register"]
+    )
+    return templates
+
+
 def _load_templates(templates_dir: str = "templates") -> dict[str, Any]:
-    """Load narrative templates from narrative.yaml.
+    """Load narrative templates from narrative.yaml (cached on path and mtime).
 
     Args:
         templates_dir: Directory containing narrative.yaml.
 
     Returns:
-        Parsed template dictionary.
+        Parsed template dictionary (shared — do not mutate).
     """
-    path = Path(templates_dir) / "narrative.yaml"
-    with open(path, "r") as fh:
-        return yaml.safe_load(fh)
+    path = os.path.abspath(Path(templates_dir) / "narrative.yaml")
+    return _read_templates(path, os.stat(path).st_mtime_ns)
 
 
 # ---------------------------------------------------------------------------
 # Section generators
 # ---------------------------------------------------------------------------
 
+# Revenue variance bands: bisect_right(_REV_BANDS, variance_pct) gives
+# 0 (< -8%), 1 (-8% to -2%) or 2 (>= -2%), indexing the variant tuples below.
+_REV_BANDS = (-0.08, -0.02)
+_EXEC_SUMMARY_VARIANTS = ("red_material_miss", "amber_slight_miss", "green_above_budget")
+_REVENUE_NARRATIVE_VARIANTS = ("below_budget", "on_budget", "above_budget")
+_PIPELINE_VARIANTS = {"Green": "strong_pipeline"}  # any other status → weak_pipeline
+
+# Fixed commentary phrases substituted into the templates.
+# Weakest revenue line — simplified: a fixed label based on seasonal patterns.
+_WEAK_REVENUE_LINE = "Professional Services"
+_SAAS_COMMENT_AHEAD = (
+    "SaaS Subscriptions, the largest revenue line, continued to grow ahead of plan "
+    "supported by strong net retention."
+)
+_SAAS_COMMENT_BEHIND = (
+    "SaaS Subscriptions performed in line with expectations, whilst Professional "
+    "Services was impacted by delayed project commencements."
+)
+_GM_DRIVER_FAVOURABLE = "a favourable SaaS revenue mix shift reducing blended COGS"
+_GM_DRIVER_ADVERSE = "higher-than-anticipated Professional Services delivery costs"
+_GM_PRESSURE = "elevated PS delivery costs and headcount phasing"
+_NPS_TREND_COMMENT = (
+    "strong customer satisfaction and reflects continued investment in "
+    "product and customer success"
+)
+
+
 def _gen_executive_summary(
     pkg: MetricsPackage,
     templates: dict[str, Any],
@@ -136,19 +249,8 @@ def _gen_executive_summary(
     cust = pkg.customers
     rag = pkg.rag
 
-    tmpl_set = templates["executive_summary"]
-    rev_variance_pct = rag.revenue.variance_pct
-
-    if rev_variance_pct >= -0.02:
-        tmpl = tmpl_set["green_above_budget"]
-    elif rev_variance_pct >= -0.08:
-        tmpl = tmpl_set["amber_slight_miss"]
-    else:
-        tmpl = tmpl_set["red_material_miss"]
-
-    # Identify weakest revenue line from the financial data
-    # (simplified: use the label based on seasonal patterns)
-    weak_line = "Professional Services"
+    band = bisect.bisect_right(_REV_BANDS, rag.revenue.variance_pct)
+    tmpl = templates["executive_summary"][_EXEC_SUMMARY_VARIANTS[band]]
 
     ebitda_vs_budget_abs = fin.ebitda_actual - fin.ebitda_budget
     ebitda_vs_budget_str = (
@@ -156,7 +258,7 @@ def _gen_executive_summary(
         f"{'ahead of' if ebitda_vs_budget_abs >= 0 else 'behind'}"
     )
 
-    text = tmpl.format(
+    text = _compile_template(tmpl)(
         company=pkg.company_name,
         period=fin.period,
         rev_actual=_gbp(fin.revenue_actual, "m"),
@@ -170,7 +272,7 @@ def _gen_executive_summary(
         coverage_ratio=f"{comm.pipeline_coverage_ratio:.1f}",
         arr=_gbp(cust.arr_actual, "m"),
         win_rate_pct=_pct(comm.win_rate_actual, sign=False),
-        weak_revenue_line=weak_line,
+        weak_revenue_line=_WEAK_REVENUE_LINE,
     )
     return text.strip()
 
@@ -194,31 +296,23 @@ def _gen_financial_performance(
 
     # Revenue paragraph
     rev_rag = rag.revenue
-    if rev_rag.variance_pct >= -0.02:
-        rev_tmpl = tmpl["revenue_narrative"]["above_budget"]
-    elif rev_rag.variance_pct >= -0.08:
-        rev_tmpl = tmpl["revenue_narrative"]["on_budget"]
-    else:
-        rev_tmpl = tmpl["revenue_narrative"]["below_budget"]
-
-    yoy_growth = (fin.revenue_actual / fin.revenue_prior_year - 1) if fin.revenue_prior_year else 0
-    saas_comment = (
-        "SaaS Subscriptions, the largest revenue line, continued to grow ahead of plan "
-        "supported by strong net retention."
-        if rev_rag.variance_pct >= 0
-        else "SaaS Subscriptions performed in line with expectations, whilst Professional "
-             "Services was impacted by delayed project commencements."
-    )
+    rev_variance_pct = rev_rag.variance_pct
+    rev_actual, rev_py = fin.revenue_actual, fin.revenue_prior_year
+    band = bisect.bisect_right(_REV_BANDS, rev_variance_pct)
+    rev_tmpl = tmpl["revenue_narrative"][_REVENUE_NARRATIVE_VARIANTS[band]]
 
-    rev_para = rev_tmpl.format(
-        rev_actual=_gbp(fin.revenue_actual, "m"),
+    yoy_growth = (rev_actual / rev_py - 1) if rev_py else 0
+    saas_comment = _SAAS_COMMENT_AHEAD if rev_variance_pct >= 0 else _SAAS_COMMENT_BEHIND
+
+    rev_para = _compile_template(rev_tmpl)(
+        rev_actual=_gbp(rev_actual, "m"),
         rev_budget=_gbp(fin.revenue_budget, "m"),
         rev_variance_abs=_gbp(abs(rev_rag.variance_abs), "k"),
-        rev_variance_pct=_pct(rev_rag.variance_pct),
-        rev_prior_year=_gbp(fin.revenue_prior_year, "m"),
+        rev_variance_pct=_pct(rev_variance_pct),
+        rev_prior_year=_gbp(rev_py, "m"),
         yoy_growth_pct=_pct(yoy_growth, sign=False),
         annual_growth_target="14",
-        weak_revenue_line="Professional Services",
+        weak_revenue_line=_WEAK_REVENUE_LINE,
         line_variance_pct=_pct(-0.07),
         root_cause_placeholder="extended enterprise procurement cycles",
         saas_comment=saas_comment,
@@ -228,53 +322,50 @@ def _gen_financial_performance(
     ebitda_margin_actual = fin.ebitda_margin_pct_actual
     ebitda_margin_budget = fin.ebitda_margin_pct_budget
     margin_diff_pp = ebitda_margin_actual - ebitda_margin_budget
-    gm_driver = (
-        "a favourable SaaS revenue mix shift reducing blended COGS"
-        if fin.gross_margin_pct_actual >= fin.gross_margin_pct_budget
-        else "higher-than-anticipated Professional Services delivery costs"
-    )
-    gm_pressure = "elevated PS delivery costs and headcount phasing"
+    gm_actual = fin.gross_margin_pct_actual
+    opex_actual, opex_budget = fin.opex_actual, fin.opex_budget
+    gm_driver = _GM_DRIVER_FAVOURABLE if gm_actual >= fin.gross_margin_pct_budget else _GM_DRIVER_ADVERSE
 
     if ebitda_margin_actual >= 0.12:
         ebitda_tmpl = tmpl["ebitda_narrative"]["healthy_margin"]
     else:
         ebitda_tmpl = tmpl["ebitda_narrative"]["compressed_margin"]
 
-    ebitda_para = ebitda_tmpl.format(
+    ebitda_para = _compile_template(ebitda_tmpl)(
         ebitda_actual=_gbp(fin.ebitda_actual, "k"),
-        ebitda_margin_pct=_pct(fin.ebitda_margin_pct_actual, sign=False),
-        ebitda_budget_margin_pct=_pct(fin.ebitda_margin_pct_budget, sign=False),
+        ebitda_margin_pct=_pct(ebitda_margin_actual, sign=False),
+        ebitda_budget_margin_pct=_pct(ebitda_margin_budget, sign=False),
         ebitda_budget=_gbp(fin.ebitda_budget, "k"),
         margin_vs_budget_pp=_pp(margin_diff_pp),
         above_below=_above_below(ebitda_margin_actual, ebitda_margin_budget),
-        gross_margin_pct=_pct(fin.gross_margin_pct_actual, sign=False),
-        opex_actual=_gbp(fin.opex_actual, "m"),
-        opex_variance_pct=_pct(
-            (fin.opex_actual / fin.opex_budget - 1) if fin.opex_budget else 0
-        ),
-        above_below_opex=_above_below(fin.opex_actual, fin.opex_budget),
+        gross_margin_pct=_pct(gm_actual, sign=False),
+        opex_actual=_gbp(opex_actual, "m"),
+        opex_variance_pct=_pct((opex_actual / opex_budget - 1) if opex_budget else 0),
+        above_below_opex=_above_below(opex_actual, opex_budget),
         opex_driver="phased headcount additions in Engineering",
         gm_driver=gm_driver,
-        gm_pressure=gm_pressure,
+        gm_pressure=_GM_PRESSURE,
     ).strip()
 
     # YTD paragraph
-    ytd_rev_var = (fin.ytd_revenue_actual / fin.ytd_revenue_budget - 1) if fin.ytd_revenue_budget else 0
-    ytd_ebitda_margin = fin.ytd_ebitda_actual / fin.ytd_revenue_actual if fin.ytd_revenue_actual else 0
-    ytd_plan_ebitda = fin.ytd_ebitda_budget / fin.ytd_revenue_budget if fin.ytd_revenue_budget else 0
+    ytd_rev_actual, ytd_rev_budget = fin.ytd_revenue_actual, fin.ytd_revenue_budget
+    ytd_ebitda_actual = fin.ytd_ebitda_actual
+    ytd_rev_var = (ytd_rev_actual / ytd_rev_budget - 1) if ytd_rev_budget else 0
+    ytd_ebitda_margin = ytd_ebitda_actual / ytd_rev_actual if ytd_rev_actual else 0
+    ytd_plan_ebitda = fin.ytd_ebitda_budget / ytd_rev_budget if ytd_rev_budget else 0
     ytd_margin_diff = ytd_ebitda_margin - ytd_plan_ebitda
     ytd_vs_plan = f"{_pp(abs(ytd_margin_diff))} {'ahead of' if ytd_margin_diff >= 0 else 'behind'}"
 
-    ytd_para = tmpl["ytd_comment"].format(
-        ytd_rev_actual=_gbp(fin.ytd_revenue_actual, "m"),
-        ytd_rev_budget=_gbp(fin.ytd_revenue_budget, "m"),
+    ytd_para = _compile_template(tmpl["ytd_comment"])(
+        ytd_rev_actual=_gbp(ytd_rev_actual, "m"),
+        ytd_rev_budget=_gbp(ytd_rev_budget, "m"),
         ytd_rev_variance_pct=_pct(ytd_rev_var),
-        ytd_ebitda_actual=_gbp(fin.ytd_ebitda_actual, "m"),
+        ytd_ebitda_actual=_gbp(ytd_ebitda_actual, "m"),
         ytd_ebitda_margin_pct=_pct(ytd_ebitda_margin, sign=False),
         ytd_margin_vs_plan=ytd_vs_plan,
     ).strip()
 
-    return f"{rev_para}\n\n{ebitda_para}\n\n{ytd_para}"
+    return "\n\n".join((rev_para, ebitda_para, ytd_para))
 
 
 def _gen_commercial(
@@ -294,21 +385,18 @@ def _gen_commercial(
     rag = pkg.rag
     tmpl = templates["commercial_performance"]
 
-    win_rate_diff = comm.win_rate_actual - comm.win_rate_budget
-    pipeline_rag = rag.pipeline_coverage.status
-
-    if pipeline_rag == "Green":
-        pipe_tmpl = tmpl["pipeline_narrative"]["strong_pipeline"]
-    else:
-        pipe_tmpl = tmpl["pipeline_narrative"]["weak_pipeline"]
+    win_rate, win_rate_budget = comm.win_rate_actual, comm.win_rate_budget
+    win_rate_diff = win_rate - win_rate_budget
+    variant = _PIPELINE_VARIANTS.get(rag.pipeline_coverage.status, "weak_pipeline")
+    pipe_tmpl = tmpl["pipeline_narrative"][variant]
 
-    text = pipe_tmpl.format(
+    text = _compile_template(pipe_tmpl)(
         pipeline_total=_gbp(comm.total_pipeline_gbp, "m"),
         coverage_ratio=f"{comm.pipeline_coverage_ratio:.1f}",
         new_pipeline_4w=_gbp(comm.new_pipeline_4w_gbp, "m"),
-        win_rate_pct=_pct(comm.win_rate_actual, sign=False),
+        win_rate_pct=_pct(win_rate, sign=False),
         win_rate_vs_budget_pp=_pp(win_rate_diff),
-        above_below=_above_below(comm.win_rate_actual, comm.win_rate_budget),
+        above_below=_above_below(win_rate, win_rate_budget),
         avg_deal_size=_gbp(comm.avg_deal_size_gbp, "k"),
     )
     return text.strip()
@@ -331,35 +419,33 @@ def _gen_customer_metrics(
     rag = pkg.rag
     tmpl = templates["customer_metrics"]
 
-    churn_vs_budget = "below" if cust.churn_rate_actual <= cust.churn_rate_budget else "above"
+    churn_rate, churn_budget = cust.churn_rate_actual, cust.churn_rate_budget
+    net_arr_movement = cust.net_arr_movement
+    churn_vs_budget = "below" if churn_rate <= churn_budget else "above"
 
-    if cust.net_arr_movement >= 0:
+    if net_arr_movement >= 0:
         arr_tmpl = tmpl["arr_narrative"]["growing_arr"]
-        nps_trend = (
-            "strong customer satisfaction and reflects continued investment in "
-            "product and customer success"
-        )
-        text = arr_tmpl.format(
+        text = _compile_template(arr_tmpl)(
             arr=_gbp(cust.arr_actual, "m"),
             period=cust.period,
-            net_arr_movement=_gbp(cust.net_arr_movement, "k"),
+            net_arr_movement=_gbp(net_arr_movement, "k"),
             new_arr=_gbp(cust.new_arr_gbp, "k"),
             churned_arr=_gbp(cust.churned_arr_gbp, "k"),
-            churn_rate_pct=_pct(cust.churn_rate_actual, sign=False),
+            churn_rate_pct=_pct(churn_rate, sign=False),
             churn_vs_budget=churn_vs_budget,
-            churn_budget_pct=_pct(cust.churn_rate_budget, sign=False),
+            churn_budget_pct=_pct(churn_budget, sign=False),
             nps=str(cust.nps_actual),
-            nps_trend_comment=nps_trend,
+            nps_trend_comment=_NPS_TREND_COMMENT,
         )
     else:
         arr_tmpl = tmpl["arr_narrative"]["declining_arr"]
-        text = arr_tmpl.format(
+        text = _compile_template(arr_tmpl)(
             arr=_gbp(cust.arr_actual, "m"),
-            net_arr_movement_abs=_gbp(abs(cust.net_arr_movement), "k"),
+            net_arr_movement_abs=_gbp(abs(net_arr_movement), "k"),
             new_arr=_gbp(cust.new_arr_gbp, "k"),
             churned_arr=_gbp(cust.churned_arr_gbp, "k"),
-            churn_rate_pct=_pct(cust.churn_rate_actual, sign=False),
-            churn_budget_pct=_pct(cust.churn_rate_budget, sign=False),
+            churn_rate_pct=_pct(churn_rate, sign=False),
+            churn_budget_pct=_pct(churn_budget, sign=False),
         )
     return text.strip()
 
@@ -380,18 +466,20 @@ def _gen_operational(
     hc = pkg.headcount
     tmpl = templates["operational_metrics"]
 
-    hc_variance = hc.total_hc_actual - hc.total_hc_budget
+    total_hc, hc_budget = hc.total_hc_actual, hc.total_hc_budget
+    monthly_cost = hc.total_cost_actual
+    hc_variance = total_hc - hc_budget
     eng_hc = hc.by_department.get("Engineering", {}).get("actual", "N/A")
 
-    annualised_cost = hc.total_cost_actual * 12
+    annualised_cost = monthly_cost * 12
 
-    text = tmpl["headcount_narrative"]["in_budget"].format(
-        total_hc=str(hc.total_hc_actual),
+    text = _compile_template(tmpl["headcount_narrative"]["in_budget"])(
+        total_hc=str(total_hc),
         hc_variance=str(abs(hc_variance)),
-        above_below=_above_below(float(hc.total_hc_actual), float(hc.total_hc_budget)),
-        hc_budget=str(hc.total_hc_budget),
+        above_below=_above_below(float(total_hc), float(hc_budget)),
+        hc_budget=str(hc_budget),
         eng_hc=str(eng_hc),
-        monthly_cost=_gbp(hc.total_cost_actual, "m"),
+        monthly_cost=_gbp(monthly_cost, "m"),
         annualised_cost=_gbp(annualised_cost, "m"),
         annual_cost_budget=_gbp(hc.total_cost_budget * 12, "m"),
         cph=_gbp(hc.cost_per_head_actual, "k"),
@@ -416,7 +504,7 @@ def _gen_outlook(
     comm = pkg.commercial
     tmpl = templates["outlook_and_risks"]
 
-    text = tmpl["standard"].format(
+    text = _compile_template(tmpl["standard"])(
         coverage_ratio=f"{comm.pipeline_coverage_ratio:.1f}",
     )
     return text.strip()
@@ -426,26 +514,25 @@ def _gen_outlook(
 # Orchestrator
 # ---------------------------------------------------------------------------
 
-def generate_narrative(
+def _templates_for(config_path: str) -> dict[str, Any]:
+    """Return the narrative templates configured by ``paths.templates_dir``."""
+    cfg = load_config(config_path)
+    return _load_templates(cfg.get("paths", {}).get("templates_dir", "templates"))
+
+
+def _build_narrative(
     pkg: MetricsPackage,
-    config_path: str = "config.yaml",
+    templates: dict[str, Any],
 ) -> NarrativePackage:
-    """Generate the complete board narrative package from metrics.
+    """Render every section of one report from already-loaded templates.
 
     Args:
-        pkg: MetricsPackage from metrics.compute_metrics().
-        config_path: Path to configuration YAML (used for templates_dir).
+        pkg: Full metrics package.
+        templates: Loaded template dictionary.
 
     Returns:
         NarrativePackage with one text block per report section.
     """
-    import yaml as _yaml
-    with open(config_path, "r") as fh:
-        cfg = _yaml.safe_load(fh)
-
-    templates_dir = cfg.get("paths", {}).get("templates_dir", "templates")
-    templates = _load_templates(templates_dir)
-
     logger.info("Generating narrative for period %s", pkg.report_period)
 
     exec_summary = _gen_executive_summary(pkg, templates)
@@ -454,7 +541,7 @@ def generate_narrative(
     customer = _gen_customer_metrics(pkg, templates)
     operational = _gen_operational(pkg, templates)
     outlook = _gen_outlook(pkg, templates)
-    risk_register = templates["outlook_and_risks"]["risk_register"]
+    risk_register = templates["_frozen_risk_register"]
 
     narrative = NarrativePackage(
         period=pkg.report_period,
@@ -474,3 +561,39 @@ def generate_narrative(
         len(exec_summary),
     )
     return narrative
+
+
+def generate_narrative(
+    pkg: MetricsPackage,
+    config_path: str = "config.yaml",
+) -> NarrativePackage:
+    """Generate the complete board narrative package from metrics.
+
+    Args:
+        pkg: MetricsPackage from metrics.compute_metrics().
+        config_path: Path to configuration YAML (used for templates_dir).
+
+    Returns:
+        NarrativePackage with one text block per report section.
+    """
+    return _build_narrative(pkg, _templates_for(config_path))
+
+
+def generate_narratives(
+    pkgs: list[MetricsPackage],
+    config_path: str = "config.yaml",
+) -> list[NarrativePackage]:
+    """Generate narratives for several reporting periods in one pass.
+
+    The config and templates are resolved once for the whole batch rather
+    than once per period.
+
+    Args:
+        pkgs: MetricsPackages, e.g. one per month of history.
+        config_path: Path to configuration YAML (used for templates_dir).
+
+    Returns:
+        One NarrativePackage per input package, in the same order.
+    """
+    templates = _templates_for(config_path)
+    return [_build_narrative(pkg, templates) for pkg in pkgs]
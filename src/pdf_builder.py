@@ -13,31 +13,42 @@ Big-4 consulting deliverable:
     Page 6:  Operational Metrics — headcount chart + people cost commentary
     Page 7:  Outlook & Risk Register table
 
-Charts are rendered as matplotlib PNG byte streams, embedded in the PDF.
+Charts are rendered as matplotlib PNG byte streams, embedded in the PDF; the
+single-bar pipeline chart is drawn directly as ReportLab vector graphics.
 No temp files written to disk — everything passes through BytesIO.
 """
 
+import functools
+import hashlib
 import io
 import logging
+import multiprocessing
+import os
+import pickle
 import textwrap
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 
 import matplotlib
 matplotlib.use("Agg")  # non-interactive backend — no display needed
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
+# The charts use matplotlib's object API (Figure + FigureCanvasAgg), not
+# pyplot's global figure registry, so they are safe to build from any thread.
+# matplotlib.figure (~200 ms to import) is loaded on first use, so cache hits
+# and early-exit paths never pay for it.
 import numpy as np
-import yaml
+from PIL import Image as PILImage
 
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import mm, cm
 from reportlab.platypus import (
     BaseDocTemplate,
+    Flowable,
     Frame,
     Image,
     NextPageTemplate,
@@ -50,8 +61,9 @@ from reportlab.platypus import (
 )
 from reportlab.platypus.flowables import HRFlowable
 
+from src.config import load_config
 from src.metrics import MetricsPackage
-from src.narrative import NarrativePackage
+from src.narrative import NarrativePackage, RiskEntry
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +77,9 @@ MARGIN = 1.8 * cm
 CONTENT_W = PAGE_W - 2 * MARGIN
 
 
+# The brand palette is a handful of strings, so both converters are memoised;
+# the shared Color objects are never mutated by ReportLab.
+@functools.lru_cache(maxsize=64)
 def _hex(h: str):
     """Convert a hex colour string to ReportLab Color."""
     h = h.lstrip("#")
@@ -72,6 +87,7 @@ def _hex(h: str):
     return colors.Color(r / 255, g / 255, b / 255)
 
 
+@functools.lru_cache(maxsize=64)
 def _mpl_hex(h: str) -> str:
     """Return hex with # for matplotlib."""
     return f"#{h.lstrip('#')}"
@@ -82,16 +98,23 @@ def _mpl_hex(h: str) -> str:
 # ---------------------------------------------------------------------------
 
 def _build_styles(brand: dict) -> dict[str, ParagraphStyle]:
-    """Create all paragraph styles used in the report.
+    """Return the paragraph styles used in the report.
 
     Args:
         brand: Brand colour dict from config.
 
     Returns:
-        Dict of named ParagraphStyle objects.
+        Dict of named ParagraphStyle objects (shared between reports with the
+        same brand colours — do not mutate).
     """
-    primary = _hex(brand["primary"])
-    text_col = _hex(brand["text"])
+    return _styles_for(brand["primary"], brand["text"])
+
+
+@functools.lru_cache(maxsize=4)
+def _styles_for(primary_hex: str, text_hex: str) -> dict[str, ParagraphStyle]:
+    """Create the style sheet for one brand palette (memoised on its colours)."""
+    primary = _hex(primary_hex)
+    text_col = _hex(text_hex)
     white = colors.white
 
     styles = {}
@@ -120,6 +143,14 @@ def _build_styles(brand: dict) -> dict[str, ParagraphStyle]:
         textColor=colors.Color(0.8, 0.88, 0.95),
         alignment=TA_LEFT,
     )
+    styles["cover_legal"] = ParagraphStyle(
+        "cover_legal",
+        fontName="Helvetica-Oblique",
+        fontSize=8,
+        textColor=colors.Color(0.6, 0.7, 0.8),
+        leading=12,
+        alignment=TA_LEFT,
+    )
     styles["section_title"] = ParagraphStyle(
         "section_title",
         fontName="Helvetica-Bold",
@@ -204,238 +235,268 @@ def _build_styles(brand: dict) -> dict[str, ParagraphStyle]:
 # ---------------------------------------------------------------------------
 
 class _HeaderFooterCanvas:
-    """Mixin to add running header and footer to every page except the cover."""
+    """Mixin to add running header and footer to every page except the cover.
+
+    Everything but the page number is identical on every page, so it is drawn
+    once per document into a PDF form XObject and each page just references
+    it — one shared content stream instead of a copy per page.
+    """
+
+    _FORM_NAME = "board_header_footer"
 
     def __init__(self, brand: dict, company_name: str, report_period: str):
         self.brand = brand
         self.company_name = company_name
         self.report_period = report_period
-
-    def draw_header_footer(self, canvas, doc):
-        """Draw header bar and footer on non-cover pages."""
-        if doc.page == 1:
-            return  # Cover has its own full-page design
-
-        canvas.saveState()
+        # Everything except the page number is page-independent
+        self._primary = _hex(brand["primary"])
+        self._period_str = f"Board Report — {report_period}   |   CONFIDENTIAL"
+        self._header_y = PAGE_H - 0.85 * cm
+        self._right_x = PAGE_W - MARGIN
+
+    def _draw_static(self, canvas):
+        """Draw the page-independent header bar, titles, rule and footer text."""
         # Header bar
-        canvas.setFillColor(_hex(self.brand["primary"]))
+        canvas.setFillColor(self._primary)
         canvas.rect(0, PAGE_H - 1.2 * cm, PAGE_W, 1.2 * cm, fill=1, stroke=0)
 
         canvas.setFont("Helvetica-Bold", 9)
         canvas.setFillColor(colors.white)
-        canvas.drawString(MARGIN, PAGE_H - 0.85 * cm, self.company_name)
+        canvas.drawString(MARGIN, self._header_y, self.company_name)
 
         canvas.setFont("Helvetica", 9)
-        period_str = f"Board Report — {self.report_period}   |   CONFIDENTIAL"
-        canvas.drawRightString(PAGE_W - MARGIN, PAGE_H - 0.85 * cm, period_str)
+        canvas.drawRightString(self._right_x, self._header_y, self._period_str)
 
         # Footer line
-        canvas.setStrokeColor(_hex(self.brand["primary"]))
+        canvas.setStrokeColor(self._primary)
         canvas.setLineWidth(0.5)
-        canvas.line(MARGIN, 1.2 * cm, PAGE_W - MARGIN, 1.2 * cm)
+        canvas.line(MARGIN, 1.2 * cm, self._right_x, 1.2 * cm)
 
-        # Page number
         canvas.setFont("Helvetica", 7.5)
         canvas.setFillColor(colors.grey)
-        page_label = f"Page {doc.page}"
-        canvas.drawRightString(PAGE_W - MARGIN, 0.7 * cm, page_label)
         canvas.drawString(MARGIN, 0.7 * cm, "For Board Use Only — Strictly Confidential")
+
+    def draw_header_footer(self, canvas, doc):
+        """Draw header bar and footer on non-cover pages."""
+        if doc.page == 1:
+            return  # Cover has its own full-page design
+
+        if not canvas.hasForm(self._FORM_NAME):
+            canvas.beginForm(self._FORM_NAME, 0, 0, PAGE_W, PAGE_H)
+            self._draw_static(canvas)
+            canvas.endForm()
+
+        canvas.saveState()
+        canvas.doForm(self._FORM_NAME)
+
+        # Page number
+        canvas.setFont("Helvetica", 7.5)
+        canvas.setFillColor(colors.grey)
+        canvas.drawRightString(self._right_x, 0.7 * cm, f"Page {doc.page}")
         canvas.restoreState()
 
 
 # ---------------------------------------------------------------------------
 # Chart generators (matplotlib → BytesIO)
 # ---------------------------------------------------------------------------
+# Figure sizes are fixed, so each chart sets its axes margins directly with
+# values calibrated from tight_layout() (plus a little headroom for wider tick
+# labels) instead of running the layout solver on every render.
 
-def _fig_to_image(fig, width: float, height: float) -> Image:
-    """Render a matplotlib figure to a ReportLab Image via BytesIO.
+def _new_axes(figsize: tuple[float, float]):
+    """Create a standalone Agg-backed Figure with a single Axes.
+
+    Args:
+        figsize: Figure size in inches.
+
+    Returns:
+        ``(fig, ax)`` tuple; the figure is not registered with pyplot, so it is
+        freed with its last reference instead of needing ``plt.close``.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot(111)
+
+
+def _tick_formatter(func):
+    """Return a ``matplotlib.ticker.FuncFormatter`` (imported on first use)."""
+    from matplotlib.ticker import FuncFormatter
+
+    return FuncFormatter(func)
+
+
+def _fig_to_png(fig) -> bytes:
+    """Rasterise a matplotlib figure to a paletted PNG.
+
+    The charts are flat brand colours plus anti-aliasing, so a 64-colour
+    fast-octree palette is visually indistinguishable from full RGB at
+    report size while ReportLab embeds it as an indexed image at about a
+    third of the bytes. Quantising the Agg buffer directly also skips
+    savefig's intermediate RGBA PNG encode.
 
     Args:
         fig: Matplotlib Figure object.
+
+    Returns:
+        PNG-encoded image bytes.
+    """
+    # fig.subplots_adjust() already fits the axes, so no bbox_inches="tight"
+    # (a second full render). 110 DPI still oversamples the ≤195pt-tall
+    # slots.
+    fig.set_dpi(110)
+    fig.canvas.draw()
+    rgba = PILImage.frombuffer(
+        "RGBA", fig.canvas.get_width_height(), fig.canvas.buffer_rgba(), "raw", "RGBA", 0, 1
+    )
+    paletted = rgba.convert("RGB").quantize(64, method=PILImage.Quantize.FASTOCTREE)
+    buf = io.BytesIO()
+    paletted.save(buf, format="PNG", compress_level=1)
+    return buf.getvalue()
+
+
+def _png_to_image(png: bytes, width: float, height: float) -> Image:
+    """Wrap PNG bytes in a ReportLab Image flowable.
+
+    Args:
+        png: PNG-encoded image bytes.
         width: Target width in points for the PDF.
         height: Target height in points for the PDF.
 
     Returns:
         ReportLab Image flowable.
     """
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=150, bbox_inches="tight",
-                facecolor=fig.get_facecolor())
-    plt.close(fig)
-    buf.seek(0)
-    return Image(buf, width=width, height=height)
+    return Image(io.BytesIO(png), width=width, height=height)
 
 
-def _chart_revenue_vs_budget(pkg: MetricsPackage, brand: dict) -> Image:
+def _chart_revenue_vs_budget(pkg: MetricsPackage, palette: dict[str, str]):
     """Bar chart: monthly revenue actuals vs budget (12 months)."""
     fin = pkg.financial
     periods = [p[-5:] for p in fin.monthly_periods]  # MM-DD → last 5 chars
 
+    revenue_m = np.asarray(fin.monthly_revenue, dtype=np.float64) / 1e6
+
     # Re-build budget from actual ratio for chart purposes
-    rev_budget_monthly = [
-        pkg.financial.revenue_budget * (a / pkg.financial.revenue_actual)
-        if pkg.financial.revenue_actual > 0 else 0
-        for a in fin.monthly_revenue
-    ]
+    if fin.revenue_actual > 0:
+        rev_budget_m = fin.revenue_budget * (revenue_m / fin.revenue_actual)
+    else:
+        rev_budget_m = np.zeros_like(revenue_m)
 
     x = np.arange(len(periods))
     width = 0.38
 
-    fig, ax = plt.subplots(figsize=(8, 3.5))
-    fig.patch.set_facecolor("white")
-    ax.set_facecolor("white")
+    fig, ax = _new_axes(figsize=(8, 3.5))
 
-    bars1 = ax.bar(x - width / 2, [v / 1e6 for v in fin.monthly_revenue],
-                   width, label="Actual", color=_mpl_hex(brand["primary"]), alpha=0.9, zorder=3)
-    bars2 = ax.bar(x + width / 2, [v / 1e6 for v in rev_budget_monthly],
-                   width, label="Budget", color=_mpl_hex(brand["secondary"]),
+    bars1 = ax.bar(x - width / 2, revenue_m,
+                   width, label="Actual", color=palette["primary"], alpha=0.9, zorder=3)
+    bars2 = ax.bar(x + width / 2, rev_budget_m,
+                   width, label="Budget", color=palette["secondary"],
                    alpha=0.5, zorder=3)
 
-    ax.plot(x, [v / 1e6 for v in fin.monthly_ebitda],
-            color=_mpl_hex(brand["accent"]), marker="o", markersize=4,
+    ax.plot(x, np.asarray(fin.monthly_ebitda, dtype=np.float64) / 1e6,
+            color=palette["accent"], marker="o", markersize=4,
             linewidth=1.8, label="EBITDA", zorder=4)
 
     ax.set_xticks(x)
     ax.set_xticklabels(periods, rotation=45, ha="right", fontsize=7.5)
     ax.set_ylabel("£M", fontsize=8)
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda v, _: f"£{v:.1f}M"))
+    ax.yaxis.set_major_formatter(_tick_formatter(lambda v, _: f"£{v:.1f}M"))
     ax.legend(fontsize=8, loc="upper left", framealpha=0.5)
     ax.set_title("Monthly Revenue vs Budget with EBITDA Trend", fontsize=10,
-                 color=_mpl_hex(brand["primary"]), fontweight="bold", pad=8)
+                 color=palette["primary"], fontweight="bold", pad=8)
     ax.spines[["top", "right"]].set_visible(False)
     ax.grid(axis="y", linestyle="--", alpha=0.4, zorder=0)
-    fig.tight_layout()
+    fig.subplots_adjust(left=0.11, right=0.98, top=0.89, bottom=0.15)
 
-    return _fig_to_image(fig, CONTENT_W * 0.98, 195)
+    return fig
 
 
-def _chart_gross_margin_trend(pkg: MetricsPackage, brand: dict) -> Image:
+def _chart_gross_margin_trend(pkg: MetricsPackage, palette: dict[str, str]):
     """Line chart: gross margin % trend (12 months)."""
     fin = pkg.financial
     periods = [p[-5:] for p in fin.monthly_periods]
 
-    fig, ax = plt.subplots(figsize=(8, 2.8))
-    fig.patch.set_facecolor("white")
-    ax.set_facecolor("white")
+    fig, ax = _new_axes(figsize=(8, 2.8))
 
     ax.fill_between(range(len(periods)), fin.monthly_gross_margin,
-                    alpha=0.15, color=_mpl_hex(brand["primary"]))
+                    alpha=0.15, color=palette["primary"])
     ax.plot(range(len(periods)), fin.monthly_gross_margin,
-            color=_mpl_hex(brand["primary"]), linewidth=2, marker="o", markersize=4)
+            color=palette["primary"], linewidth=2, marker="o", markersize=4)
     ax.axhline(y=fin.gross_margin_pct_budget * 100,
-               color=_mpl_hex(brand["accent"]), linestyle="--",
+               color=palette["accent"], linestyle="--",
                linewidth=1.2, label=f"Budget ({fin.gross_margin_pct_budget*100:.1f}%)")
-    ax.axhline(y=62, color=_mpl_hex(brand["green"]),
+    ax.axhline(y=62, color=palette["green"],
                linestyle=":", linewidth=1.0, alpha=0.6, label="Green threshold (62%)")
 
     ax.set_xticks(range(len(periods)))
     ax.set_xticklabels(periods, rotation=45, ha="right", fontsize=7.5)
     ax.set_ylabel("Gross Margin %", fontsize=8)
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda v, _: f"{v:.0f}%"))
+    ax.yaxis.set_major_formatter(_tick_formatter(lambda v, _: f"{v:.0f}%"))
     ax.legend(fontsize=7.5, framealpha=0.5)
     ax.set_title("Gross Margin % Trend", fontsize=10,
-                 color=_mpl_hex(brand["primary"]), fontweight="bold", pad=8)
+                 color=palette["primary"], fontweight="bold", pad=8)
     ax.spines[["top", "right"]].set_visible(False)
     ax.grid(axis="y", linestyle="--", alpha=0.3)
-    fig.tight_layout()
-
-    return _fig_to_image(fig, CONTENT_W * 0.98, 155)
+    fig.subplots_adjust(left=0.10, right=0.98, top=0.87, bottom=0.19)
 
+    return fig
 
-def _chart_pipeline_by_stage(pkg: MetricsPackage, brand: dict) -> Image:
-    """Horizontal stacked bar: pipeline by stage."""
-    comm = pkg.commercial
-    stages = list(comm.pipeline_by_stage.keys())
-    values = [comm.pipeline_by_stage[s] / 1e6 for s in stages]
-
-    stage_colours = [
-        _mpl_hex(brand["primary"]),
-        _mpl_hex(brand["secondary"]),
-        _mpl_hex(brand["amber"]),
-        _mpl_hex(brand["accent"]),
-    ]
 
-    fig, ax = plt.subplots(figsize=(8, 2.6))
-    fig.patch.set_facecolor("white")
-    ax.set_facecolor("white")
-
-    left = 0
-    for i, (stage, val) in enumerate(zip(stages, values)):
-        ax.barh(0, val, left=left, color=stage_colours[i % len(stage_colours)],
-                label=f"{stage} (£{val:.1f}M)", height=0.5, alpha=0.9)
-        if val > 0.05:
-            ax.text(left + val / 2, 0, f"£{val:.1f}M",
-                    ha="center", va="center", fontsize=8, color="white",
-                    fontweight="bold")
-        left += val
-
-    ax.set_xlim(0, left * 1.05)
-    ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda v, _: f"£{v:.1f}M"))
-    ax.set_yticks([])
-    ax.legend(fontsize=8, loc="upper right", framealpha=0.5)
-    ax.set_title("Pipeline by Stage (4-Week Snapshot)", fontsize=10,
-                 color=_mpl_hex(brand["primary"]), fontweight="bold", pad=8)
-    ax.spines[["top", "right", "left"]].set_visible(False)
-    fig.tight_layout()
-
-    return _fig_to_image(fig, CONTENT_W * 0.98, 140)
-
-
-def _chart_arr_trend(pkg: MetricsPackage, brand: dict) -> Image:
+def _chart_arr_trend(pkg: MetricsPackage, palette: dict[str, str]):
     """Area chart: ARR trend with budget overlay."""
     cust = pkg.customers
     periods = [p[-5:] for p in cust.arr_trend_periods]
-    arr_m = [v / 1e6 for v in cust.arr_trend]
+    arr_m = np.asarray(cust.arr_trend, dtype=np.float64) / 1e6
 
     arr_budget_m = pkg.customers.arr_budget / 1e6
 
-    fig, ax = plt.subplots(figsize=(8, 2.8))
-    fig.patch.set_facecolor("white")
-    ax.set_facecolor("white")
+    fig, ax = _new_axes(figsize=(8, 2.8))
 
     ax.fill_between(range(len(periods)), arr_m, alpha=0.2,
-                    color=_mpl_hex(brand["secondary"]))
-    ax.plot(range(len(periods)), arr_m, color=_mpl_hex(brand["secondary"]),
+                    color=palette["secondary"])
+    ax.plot(range(len(periods)), arr_m, color=palette["secondary"],
             linewidth=2, marker="o", markersize=4, label="ARR (Actual)")
-    ax.axhline(y=arr_budget_m, color=_mpl_hex(brand["accent"]),
+    ax.axhline(y=arr_budget_m, color=palette["accent"],
                linestyle="--", linewidth=1.2, label=f"Budget (£{arr_budget_m:.1f}M)")
 
     ax.set_xticks(range(len(periods)))
     ax.set_xticklabels(periods, rotation=45, ha="right", fontsize=7.5)
     ax.set_ylabel("ARR (£M)", fontsize=8)
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda v, _: f"£{v:.1f}M"))
+    ax.yaxis.set_major_formatter(_tick_formatter(lambda v, _: f"£{v:.1f}M"))
     ax.legend(fontsize=8, framealpha=0.5)
     ax.set_title("Annual Recurring Revenue (ARR) Trend", fontsize=10,
-                 color=_mpl_hex(brand["primary"]), fontweight="bold", pad=8)
+                 color=palette["primary"], fontweight="bold", pad=8)
     ax.spines[["top", "right"]].set_visible(False)
     ax.grid(axis="y", linestyle="--", alpha=0.3)
-    fig.tight_layout()
+    fig.subplots_adjust(left=0.12, right=0.98, top=0.87, bottom=0.19)
 
-    return _fig_to_image(fig, CONTENT_W * 0.98, 155)
+    return fig
 
 
-def _chart_headcount(pkg: MetricsPackage, brand: dict) -> Image:
+def _chart_headcount(pkg: MetricsPackage, palette: dict[str, str]):
     """Grouped bar chart: headcount by department (actual vs budget)."""
     hc = pkg.headcount
-    depts = list(hc.by_department.keys())
-    actuals = [hc.by_department[d]["actual"] for d in depts]
-    budgets = [hc.by_department[d]["budget"] for d in depts]
+    depts, actuals, budgets = [], [], []
+    for dept, counts in hc.by_department.items():
+        depts.append(dept)
+        actuals.append(counts["actual"])
+        budgets.append(counts["budget"])
 
     x = np.arange(len(depts))
     width = 0.38
 
-    fig, ax = plt.subplots(figsize=(8, 3.2))
-    fig.patch.set_facecolor("white")
-    ax.set_facecolor("white")
+    fig, ax = _new_axes(figsize=(8, 3.2))
 
     ax.bar(x - width / 2, actuals, width, label="Actual",
-           color=_mpl_hex(brand["primary"]), alpha=0.9, zorder=3)
+           color=palette["primary"], alpha=0.9, zorder=3)
     ax.bar(x + width / 2, budgets, width, label="Budget",
-           color=_mpl_hex(brand["secondary"]), alpha=0.5, zorder=3)
+           color=palette["secondary"], alpha=0.5, zorder=3)
 
     for i, (a, b) in enumerate(zip(actuals, budgets)):
         ax.text(i - width / 2, a + 0.3, str(a), ha="center", fontsize=7.5,
-                color=_mpl_hex(brand["primary"]), fontweight="bold")
+                color=palette["primary"], fontweight="bold")
 
     ax.set_xticks(x)
     ax.set_xticklabels(
@@ -444,18 +505,242 @@ def _chart_headcount(pkg: MetricsPackage, brand: dict) -> Image:
     ax.set_ylabel("FTEs", fontsize=8)
     ax.legend(fontsize=8, framealpha=0.5)
     ax.set_title("Headcount by Department — Actual vs Budget", fontsize=10,
-                 color=_mpl_hex(brand["primary"]), fontweight="bold", pad=8)
+                 color=palette["primary"], fontweight="bold", pad=8)
     ax.spines[["top", "right"]].set_visible(False)
     ax.grid(axis="y", linestyle="--", alpha=0.3, zorder=0)
-    fig.tight_layout()
+    fig.subplots_adjust(left=0.08, right=0.98, top=0.88, bottom=0.21)
+
+    return fig
+
+
+# Chart name → (figure builder, height in points on the page, MetricsPackage
+# section the builder reads — the chart's cache key is derived from it)
+_CHARTS = {
+    "revenue_vs_budget": (_chart_revenue_vs_budget, 195, "financial"),
+    "gross_margin_trend": (_chart_gross_margin_trend, 155, "financial"),
+    "arr_trend": (_chart_arr_trend, 155, "customers"),
+    "headcount": (_chart_headcount, 175, "headcount"),
+}
+
+# Content-addressed PNG cache: rebuilding a report whose figures have not
+# changed (e.g. iterating on narrative text) skips matplotlib entirely.
+_PNG_CACHE_SIZE = 32
+_png_cache: dict[tuple, bytes] = {}
+
+# Set to "1" to also keep the chart PNGs on disk (paths.chart_cache_dir) so
+# they survive across processes. File names mix in the matplotlib version and
+# this module's mtime, so editing the chart code or upgrading misses.
+_CHART_CACHE_ENV = "BRG_CHART_CACHE"
+_CHART_CACHE_STAMP = f"{matplotlib.__version__}\0{os.stat(__file__).st_mtime_ns}"
+
+
+def _chart_key(name: str, pkg: MetricsPackage, palette: dict[str, str]) -> tuple:
+    """Return the cache key for one chart: its name, input digest and palette."""
+    section = getattr(pkg, _CHARTS[name][2])
+    digest = hashlib.blake2b(
+        pickle.dumps(section, protocol=pickle.HIGHEST_PROTOCOL), digest_size=16
+    ).digest()
+    return name, digest, tuple(palette.items())
+
+
+def _chart_file(cache_dir: Path, key: tuple) -> Path:
+    """Return the on-disk cache file for a chart key."""
+    digest = hashlib.blake2b(f"{key!r}\0{_CHART_CACHE_STAMP}".encode(), digest_size=16)
+    return cache_dir / f"{key[0]}_{digest.hexdigest()}.png"
+
+
+def _render_chart(name: str, pkg: MetricsPackage, palette: dict[str, str]) -> bytes:
+    """Build and rasterise one named chart.
+
+    Top-level and bytes-returning so it can run in a worker process
+    (ReportLab flowables do not pickle reliably; PNG bytes do).
+
+    Args:
+        name: Key into ``_CHARTS``.
+        pkg: MetricsPackage.
+        palette: Brand colour name → matplotlib hex string.
+
+    Returns:
+        PNG-encoded chart bytes.
+    """
+    build = _CHARTS[name][0]
+    return _fig_to_png(build(pkg, palette))
 
-    return _fig_to_image(fig, CONTENT_W * 0.98, 175)
+
+def _render_charts(
+    pkg: MetricsPackage, brand: dict, cache_dir: Path | None = None
+) -> dict[str, bytes]:
+    """Rasterise every report chart, in parallel where it can help.
+
+    Charts whose inputs match an earlier render in this process come from
+    ``_png_cache``, then from ``cache_dir`` when one is given. Agg
+    rasterisation of the rest is CPU-bound, so with more than one core they
+    are farmed out to forked worker processes. Runs serially on a single
+    core, without ``fork``, when already inside a daemonic worker (e.g.
+    main.py's output-stage pool), which is not allowed to spawn children, or
+    when other threads are alive (e.g. under the scheduler and its health
+    server), since a lock held by another thread at fork time would be
+    inherited locked by the child.
+
+    Args:
+        pkg: MetricsPackage.
+        brand: Brand colour dict.
+        cache_dir: On-disk PNG cache directory, or None for in-process only.
+
+    Returns:
+        Dict of chart name → PNG bytes.
+    """
+    palette = {k: _mpl_hex(v) for k, v in brand.items()}
+    keys = {name: _chart_key(name, pkg, palette) for name in _CHARTS}
+    charts = {name: _png_cache[key] for name, key in keys.items() if key in _png_cache}
+    files = {}
+    if cache_dir is not None:
+        for name in _CHARTS:
+            if name in charts:
+                continue
+            files[name] = _chart_file(cache_dir, keys[name])
+            try:
+                charts[name] = _png_cache[keys[name]] = files[name].read_bytes()
+                logger.debug("Chart %s served from PNG cache (%s)", name, files[name].name)
+            except OSError:
+                pass
+    missing = [name for name in _CHARTS if name not in charts]
+
+    workers = min(len(missing), os.cpu_count() or 1)
+    if (
+        workers > 1
+        and not multiprocessing.current_process().daemon
+        and threading.active_count() == 1
+        and "fork" in multiprocessing.get_all_start_methods()
+    ):
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork")) as pool:
+            futures = {name: pool.submit(_render_chart, name, pkg, palette) for name in missing}
+            rendered = {name: fut.result() for name, fut in futures.items()}
+    else:
+        rendered = {name: _render_chart(name, pkg, palette) for name in missing}
+
+    for name, png in rendered.items():
+        _png_cache[keys[name]] = png
+        charts[name] = png
+        if name in files:
+            tmp = files[name].with_suffix(".tmp")
+            tmp.write_bytes(png)
+            os.replace(tmp, files[name])
+    while len(_png_cache) > _PNG_CACHE_SIZE:
+        del _png_cache[next(iter(_png_cache))]  # evict oldest
+    return charts
+
+
+def _chart_image(charts: dict[str, bytes], name: str) -> Image:
+    """Return the named pre-rendered chart as a full-width Image flowable."""
+    return _png_to_image(charts[name], CONTENT_W * 0.98, _CHARTS[name][1])
+
+
+def _nice_ticks(vmax: float, max_ticks: int = 8) -> list[float]:
+    """Return evenly spaced 1/2/2.5/5×10ⁿ axis ticks from 0 up to ``vmax``."""
+    if vmax <= 0:
+        return [0.0]
+    magnitude = 10 ** np.floor(np.log10(vmax / max_ticks))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if vmax / (m * magnitude) <= max_ticks)
+    return [i * step for i in range(int(vmax / step) + 1)]
+
+
+class _PipelineStackedBar(Flowable):
+    """Pipeline-by-stage stacked bar drawn with ReportLab vector primitives.
+
+    A single bar of a handful of segments does not need matplotlib: drawing
+    it straight onto the canvas skips a figure build and rasterisation, and
+    the result stays sharp at any zoom.
+    """
+
+    _TITLE = "Pipeline by Stage (4-Week Snapshot)"
+
+    def __init__(self, pkg: MetricsPackage, brand: dict, width: float, height: float):
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.stages = [(stage, value / 1e6) for stage, value in pkg.commercial.pipeline_by_stage.items()]
+        self.primary = _hex(brand["primary"])
+        self.stage_colours = [_hex(brand[k]) for k in ("primary", "secondary", "amber", "accent")]
+
+    def wrap(self, avail_width, avail_height):
+        return self.width, self.height
+
+    def draw(self):
+        c = self.canv
+        w, h = self.width, self.height
+        x0, x1 = 12, w - 12
+        total = sum(val for _, val in self.stages)
+        xmax = total * 1.05 or 1.0
+        scale = (x1 - x0) / xmax
+        bar_y, bar_h = 46, h - 74
+        axis_y = 34
+
+        c.setFillColor(self.primary)
+        c.setFont("Helvetica-Bold", 8.5)
+        c.drawCentredString(w / 2, h - 12, self._TITLE)
+
+        # Segments with in-bar value labels
+        left = 0.0
+        c.setFillAlpha(0.9)
+        for i, (_, val) in enumerate(self.stages):
+            c.setFillColor(self.stage_colours[i % len(self.stage_colours)])
+            c.rect(x0 + left * scale, bar_y, val * scale, bar_h, fill=1, stroke=0)
+            left += val
+        c.setFillAlpha(1)
+        c.setFillColor(colors.white)
+        c.setFont("Helvetica-Bold", 7)
+        left = 0.0
+        for _, val in self.stages:
+            label = f"£{val:.1f}M"
+            if val > 0.05 and val * scale > c.stringWidth(label, "Helvetica-Bold", 7) + 4:
+                c.drawCentredString(x0 + (left + val / 2) * scale, bar_y + bar_h / 2 - 2.5, label)
+            left += val
+
+        # x axis
+        c.setStrokeColor(colors.black)
+        c.setLineWidth(0.6)
+        c.line(x0, axis_y, x1, axis_y)
+        c.setFillColor(colors.black)
+        c.setFont("Helvetica", 7)
+        for tick in _nice_ticks(xmax):
+            tx = x0 + tick * scale
+            c.line(tx, axis_y, tx, axis_y - 3)
+            c.drawCentredString(tx, axis_y - 11, f"£{tick:.1f}M")
+
+        # Legend row, centred under the axis
+        entries = [f"{stage} (£{val:.1f}M)" for stage, val in self.stages]
+        widths = [10 + c.stringWidth(e, "Helvetica", 7) + 12 for e in entries]
+        lx = (w - sum(widths)) / 2
+        for i, (entry, ew) in enumerate(zip(entries, widths)):
+            c.setFillColor(self.stage_colours[i % len(self.stage_colours)])
+            c.rect(lx, 4, 7, 7, fill=1, stroke=0)
+            c.setFillColor(colors.black)
+            c.drawString(lx + 10, 5, entry)
+            lx += ew
 
 
 # ---------------------------------------------------------------------------
 # RAG KPI table
 # ---------------------------------------------------------------------------
 
+# Static table styles depend only on brand colours, so each is built once and
+# shared; callers that add per-cell commands derive a child TableStyle from it
+# (TableStyle(parent=...) copies the parent's commands) rather than mutating it.
+@functools.lru_cache(maxsize=8)
+def _rag_table_style(light: str) -> TableStyle:
+    """Return the shared base style for the RAG KPI tile grid."""
+    return TableStyle([
+        ("BACKGROUND", (0, 0), (-1, -1), _hex(light)),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.white),
+        ("ROWBACKGROUND", (0, 0), (-1, 0), _hex(light)),
+        ("TOPPADDING", (0, 0), (-1, -1), 6),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+        ("LEFTPADDING", (0, 0), (-1, -1), 4),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+    ])
+
+
 def _rag_colour(status: str, brand: dict):
     """Map RAG status to ReportLab colour."""
     m = {"Green": brand["green"], "Amber": brand["amber"], "Red": brand["red"]}
@@ -527,26 +812,13 @@ def _build_rag_table(pkg: MetricsPackage, styles: dict, brand: dict) -> Table:
     col_w = CONTENT_W / n_cols
 
     table = Table(rows, colWidths=[col_w] * n_cols)
-    ts = TableStyle([
-        ("BACKGROUND", (0, 0), (-1, -1), _hex(brand["light"])),
-        ("GRID", (0, 0), (-1, -1), 0.5, colors.white),
-        ("ROWBACKGROUND", (0, 0), (-1, 0), _hex(brand["light"])),
-        ("TOPPADDING", (0, 0), (-1, -1), 6),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-        ("LEFTPADDING", (0, 0), (-1, -1), 4),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-    ])
-
-    # Colour the RAG rows
-    for row_idx in [2, 5]:  # rag_row positions (0-indexed: 2 and 5)
-        if row_idx < len(rows):
-            for col_idx, (_, _, _, status) in enumerate(kpis[
-                (row_idx // 3) * n_cols:((row_idx // 3) + 1) * n_cols
-            ]):
-                c = _rag_colour(status, brand)
-                ts.add("TEXTCOLOR", (col_idx, row_idx), (col_idx, row_idx), c)
-
-    table.setStyle(ts)
+    # Colour each KPI's RAG cell: tile idx sits in column idx % n_cols of the
+    # third (status) row of its 3-row band
+    rag_cells = []
+    for idx, (_, _, _, status) in enumerate(kpis):
+        r, c = (idx // n_cols) * 3 + 2, idx % n_cols
+        rag_cells.append(("TEXTCOLOR", (c, r), (c, r), _rag_colour(status, brand)))
+    table.setStyle(TableStyle(rag_cells, parent=_rag_table_style(brand["light"])))
     return table
 
 
@@ -554,11 +826,28 @@ def _build_rag_table(pkg: MetricsPackage, styles: dict, brand: dict) -> Table:
 # Risk register table
 # ---------------------------------------------------------------------------
 
-def _build_risk_table(risk_register: list[dict], styles: dict, brand: dict) -> Table:
+@functools.lru_cache(maxsize=8)
+def _risk_table_style(primary: str, light: str) -> TableStyle:
+    """Return the shared style for the risk register table."""
+    return TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), _hex(primary)),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("GRID", (0, 0), (-1, -1), 0.4, colors.lightgrey),
+        ("ROWBACKGROUND", (0, 1), (-1, -1), colors.white),
+        ("ROWBACKGROUND", (0, 2), (-1, 2), _hex(light)),
+        ("ROWBACKGROUND", (0, 4), (-1, 4), _hex(light)),
+        ("TOPPADDING", (0, 0), (-1, -1), 5),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+        ("LEFTPADDING", (0, 0), (-1, -1), 5),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ])
+
+
+def _build_risk_table(risk_register: Sequence[RiskEntry], styles: dict, brand: dict) -> Table:
     """Build the risk register as a formatted ReportLab table.
 
     Args:
-        risk_register: List of risk dicts from narrative templates.
+        risk_register: Risk entries from narrative templates.
         styles: Paragraph style dict.
         brand: Brand colour dict.
 
@@ -580,12 +869,12 @@ def _build_risk_table(risk_register: list[dict], styles: dict, brand: dict) -> T
     data = [header]
 
     for risk in risk_register:
-        rating = risk.get("rating", "Low")
+        rating = risk.rating
         r_colour = _hex(rating_colours.get(rating, brand["text"]))
         data.append([
-            Paragraph(risk.get("risk", ""), styles["risk_cell"]),
-            Paragraph(risk.get("detail", ""), styles["risk_cell"]),
-            Paragraph(risk.get("mitigation", ""), styles["risk_cell"]),
+            Paragraph(risk.risk, styles["risk_cell"]),
+            Paragraph(risk.detail, styles["risk_cell"]),
+            Paragraph(risk.mitigation, styles["risk_cell"]),
             Paragraph(f'<b><font color="#{rating_colours.get(rating, brand["text"])}">{rating}</font></b>',
                       styles["risk_cell"]),
         ])
@@ -598,19 +887,7 @@ def _build_risk_table(risk_register: list[dict], styles: dict, brand: dict) -> T
     ]
 
     table = Table(data, colWidths=col_widths, repeatRows=1)
-    ts = TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), _hex(brand["primary"])),
-        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-        ("GRID", (0, 0), (-1, -1), 0.4, colors.lightgrey),
-        ("ROWBACKGROUND", (0, 1), (-1, -1), colors.white),
-        ("ROWBACKGROUND", (0, 2), (-1, 2), _hex(brand["light"])),
-        ("ROWBACKGROUND", (0, 4), (-1, 4), _hex(brand["light"])),
-        ("TOPPADDING", (0, 0), (-1, -1), 5),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
-        ("LEFTPADDING", (0, 0), (-1, -1), 5),
-        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-    ])
-    table.setStyle(ts)
+    table.setStyle(_risk_table_style(brand["primary"], brand["light"]))
     return table
 
 
@@ -618,14 +895,38 @@ def _build_risk_table(risk_register: list[dict], styles: dict, brand: dict) -> T
 # Page content builders
 # ---------------------------------------------------------------------------
 
+_NARRATIVE_SECTIONS = (
+    "executive_summary",
+    "financial_performance",
+    "commercial_performance",
+    "customer_metrics",
+    "operational_metrics",
+    "outlook_and_risks",
+)
+
+
+def _narrative_paragraphs(narrative: NarrativePackage, style: ParagraphStyle) -> dict[str, list[Paragraph]]:
+    """Split each narrative section into body Paragraphs, once per report.
+
+    Args:
+        narrative: Generated narrative package.
+        style: Body paragraph style.
+
+    Returns:
+        Dict of section name → Paragraph flowables, one per blank-line-separated block.
+    """
+    return {
+        section: [Paragraph(para.strip(), style) for para in getattr(narrative, section).split("\n\n")]
+        for section in _NARRATIVE_SECTIONS
+    }
+
+
 def _page_cover(
     pkg: MetricsPackage,
     styles: dict,
     brand: dict,
 ) -> list:
     """Build the cover page content list."""
-    story = []
-
     # Full-page navy background — achieved via a coloured Table cell
     cover_content = [
         Spacer(1, 5 * cm),
@@ -643,14 +944,7 @@ def _page_cover(
             "This document is prepared for the exclusive use of the Board of Directors "
             "and is strictly confidential. It must not be copied, distributed, or shared "
             "without the prior written consent of the Chief Financial Officer.",
-            ParagraphStyle(
-                "cover_legal",
-                fontName="Helvetica-Oblique",
-                fontSize=8,
-                textColor=colors.Color(0.6, 0.7, 0.8),
-                leading=12,
-                alignment=TA_LEFT,
-            ),
+            styles["cover_legal"],
         ),
     ]
 
@@ -666,68 +960,56 @@ def _page_cover(
         ("TOPPADDING", (0, 0), (0, 0), 0),
         ("VALIGN", (0, 0), (0, 0), "TOP"),
     ]))
-    story.append(cover_table)
-    story.append(PageBreak())
-    return story
+    return [cover_table, PageBreak()]
 
 
 def _page_exec_summary(
     pkg: MetricsPackage,
-    narrative: NarrativePackage,
+    paras: dict[str, list[Paragraph]],
     styles: dict,
     brand: dict,
 ) -> list:
     """Build the executive summary page."""
-    story = []
-    story.append(Paragraph("Executive Summary", styles["section_title"]))
-    story.append(HRFlowable(width=CONTENT_W, thickness=1, color=_hex(brand["primary"]), spaceAfter=10))
-    story.append(_build_rag_table(pkg, styles, brand))
-    story.append(Spacer(1, 0.4 * cm))
-    story.append(Paragraph("Summary Commentary", styles["subsection_title"]))
-    for para in narrative.executive_summary.split("\n\n"):
-        story.append(Paragraph(para.strip(), styles["body"]))
-    story.append(PageBreak())
-    return story
+    return [
+        Paragraph("Executive Summary", styles["section_title"]),
+        HRFlowable(width=CONTENT_W, thickness=1, color=_hex(brand["primary"]), spaceAfter=10),
+        _build_rag_table(pkg, styles, brand),
+        Spacer(1, 0.4 * cm),
+        Paragraph("Summary Commentary", styles["subsection_title"]),
+        *paras["executive_summary"],
+        PageBreak(),
+    ]
 
 
 def _page_financial(
     pkg: MetricsPackage,
-    narrative: NarrativePackage,
+    paras: dict[str, list[Paragraph]],
     styles: dict,
     brand: dict,
+    charts: dict[str, bytes],
 ) -> list:
     """Build the financial performance page."""
-    story = []
-    story.append(Paragraph("Financial Performance", styles["section_title"]))
-    story.append(HRFlowable(width=CONTENT_W, thickness=1, color=_hex(brand["primary"]), spaceAfter=8))
-    story.append(_chart_revenue_vs_budget(pkg, brand))
-    story.append(Paragraph("Fig 1: Monthly revenue vs budget with EBITDA overlay (12 months)", styles["caption"]))
-    story.append(_chart_gross_margin_trend(pkg, brand))
-    story.append(Paragraph("Fig 2: Gross margin % trend vs budget and Green threshold", styles["caption"]))
-    story.append(Paragraph("Financial Commentary", styles["subsection_title"]))
-    for para in narrative.financial_performance.split("\n\n"):
-        story.append(Paragraph(para.strip(), styles["body"]))
-    story.append(PageBreak())
-    return story
+    return [
+        Paragraph("Financial Performance", styles["section_title"]),
+        HRFlowable(width=CONTENT_W, thickness=1, color=_hex(brand["primary"]), spaceAfter=8),
+        _chart_image(charts, "revenue_vs_budget"),
+        Paragraph("Fig 1: Monthly revenue vs budget with EBITDA overlay (12 months)", styles["caption"]),
+        _chart_image(charts, "gross_margin_trend"),
+        Paragraph("Fig 2: Gross margin % trend vs budget and Green threshold", styles["caption"]),
+        Paragraph("Financial Commentary", styles["subsection_title"]),
+        *paras["financial_performance"],
+        PageBreak(),
+    ]
 
 
 def _page_commercial(
     pkg: MetricsPackage,
-    narrative: NarrativePackage,
+    paras: dict[str, list[Paragraph]],
     styles: dict,
     brand: dict,
+    charts: dict[str, bytes],
 ) -> list:
     """Build the commercial performance page."""
-    story = []
-    story.append(Paragraph("Commercial Performance", styles["section_title"]))
-    story.append(HRFlowable(width=CONTENT_W, thickness=1, color=_hex(brand["primary"]), spaceAfter=8))
-    story.append(_chart_pipeline_by_stage(pkg, brand))
-    story.append(Paragraph("Fig 3: Sales pipeline by stage — 4-week snapshot (£M)", styles["caption"]))
-    story.append(Paragraph("Commercial Commentary", styles["subsection_title"]))
-    for para in narrative.commercial_performance.split("\n\n"):
-        story.append(Paragraph(para.strip(), styles["body"]))
-    story.append(Spacer(1, 0.3 * cm))
-
     # Win rate and coverage summary table
     comm = pkg.commercial
     summary_data = [
@@ -754,65 +1036,74 @@ def _page_commercial(
         ("TOPPADDING", (0, 0), (-1, -1), 5),
         ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
     ]))
-    story.append(summary_table)
-    story.append(PageBreak())
-    return story
+
+    return [
+        Paragraph("Commercial Performance", styles["section_title"]),
+        HRFlowable(width=CONTENT_W, thickness=1, color=_hex(brand["primary"]), spaceAfter=8),
+        _PipelineStackedBar(pkg, brand, CONTENT_W * 0.98, 140),
+        Paragraph("Fig 3: Sales pipeline by stage — 4-week snapshot (£M)", styles["caption"]),
+        Paragraph("Commercial Commentary", styles["subsection_title"]),
+        *paras["commercial_performance"],
+        Spacer(1, 0.3 * cm),
+        summary_table,
+        PageBreak(),
+    ]
 
 
 def _page_customers(
     pkg: MetricsPackage,
-    narrative: NarrativePackage,
+    paras: dict[str, list[Paragraph]],
     styles: dict,
     brand: dict,
+    charts: dict[str, bytes],
 ) -> list:
     """Build the customer metrics page."""
-    story = []
-    story.append(Paragraph("Customer & Retention Metrics", styles["section_title"]))
-    story.append(HRFlowable(width=CONTENT_W, thickness=1, color=_hex(brand["primary"]), spaceAfter=8))
-    story.append(_chart_arr_trend(pkg, brand))
-    story.append(Paragraph("Fig 4: ARR trend vs budget (12 months, £M)", styles["caption"]))
-    story.append(Paragraph("Customer Commentary", styles["subsection_title"]))
-    for para in narrative.customer_metrics.split("\n\n"):
-        story.append(Paragraph(para.strip(), styles["body"]))
-    story.append(PageBreak())
-    return story
+    return [
+        Paragraph("Customer & Retention Metrics", styles["section_title"]),
+        HRFlowable(width=CONTENT_W, thickness=1, color=_hex(brand["primary"]), spaceAfter=8),
+        _chart_image(charts, "arr_trend"),
+        Paragraph("Fig 4: ARR trend vs budget (12 months, £M)", styles["caption"]),
+        Paragraph("Customer Commentary", styles["subsection_title"]),
+        *paras["customer_metrics"],
+        PageBreak(),
+    ]
 
 
 def _page_operational(
     pkg: MetricsPackage,
-    narrative: NarrativePackage,
+    paras: dict[str, list[Paragraph]],
     styles: dict,
     brand: dict,
+    charts: dict[str, bytes],
 ) -> list:
     """Build the operational / headcount page."""
-    story = []
-    story.append(Paragraph("Operational Metrics", styles["section_title"]))
-    story.append(HRFlowable(width=CONTENT_W, thickness=1, color=_hex(brand["primary"]), spaceAfter=8))
-    story.append(_chart_headcount(pkg, brand))
-    story.append(Paragraph("Fig 5: Headcount by department — actual vs budget (FTEs)", styles["caption"]))
-    story.append(Paragraph("Headcount Commentary", styles["subsection_title"]))
-    for para in narrative.operational_metrics.split("\n\n"):
-        story.append(Paragraph(para.strip(), styles["body"]))
-    story.append(PageBreak())
-    return story
+    return [
+        Paragraph("Operational Metrics", styles["section_title"]),
+        HRFlowable(width=CONTENT_W, thickness=1, color=_hex(brand["primary"]), spaceAfter=8),
+        _chart_image(charts, "headcount"),
+        Paragraph("Fig 5: Headcount by department — actual vs budget (FTEs)", styles["caption"]),
+        Paragraph("Headcount Commentary", styles["subsection_title"]),
+        *paras["operational_metrics"],
+        PageBreak(),
+    ]
 
 
 def _page_outlook(
     narrative: NarrativePackage,
+    paras: dict[str, list[Paragraph]],
     styles: dict,
     brand: dict,
 ) -> list:
     """Build the outlook and risk register page."""
-    story = []
-    story.append(Paragraph("Outlook & Risk Register", styles["section_title"]))
-    story.append(HRFlowable(width=CONTENT_W, thickness=1, color=_hex(brand["primary"]), spaceAfter=8))
-    story.append(Paragraph("Management Outlook", styles["subsection_title"]))
-    for para in narrative.outlook_and_risks.split("\n\n"):
-        story.append(Paragraph(para.strip(), styles["body"]))
-    story.append(Spacer(1, 0.4 * cm))
-    story.append(Paragraph("Risk Register", styles["subsection_title"]))
-    story.append(_build_risk_table(narrative.risk_register, styles, brand))
-    return story
+    return [
+        Paragraph("Outlook & Risk Register", styles["section_title"]),
+        HRFlowable(width=CONTENT_W, thickness=1, color=_hex(brand["primary"]), spaceAfter=8),
+        Paragraph("Management Outlook", styles["subsection_title"]),
+        *paras["outlook_and_risks"],
+        Spacer(1, 0.4 * cm),
+        Paragraph("Risk Register", styles["subsection_title"]),
+        _build_risk_table(narrative.risk_register, styles, brand),
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -826,6 +1117,10 @@ def generate_pdf(
 ) -> Path:
     """Assemble and write the board report PDF.
 
+    Chart rasters are memoised in-process; with BRG_CHART_CACHE=1 they are
+    also kept in paths.chart_cache_dir and reused across runs until the
+    underlying metrics, palette or chart code change.
+
     Args:
         pkg: Computed metrics package.
         narrative: Generated narrative package.
@@ -834,8 +1129,7 @@ def generate_pdf(
     Returns:
         Path to the generated PDF file.
     """
-    with open(config_path, "r") as fh:
-        cfg = yaml.safe_load(fh)
+    cfg = load_config(config_path)
 
     global _BRAND
     _BRAND = cfg["report"]["brand"]
@@ -859,6 +1153,11 @@ def generate_pdf(
         rightMargin=MARGIN,
         topMargin=1.6 * cm,
         bottomMargin=1.8 * cm,
+        # Deflate page streams (the ReportLab default, pinned here) and omit
+        # the random document ID / build timestamp so identical inputs give
+        # identical files.
+        pageCompression=1,
+        invariant=1,
     )
 
     # Cover page: full bleed (no margins)
@@ -871,16 +1170,25 @@ def generate_pdf(
         PageTemplate(id="Content", frames=[content_frame], onPage=on_page),
     ])
 
-    story = []
-    story.append(NextPageTemplate("Cover"))
-    story += _page_cover(pkg, styles, brand)
-    story.append(NextPageTemplate("Content"))
-    story += _page_exec_summary(pkg, narrative, styles, brand)
-    story += _page_financial(pkg, narrative, styles, brand)
-    story += _page_commercial(pkg, narrative, styles, brand)
-    story += _page_customers(pkg, narrative, styles, brand)
-    story += _page_operational(pkg, narrative, styles, brand)
-    story += _page_outlook(narrative, styles, brand)
+    chart_cache_dir = None
+    if os.environ.get(_CHART_CACHE_ENV) == "1":
+        chart_cache_dir = Path(cfg["paths"]["chart_cache_dir"])
+        chart_cache_dir.mkdir(parents=True, exist_ok=True)
+
+    charts = _render_charts(pkg, brand, chart_cache_dir)
+    paras = _narrative_paragraphs(narrative, styles["body"])
+
+    story = [
+        NextPageTemplate("Cover"),
+        *_page_cover(pkg, styles, brand),
+        NextPageTemplate("Content"),
+        *_page_exec_summary(pkg, paras, styles, brand),
+        *_page_financial(pkg, paras, styles, brand, charts),
+        *_page_commercial(pkg, paras, styles, brand, charts),
+        *_page_customers(pkg, paras, styles, brand, charts),
+        *_page_operational(pkg, paras, styles, brand, charts),
+        *_page_outlook(narrative, paras, styles, brand),
+    ]
 
     doc.build(story)
     logger.info("PDF report saved to %s (%d pages)", output_path, 7)
@@ -0,0 +1,45 @@
+"""
+conftest.py — Shared pytest fixtures.
+
+The integration tests only read the computed packages, so the raw data check,
+metrics and narrative pipelines run once per test session rather than once
+per test. Tests opt in by naming the fixture they need.
+
+The repository root is put on sys.path here, once, so the test modules can
+import ``src`` however pytest is invoked.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(scope="session")
+def generated_data():
+    """Raw datasets directory, generated from config.yaml on first use if missing."""
+    raw_dir = Path("data/raw")
+    if not (raw_dir / "financials.csv").exists():
+        from src.data_simulator import generate_all_datasets
+        generate_all_datasets("config.yaml")
+    return raw_dir
+
+
+@pytest.fixture(scope="session")
+def metrics_pkg(generated_data):
+    """MetricsPackage computed once from config.yaml."""
+    from src.metrics import compute_metrics
+
+    return compute_metrics("config.yaml")
+
+
+@pytest.fixture(scope="session")
+def narrative_pkg(metrics_pkg):
+    """NarrativePackage generated once from the session MetricsPackage."""
+    from src.narrative import generate_narrative
+
+    return generate_narrative(metrics_pkg, "config.yaml")
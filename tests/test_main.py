@@ -0,0 +1,85 @@
+"""
+test_main.py — Tests for the CLI pipeline orchestration.
+
+Tests cover:
+    - Output stages (PDF, Excel, dashboard) run together through the
+      forked worker pool
+    - Serial fallback while other threads are alive, and failure reporting
+"""
+
+import logging
+import os
+import threading
+
+import yaml
+
+from main import _run_output_stages
+
+
+def _fail() -> None:
+    raise RuntimeError("stage failed")
+
+
+class TestRunOutputStages:
+    """End-to-end run of the output stages on the session packages."""
+
+    def test_all_output_stages_write_files(self, metrics_pkg, narrative_pkg, tmp_path):
+        from src.dashboard import generate_dashboard
+        from src.excel_pack import generate_excel_pack
+        from src.pdf_builder import generate_pdf
+
+        with open("config.yaml") as fh:
+            cfg = yaml.safe_load(fh)
+        cfg["paths"]["output_dir"] = str(tmp_path / "output")
+        config_path = str(tmp_path / "config.yaml")
+        with open(config_path, "w") as fh:
+            yaml.safe_dump(cfg, fh)
+
+        jobs = [
+            ("pdf", "STAGE 4: PDF Report", "PDF report",
+             generate_pdf, (metrics_pkg, narrative_pkg, config_path)),
+            ("excel", "STAGE 5: Excel Data Pack", "Excel data pack",
+             generate_excel_pack, (metrics_pkg, config_path)),
+            ("dashboard", "STAGE 6: Interactive Dashboard", "Dashboard",
+             generate_dashboard, (metrics_pkg, config_path)),
+        ]
+        outputs = _run_output_stages(jobs, logging.getLogger("test_main"))
+
+        assert outputs is not None
+        assert set(outputs) == {"pdf", "excel", "dashboard"}
+        for path in outputs.values():
+            assert path.exists() and path.stat().st_size > 0
+
+
+class TestRunOutputStagesFallback:
+    """Serial path: taken when other threads are alive (e.g. under the scheduler)."""
+
+    @staticmethod
+    def _run_with_background_thread(jobs):
+        stop = threading.Event()
+        worker = threading.Thread(target=stop.wait, daemon=True)
+        worker.start()
+        try:
+            return _run_output_stages(jobs, logging.getLogger("test_main"))
+        finally:
+            stop.set()
+            worker.join()
+
+    def test_runs_in_process_while_other_threads_are_alive(self):
+        jobs = [("a", "A", "Stage A", os.getpid, ()), ("b", "B", "Stage B", os.getpid, ())]
+
+        outputs = self._run_with_background_thread(jobs)
+
+        assert outputs == {"a": os.getpid(), "b": os.getpid()}
+
+    def test_failed_stage_does_not_skip_later_stages(self):
+        ran = []
+        jobs = [
+            ("a", "A", "Stage A", _fail, ()),
+            ("b", "B", "Stage B", ran.append, ("b",)),
+        ]
+
+        outputs = self._run_with_background_thread(jobs)
+
+        assert outputs is None
+        assert ran == ["b"]
@@ -8,14 +8,9 @@ Tests cover:
     - Metrics computation with real config
 """
 
-import sys
-from pathlib import Path
 from datetime import date
 
 import pandas as pd
-import pytest
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.metrics import (
     _rag_higher_is_better,
@@ -120,65 +115,52 @@ class TestRagLowerIsBetter:
 class TestComputeMetricsIntegration:
     """Integration tests that run the full metrics computation."""
 
-    @pytest.fixture(autouse=True)
-    def generate_data_once(self, tmp_path, monkeypatch):
-        """Generate datasets into a temp directory and patch config paths."""
-        from src.data_simulator import generate_all_datasets
-        # Only run if real data doesn't exist
-        config_path = "config.yaml"
-        raw_path = Path("data/raw/financials.csv")
-        if not raw_path.exists():
-            generate_all_datasets(config_path)
-
-    def test_compute_metrics_returns_metrics_package(self):
-        from src.metrics import compute_metrics, MetricsPackage
-        pkg = compute_metrics("config.yaml")
-        assert isinstance(pkg, MetricsPackage)
-
-    def test_period_is_set(self):
-        from src.metrics import compute_metrics
-        pkg = compute_metrics("config.yaml")
-        assert pkg.report_period is not None
-        assert len(pkg.report_period) == 7  # YYYY-MM
-
-    def test_revenue_is_positive(self):
-        from src.metrics import compute_metrics
-        pkg = compute_metrics("config.yaml")
-        assert pkg.financial.revenue_actual > 0
-
-    def test_ebitda_margin_in_reasonable_range(self):
-        from src.metrics import compute_metrics
-        pkg = compute_metrics("config.yaml")
-        margin = pkg.financial.ebitda_margin_pct_actual
+    def test_compute_metrics_returns_metrics_package(self, metrics_pkg):
+        from src.metrics import MetricsPackage
+        assert isinstance(metrics_pkg, MetricsPackage)
+
+    def test_period_is_set(self, metrics_pkg):
+        assert metrics_pkg.report_period is not None
+        assert len(metrics_pkg.report_period) == 7  # YYYY-MM
+
+    def test_revenue_is_positive(self, metrics_pkg):
+        assert metrics_pkg.financial.revenue_actual > 0
+
+    def test_ebitda_margin_in_reasonable_range(self, metrics_pkg):
+        margin = metrics_pkg.financial.ebitda_margin_pct_actual
         assert -0.5 <= margin <= 0.5, f"EBITDA margin {margin} outside reasonable range"
 
-    def test_rag_statuses_are_valid(self):
-        from src.metrics import compute_metrics
-        pkg = compute_metrics("config.yaml")
+    def test_rag_statuses_are_valid(self, metrics_pkg):
         valid = {"Green", "Amber", "Red"}
-        rag = pkg.rag
+        rag = metrics_pkg.rag
         for attr in ["revenue", "gross_margin", "ebitda_margin",
                      "pipeline_coverage", "win_rate", "churn_rate", "nps"]:
             status = getattr(rag, attr).status
             assert status in valid, f"RAG.{attr} = '{status}' not in {valid}"
 
-    def test_arr_is_positive(self):
-        from src.metrics import compute_metrics
-        pkg = compute_metrics("config.yaml")
-        assert pkg.customers.arr_actual > 0
-
-    def test_headcount_budget_positive(self):
-        from src.metrics import compute_metrics
-        pkg = compute_metrics("config.yaml")
-        assert pkg.headcount.total_hc_budget > 0
-
-    def test_pipeline_coverage_ratio_positive(self):
-        from src.metrics import compute_metrics
-        pkg = compute_metrics("config.yaml")
-        assert pkg.commercial.pipeline_coverage_ratio > 0
-
-    def test_monthly_trend_length(self):
-        from src.metrics import compute_metrics
-        pkg = compute_metrics("config.yaml")
-        assert len(pkg.financial.monthly_revenue) == 12
-        assert len(pkg.financial.monthly_periods) == 12
+    def test_arr_is_positive(self, metrics_pkg):
+        assert metrics_pkg.customers.arr_actual > 0
+
+    def test_headcount_budget_positive(self, metrics_pkg):
+        assert metrics_pkg.headcount.total_hc_budget > 0
+
+    def test_pipeline_coverage_ratio_positive(self, metrics_pkg):
+        assert metrics_pkg.commercial.pipeline_coverage_ratio > 0
+
+    def test_monthly_trend_length(self, metrics_pkg):
+        assert len(metrics_pkg.financial.monthly_revenue) == 12
+        assert len(metrics_pkg.financial.monthly_periods) == 12
+
+    def test_commercial_accepts_string_week_start(self, generated_data):
+        from src.config import load_config
+        from src.metrics import _calc_commercial, _load_datasets
+
+        cfg = load_config("config.yaml")
+        datasets = _load_datasets(cfg)
+        pipe = datasets["pipeline"]
+        raw = pipe.assign(week_start=pipe["week_start"].dt.strftime("%Y-%m-%d"))
+        raw = raw.iloc[::-1].reset_index(drop=True)  # unsorted, as a caller might pass it
+
+        parsed = _calc_commercial(pipe, datasets["financials"], cfg)
+        assert _calc_commercial(raw, datasets["financials"], cfg) == parsed
+        assert pipe["week_start"].dtype.kind == "M"  # shared frame left untouched
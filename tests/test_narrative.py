@@ -7,14 +7,7 @@ Tests cover:
     - Section content quality checks (not empty, contains key values)
 """
 
-import sys
-from pathlib import Path
-
-import pytest
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from src.narrative import _gbp, _pct, _pp, _above_below
+from src.narrative import _gbp, _pct, _pp, _above_below, _compile_template
 
 
 class TestFormattingHelpers:
@@ -70,80 +63,65 @@ class TestFormattingHelpers:
     def test_above_below_below(self):
         assert _above_below(90, 100) == "below"
 
+    def test_compiled_template_matches_str_format(self):
+        tmpl = 'Revenue of {rev:>8} ({pct}) — {{literal}} "quoted" {name!r}\n'
+        kwargs = dict(rev="£1.2M", pct="+3.0%", name="Q3")
+        assert _compile_template(tmpl)(**kwargs) == tmpl.format(**kwargs)
 
-class TestNarrativeGeneration:
-    """Integration tests for the full narrative pipeline."""
-
-    @pytest.fixture(autouse=True)
-    def ensure_data(self):
-        """Ensure datasets exist before running narrative tests."""
-        raw_path = Path("data/raw/financials.csv")
-        if not raw_path.exists():
-            from src.data_simulator import generate_all_datasets
-            generate_all_datasets("config.yaml")
-
-    def test_narrative_package_structure(self):
-        from src.metrics import compute_metrics
-        from src.narrative import generate_narrative, NarrativePackage
+    def test_compiled_template_nested_spec_matches_str_format(self):
+        tmpl = "[{name:{width}}] {name!s:>{width}}"
+        kwargs = dict(name="Q3", width=6)
+        assert _compile_template(tmpl)(**kwargs) == tmpl.format(**kwargs)
 
-        pkg = compute_metrics("config.yaml")
-        narrative = generate_narrative(pkg, "config.yaml")
 
-        assert isinstance(narrative, NarrativePackage)
+class TestNarrativeGeneration:
+    """Integration tests for the full narrative pipeline."""
 
-    def test_all_sections_non_empty(self):
-        from src.metrics import compute_metrics
-        from src.narrative import generate_narrative
+    def test_narrative_package_structure(self, narrative_pkg):
+        from src.narrative import NarrativePackage
 
-        pkg = compute_metrics("config.yaml")
-        narrative = generate_narrative(pkg, "config.yaml")
+        assert isinstance(narrative_pkg, NarrativePackage)
 
+    def test_all_sections_non_empty(self, narrative_pkg):
         for field in [
             "executive_summary", "financial_performance",
             "commercial_performance", "customer_metrics",
             "operational_metrics", "outlook_and_risks",
         ]:
-            value = getattr(narrative, field)
+            value = getattr(narrative_pkg, field)
             assert value, f"Narrative section '{field}' is empty"
             assert len(value) > 50, f"Section '{field}' is too short ({len(value)} chars)"
 
-    def test_executive_summary_contains_company_name(self):
-        from src.metrics import compute_metrics
-        from src.narrative import generate_narrative
-
-        pkg = compute_metrics("config.yaml")
-        narrative = generate_narrative(pkg, "config.yaml")
+    def test_executive_summary_contains_company_name(self, metrics_pkg, narrative_pkg):
+        assert metrics_pkg.company_name in narrative_pkg.executive_summary
 
-        assert pkg.company_name in narrative.executive_summary
+    def test_risk_register_has_entries(self, narrative_pkg):
+        assert isinstance(narrative_pkg.risk_register, tuple)
+        assert len(narrative_pkg.risk_register) >= 1
+        for risk in narrative_pkg.risk_register:
+            assert risk.risk
+            assert risk.rating
 
-    def test_risk_register_has_entries(self):
-        from src.metrics import compute_metrics
-        from src.narrative import generate_narrative
+    def test_package_survives_pickling(self, narrative_pkg):
+        # main.py hands the package to a forked worker for the PDF stage
+        import pickle
 
-        pkg = compute_metrics("config.yaml")
-        narrative = generate_narrative(pkg, "config.yaml")
+        restored = pickle.loads(pickle.dumps(narrative_pkg))
 
-        assert isinstance(narrative.risk_register, list)
-        assert len(narrative.risk_register) >= 1
-        for risk in narrative.risk_register:
-            assert "risk" in risk
-            assert "rating" in risk
-
-    def test_financial_section_contains_gbp_values(self):
-        from src.metrics import compute_metrics
-        from src.narrative import generate_narrative
-
-        pkg = compute_metrics("config.yaml")
-        narrative = generate_narrative(pkg, "config.yaml")
+        assert restored == narrative_pkg
 
+    def test_financial_section_contains_gbp_values(self, narrative_pkg):
         # Should contain pound signs (currency formatting worked)
-        assert "£" in narrative.financial_performance
+        assert "£" in narrative_pkg.financial_performance
+
+    def test_period_in_narrative(self, metrics_pkg, narrative_pkg):
+        assert metrics_pkg.report_period in narrative_pkg.executive_summary
 
-    def test_period_in_narrative(self):
-        from src.metrics import compute_metrics
-        from src.narrative import generate_narrative
+    def test_batch_matches_single_generation(self, metrics_pkg, narrative_pkg):
+        from src.narrative import generate_narratives
 
-        pkg = compute_metrics("config.yaml")
-        narrative = generate_narrative(pkg, "config.yaml")
+        batch = generate_narratives([metrics_pkg, metrics_pkg], "config.yaml")
 
-        assert pkg.report_period in narrative.executive_summary
+        assert batch == [narrative_pkg] * 2
+        # One frozen register, built per template load, shared by every package
+        assert batch[0].risk_register is batch[1].risk_register is narrative_pkg.risk_register